@@ -1,29 +1,69 @@
 # app/api/v1/analysis.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 from app.core.models import AnalyzeTextRequest, AnalysisResult, HealthCheckResponse
 from app.services.ml_service import MLService
+from app.services.windowing import window_config_from_settings
 from app.core.config import settings
+from app.core.logging_config import should_log_body, text_fields
+from typing import Optional
 import logging
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-try:
-    ml_service = MLService(model_path=settings.MODEL_PATH)
-    logger.info(f"AI 모델 로드 성공: {settings.MODEL_PATH}")
-except Exception as e:
-    logger.error(f"AI 모델 로드 실패: {e}")
+_ml_service: Optional[MLService] = None
+_ml_service_lock = threading.Lock()
+
+# 상대 경로의 MODEL_PATH 는 app 디렉토리 기준으로 해석합니다 (app/data/models/political_bias_model).
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _resolve_model_path(model_path: str) -> str:
+    return model_path if os.path.isabs(model_path) else os.path.join(_APP_DIR, model_path)
+
+
+def get_ml_service() -> MLService:
+    """
+    import 시점에 모델을 로드하면 앱 시작이 모델 로드만큼 늦어지므로, 첫 요청에서 한 번만 로드합니다.
+    동시에 들어온 첫 요청들이 모델을 중복 로드하지 않도록 잠금 안에서 만들고, 점수가 app/main.py 의 /analyze 와
+    같도록 같은 백엔드/윈도우 설정을 씁니다.
+    """
+    global _ml_service
+    if _ml_service is not None:
+        return _ml_service
+    with _ml_service_lock:
+        if _ml_service is None:
+            try:
+                _ml_service = MLService(
+                    model_path=_resolve_model_path(settings.MODEL_PATH),
+                    backend=settings.MODEL_BACKEND,
+                    onnx_path=settings.ONNX_MODEL_PATH or None,
+                    max_batch_tokens=settings.BATCH_MAX_TOKENS,
+                    window_config=window_config_from_settings(settings),
+                )
+                logger.info(f"AI 모델 로드 성공: {settings.MODEL_PATH}")
+            except Exception as e:
+                logger.error(f"AI 모델 로드 실패: {e}")
+                raise HTTPException(status_code=503, detail=f"AI 모델을 로드하지 못했습니다: {e}")
+    return _ml_service
 
 
 @router.post("/analyze", response_model=AnalysisResult)
-async def analyze_text(request: AnalyzeTextRequest):
+async def analyze_text(request: AnalyzeTextRequest, ml_service: MLService = Depends(get_ml_service)):
     """
     제공된 텍스트의 편향성을 분석합니다.
     """
     try:
-        analysis_result = ml_service.analyze_bias(request.text)
-        logger.info(f"텍스트 분석 완료: {request.text[:50]}...")
+        analysis_result = await run_in_threadpool(ml_service.analyze_bias, request.text)
+        # app/main.py 와 같이 본문은 LOG_BODY_SAMPLE_RATE 비율의 요청만 남기고, 나머지는 길이/해시만 기록합니다.
+        fields = text_fields(request.text)
+        if should_log_body(settings.LOG_BODY_SAMPLE_RATE):
+            fields["body"] = request.text[:settings.LOG_BODY_MAX_CHARS]
+        logger.info("텍스트 분석 완료", extra={"fields": fields})
         return AnalysisResult(**analysis_result)
     except Exception as e:
         logger.error(f"텍스트 분석 중 오류 발생: {e}")
@@ -8,6 +8,114 @@ class Settings(BaseSettings):
     
     MODEL_PATH: str = "data/models/political_bias_model"
 
+    # 추론 백엔드: "torch"(fp32), "torch_int8"(동적 INT8 양자화), "onnx"(onnxruntime)
+    MODEL_BACKEND: str = "torch"
+    # 비워 두면 <모델 경로>/onnx/model.onnx 를 사용
+    ONNX_MODEL_PATH: str = ""
+
+    # /analyze 마이크로 배칭 설정
+    BATCH_MAX_SIZE: int = 8
+    BATCH_MAX_WAIT_MS: float = 10.0
+    # 한 번의 forward 에 들어가는 (배치 크기 x 최장 토큰 길이) 상한
+    BATCH_MAX_TOKENS: int = 8192
+
+    # 긴 기사 슬라이딩 윈도우 추론 설정
+    WINDOW_MODE: bool = False
+    WINDOW_SIZE: int = 512
+    WINDOW_STRIDE: int = 384
+    WINDOW_MAX_COUNT: int = 8
+    WINDOW_POOLING: str = "mean"  # "mean" 또는 "length_weighted"
+    WINDOW_EARLY_STOP: bool = False
+    WINDOW_EARLY_STOP_CHUNK: int = 2
+    WINDOW_EARLY_STOP_TOLERANCE: float = 0.02
+    WINDOW_EARLY_STOP_CONFIDENCE: float = 0.9
+
+    # 멀티 워커 서빙 설정 (scripts/serve.py). TORCH_NUM_THREADS 가 0 이면
+    # 코어 수 / (SERVE_WORKERS * INFERENCE_WORKERS) 로 자동 설정합니다.
+    SERVE_WORKERS: int = 1
+    SERVE_PRELOAD: bool = True  # fp32 torch 백엔드에서만 적용 (onnx, torch_int8 은 워커마다 로드)
+    TORCH_NUM_THREADS: int = 0
+    TORCH_INTEROP_THREADS: int = 1
+
+    # 로컬 모델 레지스트리. <경로>/<버전>/ 에 모델을, <경로>/CURRENT 에 서빙할 버전을 둡니다 (scripts/model_registry.py).
+    # 비워 두면 MODEL_PATH 하나만 서빙합니다. MODEL_REGISTRY_POLL_SECONDS 가 0 보다 크면 CURRENT 를 감시해 자동으로 교체하고,
+    # POST /admin/model/swap 으로도 교체할 수 있습니다 (X-Admin-Token 헤더가 ADMIN_TOKEN 과 같아야 하며, 비워 두면 관리자 API 를 끕니다).
+    MODEL_REGISTRY_PATH: str = ""
+    MODEL_REGISTRY_POLL_SECONDS: float = 0.0
+    ADMIN_TOKEN: str = ""
+
+    # 추론 실행기 설정 ("thread" 또는 "process"). 기사/문단/문장 근거 배처는 실행 슬롯 INFERENCE_WORKERS 개를 함께 나눠 쓰고,
+    # 대기열은 배처마다 따로 둡니다. 실행기 앞에 쌓일 수 있는 요청은 모두 합쳐
+    # INFERENCE_MAX_QUEUE(기사) + PARAGRAPH_MAX_QUEUE(문단) + ATTRIBUTION_MAX_QUEUE(기사별 문장 목록) 건입니다.
+    INFERENCE_EXECUTOR: str = "thread"
+    INFERENCE_WORKERS: int = 1
+    INFERENCE_MAX_QUEUE: int = 64
+    INFERENCE_RETRY_AFTER_SECONDS: int = 1
+
+    # /analyze 마감 시간 기반 승인 제어. 요청의 deadline_ms (없으면 ANALYZE_DEADLINE_MS) 안에 편향 점수를 낼 수 없다고
+    # 예상되거나 실제로 넘기면, 모델 추론 대신 신뢰도 규칙 결과만 bias_status="deferred" 로 돌려줍니다. 0 이면 마감 없음.
+    ANALYZE_DEADLINE_MS: float = 0.0
+    ADMISSION_EWMA_ALPHA: float = 0.2  # 배치 실행 시간 추정의 지수 이동 평균 계수
+
+    # 2단계 캐스케이드. 켜면 해시 문자 n-gram 선형 모델(scripts/train_cascade.py)이 먼저 답하고, 최대 확률이
+    # CASCADE_THRESHOLD 보다 낮은 기사만 RoBERTa 로 넘깁니다. 비워 두면 data/models/bias_cascade.npz 을 사용하며,
+    # 파일이 없으면 캐스케이드를 끕니다. INCREMENTAL_MODE 의 문단 추론에는 적용되지 않습니다.
+    CASCADE_MODE: bool = False
+    CASCADE_MODEL_PATH: str = ""
+    CASCADE_THRESHOLD: float = 0.9
+
+    # /analyze 결과 캐시 설정 (RESULT_CACHE_DISK_PATH 를 지정하면 SQLite 디스크 계층 사용)
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_ENTRIES: int = 1024
+    RESULT_CACHE_TTL_SECONDS: float = 3600.0
+    RESULT_CACHE_DISK_PATH: str = ""
+
+    # 문단 단위 증분 분석. 켜면 기사를 문단으로 나눠 문단별 로짓과 신뢰도 규칙 매칭을 캐시하고,
+    # 재전송/수정된 기사에서는 새로 생기거나 바뀐 문단만 다시 추론합니다. 기사 점수는 문단 로짓의 토큰 가중 평균입니다.
+    INCREMENTAL_MODE: bool = False
+    PARAGRAPH_MIN_CHARS: int = 40  # 이보다 짧은 줄은 다음 줄과 합쳐 한 문단으로 다룹니다
+    PARAGRAPH_CACHE_MAX_ENTRIES: int = 16384
+    PARAGRAPH_CACHE_DISK_PATH: str = ""
+    PARAGRAPH_MAX_QUEUE: int = 64  # 문단 배처 대기열 한도 (/analyze/stream 과 INCREMENTAL_MODE 공용, 문단 단위)
+
+    # 문장 단위 편향 근거. 요청에 attribution=true 를 주면 기사 앞쪽 ATTRIBUTION_MAX_SENTENCES 개 문장을
+    # ATTRIBUTION_MAX_TOKENS 에서 잘라 한 번의 배치 추론으로 점수화하고, 편향이 가장 강한 문장 ATTRIBUTION_TOP_K 개를 돌려줍니다.
+    ATTRIBUTION_TOP_K: int = 5
+    ATTRIBUTION_MAX_SENTENCES: int = 128
+    ATTRIBUTION_MAX_TOKENS: int = 128
+    ATTRIBUTION_MIN_CHARS: int = 10  # 이보다 짧은 문장(사진 설명, 기자 이름 등)은 후보에서 뺍니다
+    ATTRIBUTION_MAX_QUEUE: int = 8  # 문장 근거 배처 대기열 한도 (기사 단위). 넘으면 근거 없이 응답합니다
+
+    # KoBART 요약 작업 큐. /analyze 는 작업 ID 만 돌려주고 요약은 별도 실행기에서 배치로 생성합니다.
+    # SUMMARY_MODEL_PATH 를 비워 두면 data/models/kobart_summarization_model 을 사용하며, 경로가 없으면 요약을 끕니다.
+    SUMMARY_ENABLED: bool = True
+    SUMMARY_MODEL_PATH: str = ""
+    SUMMARY_EXECUTOR: str = "thread"  # "thread" 또는 "process"
+    SUMMARY_WORKERS: int = 1
+    SUMMARY_TORCH_THREADS: int = 1  # process 실행기일 때 요약 워커별 torch 스레드 수
+    SUMMARY_BATCH_MAX_SIZE: int = 4
+    SUMMARY_BATCH_MAX_WAIT_MS: float = 50.0
+    SUMMARY_MAX_QUEUE: int = 32  # 대기 중 + 실행 중인 요약 작업 수 한도. 넘으면 summary_job_id 없이 응답합니다
+    SUMMARY_MAX_INPUT_LENGTH: int = 1024
+    SUMMARY_MAX_NEW_TOKENS: int = 128
+    SUMMARY_NUM_BEAMS: int = 4
+    SUMMARY_JOB_MAX_ENTRIES: int = 1024
+    SUMMARY_JOB_TTL_SECONDS: float = 3600.0
+    # 켜면 요청의 callback_url 로 끝난 요약을 POST 합니다 (외부 URL 호출이므로 기본은 꺼 둡니다).
+    SUMMARY_CALLBACKS_ENABLED: bool = False
+
+    # POST /analyze/batch 설정
+    BATCH_ENDPOINT_MAX_ARTICLES: int = 100
+    BATCH_ENDPOINT_CONCURRENCY: int = 16
+
+    # 로깅. 레코드는 큐에 넣고 별도 스레드에서 stdout 으로 씁니다. 기사 본문 대신 길이/해시를 남기고,
+    # LOG_BODY_SAMPLE_RATE 비율(0~1)의 요청만 본문 앞부분(LOG_BODY_MAX_CHARS)을 함께 남깁니다.
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # "json" 또는 "text"
+    LOG_QUEUE_SIZE: int = 10000  # 가득 차면 요청을 막지 않고 레코드를 버립니다
+    LOG_BODY_SAMPLE_RATE: float = 0.0
+    LOG_BODY_MAX_CHARS: int = 1000
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 settings = Settings()
\ No newline at end of file
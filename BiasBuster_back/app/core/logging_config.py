@@ -0,0 +1,118 @@
+# app/core/logging_config.py
+import contextvars
+import hashlib
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import uuid
+from typing import Any, Dict, Optional
+
+# 요청 처리 중인 코루틴/스레드에서 로그 레코드에 붙일 요청 ID. 미들웨어가 요청마다 설정합니다.
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+_state: Dict[str, Any] = {"pid": None, "listener": None, "handler": None}
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    로그 레코드를 큐에 넣기만 하고 바로 반환합니다. 실제 출력은 QueueListener 스레드가 합니다.
+    큐가 가득 차면 요청 처리를 막지 않도록 레코드를 버리고 개수만 셉니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 호출한 요청의 컨텍스트에서 요청 ID 를 읽어야 하므로 큐에 넣기 전에 붙입니다.
+        record.request_id = request_id_var.get()
+        return super().prepare(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나. extra={"fields": {...}} 로 넘긴 값은 최상위 키로 들어갑니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            payload["request_id"] = record.request_id
+        payload.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        fields = getattr(record, "fields", None) or {}
+        extras = " ".join(f"{k}={v}" for k, v in fields.items())
+        return " ".join(part for part in (line, f"[{request_id}]" if request_id else "", extras) if part)
+
+
+def setup_logging(level: str = "INFO", fmt: str = "json", queue_size: int = 10000) -> None:
+    """
+    루트 로거에 큐 핸들러를 달고, 출력은 별도 스레드(QueueListener)에서 stdout 으로 합니다.
+    fork 된 워커에는 리스너 스레드가 따라오지 않으므로 프로세스마다(startup 에서) 한 번씩 호출합니다.
+    """
+    if _state["pid"] == os.getpid():
+        return
+    root = logging.getLogger()
+    if _state["handler"] is not None:
+        root.removeHandler(_state["handler"])
+
+    stream = logging.StreamHandler(sys.stdout)
+    if fmt == "json":
+        stream.setFormatter(JsonFormatter())
+    else:
+        stream.setFormatter(TextFormatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    log_queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 0))
+    handler = DroppingQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=False)
+    listener.start()
+
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+    _state.update(pid=os.getpid(), listener=listener, handler=handler)
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 출력하고 리스너 스레드를 멈춥니다."""
+    if _state["listener"] is not None and _state["pid"] == os.getpid():
+        _state["listener"].stop()
+        logging.getLogger().removeHandler(_state["handler"])
+        _state.update(pid=None, listener=None, handler=None)
+
+
+def dropped_records() -> int:
+    handler = _state["handler"]
+    return handler.dropped if handler is not None else 0
+
+
+def text_fields(text: str) -> Dict[str, Any]:
+    """본문 대신 길이와 해시만 남겨 같은 기사를 추적할 수 있게 합니다."""
+    return {"text_len": len(text), "text_sha256": hashlib.sha256(text.encode("utf8")).hexdigest()[:16]}
+
+
+def should_log_body(sample_rate: float) -> bool:
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
@@ -1,30 +1,123 @@
 # python -m uvicorn --app-dir app main:app --reload --host 0.0.0.0 --port 8001
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from starlette.concurrency import run_in_threadpool
+from typing import List, Dict, Any, Optional
+import asyncio
+import hmac
+import json
+import logging
+import math
 import os
+import time
 import torch
-import re 
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
 
-political_bias_model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'models', 'political_bias_model')
+from core.config import settings
+from core.logging_config import (
+    dropped_records, new_request_id, request_id_var, setup_logging, should_log_body, shutdown_logging, text_fields,
+)
+from services.admission import AdmissionRejected, LatencyEstimator, deadline_after, remaining_ms
+from services.attribution import split_sentences, top_polarized
+from services.backends import default_onnx_path
+from services.batching import BatchSlots, MicroBatcher, QueueFullError
+from services.cascade import LinearPreClassifier
+from services.executor import InferenceExecutor
+from services.metrics import BatchTrace, MetricsRegistry, token_length_bucket
+from services.ml_service import MLService, label_name
+from services.model_registry import ModelRegistry
+from services.paragraphs import Paragraph, offset_matches, pool_paragraph_probabilities, split_paragraphs
+from services.result_cache import ResultCache, model_fingerprint
+from services.runtime import configure_torch_threads, resolve_num_threads
+from services.summarization import Summarizer, SummaryJobQueue, post_callback
+from services.trust_rules import RULES_VERSION, default_engine as trust_engine
+from services.tokenization import MAX_LENGTH
+from services.windowing import window_config_from_settings
+
+logger = logging.getLogger(__name__)
+
+BUNDLED_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'models', 'political_bias_model')
+political_bias_model_path = BUNDLED_MODEL_PATH
 
-bias_tokenizer = None
-bias_model = None
+# MODEL_REGISTRY_PATH 가 있으면 레지스트리의 CURRENT 버전을 서빙하고, 실행 중에도 다른 버전으로 교체할 수 있습니다.
+# 서빙할 경로는 import 시점이 아니라 startup 에서 resolve_model_path 로 정합니다.
+model_registry: Optional[ModelRegistry] = ModelRegistry(settings.MODEL_REGISTRY_PATH) if settings.MODEL_REGISTRY_PATH else None
 
-SUMMARIZATION_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'models', 'kobart_summarization_model')
-summarizer_pipeline = None
+# 정치 편향 추론 엔진 (토크나이저 + 모델). /api/v1 라우터와 같은 MLService 를 씁니다.
+bias_engine: Optional[MLService] = None
 
-LABEL_MAP = {
-    0: "좌파/진보",
-    1: "중도",
-    2: "우파/보수"
-}
+CASCADE_MODEL_PATH = settings.CASCADE_MODEL_PATH or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'models', 'bias_cascade.npz')
+# CASCADE_MODE 의 1단계 선형 분류기. 메인 프로세스에서 이벤트 루프 안에 바로 실행됩니다 (기사당 1ms 미만).
+cascade_model: Optional[LinearPreClassifier] = None
+
+SUMMARIZATION_MODEL_PATH = settings.SUMMARY_MODEL_PATH or os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'models', 'kobart_summarization_model')
+# KoBART 요약 모델. 서버 시작 시가 아니라 첫 요약 작업을 처리할 때 요약 실행기 안에서 로드됩니다.
+summarizer = Summarizer(
+    SUMMARIZATION_MODEL_PATH,
+    max_input_length=settings.SUMMARY_MAX_INPUT_LENGTH,
+    max_new_tokens=settings.SUMMARY_MAX_NEW_TOKENS,
+    num_beams=settings.SUMMARY_NUM_BEAMS,
+)
 
 app = FastAPI()
 
+# 단계별 지연 시간과 요청 수를 모아 /metrics 에서 Prometheus 텍스트 형식으로 내보냅니다.
+metrics = MetricsRegistry()
+metrics.histogram("stage_duration_seconds", "분석 단계별 소요 시간 (stage, 입력 토큰 길이 구간별)")
+metrics.histogram("http_request_duration_seconds", "HTTP 요청 처리 시간 (스트리밍 응답은 헤더 전송까지)")
+metrics.counter("http_requests_total", "HTTP 요청 수")
+metrics.counter("http_request_errors_total", "5xx 응답 또는 처리 중 예외가 난 HTTP 요청 수")
+metrics.counter("analysis_errors_total", "분석 단계에서 오류 결과로 대체된 횟수")
+metrics.counter("paragraphs_total", "증분 분석에서 캐시를 재사용했거나 다시 계산한 문단 수")
+metrics.counter("admission_total", "마감 시간이 있는 요청의 승인 결과 (admitted, shed_estimate, shed_queue_full, timed_out)")
+metrics.counter("degraded_results_total", "모델 점수 없이 신뢰도 규칙 결과만 반환한 요청 수")
+metrics.counter("model_swaps_total", "모델 버전 교체 시도 결과 (success, failed)")
+metrics.counter("cascade_total", "캐스케이드 1단계 결과 (accepted: 선형 모델로 응답, escalated: transformer 로 넘김)")
+metrics.counter("result_cache_events_total", "결과 캐시 누적 이벤트 수 (적중/미스/제거 등)")
+metrics.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+metrics.gauge("model_info", "로드된 모델 백엔드와 추론 설정")
+metrics.gauge("model_ready", "모델 로드와 워밍업이 끝났으면 1")
+metrics.gauge("model_version_info", "서빙 중인 정치 편향 모델 버전")
+metrics.gauge("batch_queue_depth", "마이크로 배처 대기열 길이")
+metrics.gauge("batch_inflight", "실행 중인 추론 배치 수")
+metrics.gauge("summary_jobs", "보관 중인 요약 작업 수 (상태별)")
+metrics.gauge("log_records_dropped", "로그 큐가 가득 차 버린 로그 레코드 누적 수")
+metrics.set("http_requests_in_flight", 0)
+metrics.set("model_info", 1, {
+    "backend": settings.MODEL_BACKEND,
+    "executor": settings.INFERENCE_EXECUTOR,
+    "workers": str(settings.INFERENCE_WORKERS),
+    "window_mode": str(settings.WINDOW_MODE).lower(),
+    "incremental_mode": str(settings.INCREMENTAL_MODE).lower(),
+    "cascade_mode": str(settings.CASCADE_MODE).lower(),
+})
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    # 요청 처리 중 남기는 로그 레코드에 같은 요청 ID 가 붙도록 컨텍스트에 넣고, 응답 헤더로도 돌려줍니다.
+    request_id = (request.headers.get("x-request-id") or "")[:64] or new_request_id()
+    request_id_token = request_id_var.set(request_id)
+    metrics.add("http_requests_in_flight", 1)
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        response.headers["X-Request-ID"] = request_id
+        return response
+    finally:
+        request_id_var.reset(request_id_token)
+        metrics.add("http_requests_in_flight", -1)
+        # 경로 파라미터가 생겨도 시계열이 늘어나지 않도록 실제 URL 대신 라우트 템플릿을 라벨로 씁니다.
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        metrics.observe("http_request_duration_seconds", time.perf_counter() - started, {"path": path})
+        metrics.inc("http_requests_total", {"method": request.method, "path": path, "status": str(status)})
+        if status >= 500:
+            metrics.inc("http_request_errors_total", {"path": path})
+
 
 origins = [
     "http://localhost:8001",
@@ -42,6 +135,10 @@ app.add_middleware(
 
 class ArticleRequest(BaseModel):
     text: str
+    summarize: bool = True # False 면 요약 작업을 만들지 않습니다
+    callback_url: Optional[str] = None # 요약이 끝나면 결과를 POST 받을 URL (SUMMARY_CALLBACKS_ENABLED 일 때만)
+    deadline_ms: Optional[float] = None # 응답 지연 예산. 없으면 ANALYZE_DEADLINE_MS, 0 이면 마감 없음
+    attribution: bool = False # True 면 편향이 가장 강한 문장들(sentences)을 함께 돌려줍니다
 
 class AnalysisScore(BaseModel):
     category: str  # 예: "보수", "진보", "중립"
@@ -51,142 +148,1036 @@ class SuspiciousPoint(BaseModel):
     reason: str # 의심스러운 이유 (예: "인용 출처 불분명")
     phrase: str # 기사에서 탐지된 실제 문구
     note: str   # 해당 패턴에 대한 설명
+    start: Optional[int] = None # 기사 본문에서 문구가 시작하는 문자 위치
+    end: Optional[int] = None   # 기사 본문에서 문구가 끝나는 문자 위치
+
+class ParagraphStats(BaseModel):
+    total: int      # 기사에서 나눈 문단 수
+    reused: int     # 캐시된 결과를 재사용한 문단 수
+    recomputed: int # 새로 추론/규칙 검사한 문단 수
+
+class SentenceAttribution(BaseModel):
+    text: str       # 문장 본문
+    start: int      # 기사 본문에서 문장이 시작하는 문자 위치
+    end: int        # 기사 본문에서 문장이 끝나는 문자 위치
+    category: str   # 문장이 기운 쪽 ("좌파/진보" 또는 "우파/보수")
+    score: float    # 그 쪽의 확률
+    probabilities: List[AnalysisScore] # 문장의 라벨별 확률
 
 class AnalysisResult(BaseModel):
     summary: str # 분석 결과에 대한 요약 문자열
     scores: List[AnalysisScore] # 카테고리별 편향 점수 리스트
     trust_issues: List[SuspiciousPoint] # 신뢰도 분석 결과 리스트 
+    paragraphs: Optional[ParagraphStats] = None # 증분 분석(INCREMENTAL_MODE)일 때만 채워집니다
+    summary_job_id: Optional[str] = None # 본문 요약 작업 ID. GET /summaries/{id} 로 결과를 조회합니다
+    bias_status: str = "ok" # "deferred" 면 마감 시간 안에 모델 점수를 낼 수 없어 scores 가 비어 있습니다
+    bias_model: Optional[str] = None # 점수를 낸 모델. "linear" 면 캐스케이드 1단계, "transformer" 면 RoBERTa
+    model_version: Optional[str] = None # 점수를 낸 transformer 모델 버전 (레지스트리 버전 이름 또는 모델 지문)
+    sentences: Optional[List[SentenceAttribution]] = None # attribution 요청 시 편향이 강한 순서의 문장 top-k
+
+class SummaryJobResult(BaseModel):
+    job_id: str
+    status: str # queued, running, done, failed
+    summary: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float
+    finished_at: Optional[float] = None
+
+class ModelSwapRequest(BaseModel):
+    version: Optional[str] = None # 교체할 레지스트리 버전. 없으면 CURRENT 에 적힌 버전
+
+class BatchArticle(BaseModel):
+    id: str   # 클라이언트가 결과를 매칭하기 위해 붙이는 식별자
+    text: str
+
+class BatchArticleRequest(BaseModel):
+    articles: List[BatchArticle]
+
+class BatchItemResult(BaseModel):
+    id: str
+    index: int # 요청 articles 리스트에서의 위치
+    ok: bool
+    result: Optional[AnalysisResult] = None
+    error: Optional[str] = None
+
+def model_version_for(model_path: str) -> str:
+    """레지스트리의 버전 디렉토리면 버전 이름을, 아니면 모델 지문을 버전으로 씁니다."""
+    version = model_registry.version_of(model_path) if model_registry is not None else None
+    return version or model_fingerprint(model_path, onnx_path=serving_onnx_path(model_path))
+
+def serving_onnx_path(model_path: str) -> Optional[str]:
+    """onnx 백엔드일 때 실제로 로드되는 ONNX 파일 경로. 모델 지문에 넣어 다시 내보내면 캐시가 갈리게 합니다."""
+    if settings.MODEL_BACKEND != "onnx":
+        return None
+    return settings.ONNX_MODEL_PATH or default_onnx_path(model_path)
+
+def build_bias_engine(model_path: str) -> MLService:
+    return MLService(
+        model_path,
+        backend=settings.MODEL_BACKEND,
+        onnx_path=settings.ONNX_MODEL_PATH or None,
+        max_length=MAX_LENGTH,
+        max_batch_tokens=settings.BATCH_MAX_TOKENS,
+        window_config=window_config,
+        version=model_version_for(model_path),
+    )
+
+def load_bias_model(model_path: str) -> Dict[str, float]:
+    """
+    정치 편향 추론 엔진을 현재 프로세스의 전역 변수로 로드하고, 단계별 소요 시간(ms)을 반환합니다.
+    """
+    global bias_engine
+    bias_engine = build_bias_engine(model_path)
+    return bias_engine.load_phases_ms
+
+def configure_inference_threads() -> Dict[str, int]:
+    """
+    서빙 워커 수와 추론 워커 수를 곱한 만큼 코어를 나눠 torch 스레드 수를 설정합니다.
+    """
+    num_threads = resolve_num_threads(settings.TORCH_NUM_THREADS, settings.SERVE_WORKERS * settings.INFERENCE_WORKERS)
+    return configure_torch_threads(num_threads, settings.TORCH_INTEROP_THREADS)
+
+def _init_inference_worker(model_path: str) -> None:
+    """process 실행기의 각 워커 프로세스에서 한 번 실행되어 모델을 로드합니다."""
+    configure_inference_threads()
+    if bias_engine is None:
+        load_bias_model(model_path)
+
+def create_inference_executor(model_path: str) -> InferenceExecutor:
+    """process 실행기는 워커마다 model_path 의 모델을 로드하고, thread 실행기는 메인 프로세스의 bias_engine 을 씁니다."""
+    return InferenceExecutor(
+        kind=settings.INFERENCE_EXECUTOR,
+        max_workers=settings.INFERENCE_WORKERS,
+        initializer=_init_inference_worker if settings.INFERENCE_EXECUTOR == "process" else None,
+        initargs=(model_path,) if settings.INFERENCE_EXECUTOR == "process" else (),
+    )
+
+# 모델 준비 상태 ("loading" -> "ready" 또는 "failed"). /health/ready 와 /analyze 가 참조합니다.
+model_state: Dict[str, Any] = {"status": "loading", "error": None, "phases_ms": {}, "version": None, "registry_error": None}
+_model_loader_task: Optional[asyncio.Task] = None
+
+# 실행 중 모델 교체 상태 ("idle", "loading", "failed"). 교체는 한 번에 하나만 진행합니다.
+model_swap_state: Dict[str, Any] = {"status": "idle", "target": None, "error": None, "last_swap_ms": None}
+_model_swap_task: Optional[asyncio.Task] = None
+_registry_watch_task: Optional[asyncio.Task] = None
+
+WARMUP_TEXT = "정부는 오늘 국회에서 내년도 예산안을 발표했다."
+
+def resolve_model_path() -> str:
+    """
+    레지스트리의 CURRENT 버전을 서빙 경로로 정합니다. --model-path 등으로 경로를 직접 지정했으면 그대로 둡니다.
+    CURRENT 가 없는 버전이거나(오타, 복사 중) 이름이 잘못되었으면 가장 최근 버전, 그것도 없으면 기본 모델로 대체하고
+    그 사유를 /health/ready 의 registry_error 로 알립니다.
+    """
+    global political_bias_model_path
+    if model_registry is None or political_bias_model_path != BUNDLED_MODEL_PATH:
+        return political_bias_model_path
+    current = None
+    try:
+        current = model_registry.current()
+        if current is not None:
+            political_bias_model_path = model_registry.path(current)
+        return political_bias_model_path
+    except (KeyError, ValueError, OSError) as e:
+        versions = model_registry.versions()
+        fallback = versions[-1] if versions else None
+        model_state["registry_error"] = f"CURRENT 버전({current})을 쓸 수 없어 {fallback or '기본 모델'}(으)로 대체했습니다: {e.args[0] if e.args else e}"
+        logger.error(model_state["registry_error"])
+    if fallback is not None:
+        political_bias_model_path = model_registry.path(fallback)
+    return political_bias_model_path
+
+def _record_phase(name: str, elapsed_ms: float) -> None:
+    model_state["phases_ms"][name] = round(elapsed_ms, 1)
+    logger.info(f"[startup] {name}: {elapsed_ms:.1f}ms", extra={"fields": {"phase": name, "elapsed_ms": round(elapsed_ms, 1)}})
 
 @app.on_event("startup")
 async def load_ai_models():
-    global bias_tokenizer, bias_model, summarizer_pipeline
-    print("AI 모델 및 토크나이저 로드 중...")
+    """
+    실행기와 배처만 띄우고 바로 반환해 서버가 즉시 헬스 체크를 받을 수 있게 합니다.
+    모델 로드와 워밍업은 백그라운드 태스크에서 진행되며, 끝나야 /health/ready 가 200 을 돌려줍니다.
+    """
+    global inference_executor, _model_loader_task
+    started = time.perf_counter()
+    # fork 된 워커(scripts/serve.py)에는 로그 리스너 스레드가 없으므로 프로세스마다 여기서 설정합니다.
+    setup_logging(settings.LOG_LEVEL, settings.LOG_FORMAT, settings.LOG_QUEUE_SIZE)
+    if settings.INFERENCE_EXECUTOR != "process":
+        threads = configure_inference_threads()
+        logger.info(f"torch 스레드 설정: intra-op {threads['intra_op']}, inter-op {threads['interop']}")
+    resolve_model_path()
+    inference_executor = create_inference_executor(political_bias_model_path)
+    inference_executor.start()
+    await bias_batcher.start()
+    await paragraph_batcher.start()
+    await attribution_batcher.start()
+    await start_summary_jobs()
+    _model_loader_task = asyncio.create_task(_load_and_warm_up())
+    _record_phase("server_start", (time.perf_counter() - started) * 1000.0)
+
+async def _load_and_warm_up():
+    global _registry_watch_task
+    logger.info("AI 모델 및 토크나이저 로드 중...")
+    total_started = time.perf_counter()
     try:
-        if not os.path.exists(political_bias_model_path):
-            raise FileNotFoundError(f"정치 편향 모델 경로를 찾을 수 없습니다: {political_bias_model_path}")
+        if settings.INFERENCE_EXECUTOR == "process":
+            # 워커 프로세스가 각자 모델을 로드하므로 메인 프로세스는 경로만 확인합니다.
+            if not os.path.exists(political_bias_model_path):
+                raise FileNotFoundError(f"정치 편향 모델 경로를 찾을 수 없습니다: {political_bias_model_path}")
+        elif bias_engine is not None:
+            # scripts/serve.py 가 fork 전에 마스터에서 미리 로드한 모델을 그대로 씁니다.
+            logger.info("fork 전에 미리 로드된 모델을 사용합니다.")
+        else:
+            # 이벤트 루프를 막지 않도록 스레드에서 로드합니다. safetensors 가중치는 mmap 으로 읽힙니다.
+            phases = await asyncio.to_thread(load_bias_model, political_bias_model_path)
+            for name, elapsed_ms in phases.items():
+                _record_phase(name, elapsed_ms)
+        logger.info(f"정치 편향 분석 모델 로드 완료. (백엔드: {settings.MODEL_BACKEND})")
+
+        # 첫 forward 는 메모리 할당 등으로 느리므로 트래픽을 받기 전에 워커마다 한 번씩 실행해 둡니다.
+        # process 실행기에서는 이 단계에서 워커 프로세스가 시작되며 모델을 로드합니다.
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            inference_executor.run(get_bias_scores_batch, [WARMUP_TEXT])
+            for _ in range(settings.INFERENCE_WORKERS)
+        ])
+        _record_phase("warmup", (time.perf_counter() - started) * 1000.0)
+
+        if settings.CASCADE_MODE:
+            await load_cascade_model()
 
-        bias_tokenizer = AutoTokenizer.from_pretrained(political_bias_model_path)
-        bias_model = AutoModelForSequenceClassification.from_pretrained(political_bias_model_path)
-        bias_model.eval() 
-        print("정치 편향 분석 모델 로드 완료.")
+        model_state["version"] = bias_engine.version if bias_engine is not None else await asyncio.to_thread(model_version_for, political_bias_model_path)
+        await refresh_cache_namespaces()
+
+        model_state["status"] = "ready"
+        _record_phase("ready_total", (time.perf_counter() - total_started) * 1000.0)
+
+    except Exception as e:
+        model_state["status"] = "failed"
+        model_state["error"] = str(e)
+        logger.error(f"AI 모델 로드 실패: {e}. 'train_model.py' 실행 및 모델 저장 경로를 확인하세요.")
+        return
+
+    if model_registry is not None and settings.MODEL_REGISTRY_POLL_SECONDS > 0:
+        _registry_watch_task = asyncio.create_task(watch_model_registry())
+
+async def refresh_cache_namespaces() -> None:
+    """
+    모델 가중치나 결과에 영향을 주는 추론 설정이 바뀌면 이전 캐시 항목을 쓰지 않도록 키에 반영합니다.
+    모델을 교체할 때도 다시 호출되어 새 버전의 결과가 이전 버전의 캐시와 섞이지 않게 합니다.
+    """
+    version = model_state["version"]
+    if result_cache is not None:
+        result_cache.namespace = await asyncio.to_thread(
+            model_fingerprint,
+            political_bias_model_path,
+            [version, MAX_LENGTH, repr(window_config), RULES_VERSION, settings.MODEL_BACKEND, cascade_fingerprint()],
+            serving_onnx_path(political_bias_model_path),
+        )
+    if paragraph_cache is not None:
+        paragraph_cache.namespace = await asyncio.to_thread(
+            model_fingerprint,
+            political_bias_model_path,
+            ["paragraph", version, MAX_LENGTH, RULES_VERSION, settings.MODEL_BACKEND],
+            serving_onnx_path(political_bias_model_path),
+        )
 
+async def swap_model(version: str) -> None:
+    """
+    레지스트리의 version 을 백그라운드에서 로드하고 워밍업한 뒤 서빙 모델을 교체합니다.
+    thread 실행기는 새 MLService 를 만들어 bias_engine 을 바꾸고, process 실행기는 새 버전을 로드한 실행기를 새로 띄워
+    바꿉니다. 이미 실행 중인 배치는 시작할 때 잡은 이전 모델로 끝나고, 대기열의 요청은 교체 후 새 모델로 처리됩니다.
+    교체 중에는 두 버전이 함께 메모리에 올라가 있습니다.
+    """
+    global bias_engine, inference_executor, political_bias_model_path
+    model_swap_state.update(status="loading", target=version, error=None)
+    started = time.perf_counter()
+    previous_executor: Optional[InferenceExecutor] = None
+    try:
+        model_path = model_registry.path(version)
+        if settings.INFERENCE_EXECUTOR == "process":
+            executor = create_inference_executor(model_path)
+            executor.start()
+            try:
+                await asyncio.gather(*[
+                    executor.run(get_bias_scores_batch, [WARMUP_TEXT])
+                    for _ in range(settings.INFERENCE_WORKERS)
+                ])
+            except BaseException:
+                executor.shutdown()
+                raise
+            previous_executor, inference_executor = inference_executor, executor
+            political_bias_model_path = model_path
+        else:
+            engine = await asyncio.to_thread(build_bias_engine, model_path)
+            await asyncio.to_thread(engine.predict_proba_batch, [WARMUP_TEXT])
+            bias_engine = engine
+            political_bias_model_path = model_path
+        previous_version, model_state["version"] = model_state["version"], version
+        await refresh_cache_namespaces()
+        if previous_executor is not None:
+            # 이전 실행기에 이미 넘어간 배치가 끝날 때까지 기다린 뒤 워커 프로세스를 정리합니다.
+            await asyncio.to_thread(previous_executor.shutdown, True)
+    except asyncio.CancelledError:
+        model_swap_state.update(status="idle")
+        raise
     except Exception as e:
-        print(f"AI 모델 로드 실패: {e}")
-        raise RuntimeError(f"AI 모델 로드 중 심각한 오류 발생: {e}. 'train_model.py' 실행 및 모델 저장 경로를 확인하세요.")
+        model_swap_state.update(status="failed", error=str(e))
+        metrics.inc("model_swaps_total", {"outcome": "failed"})
+        logger.error(f"모델 교체 실패 ({version}): {e}")
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    model_swap_state.update(status="idle", last_swap_ms=round(elapsed_ms, 1))
+    metrics.inc("model_swaps_total", {"outcome": "success"})
+    logger.info(f"모델 교체 완료: {previous_version} -> {version}", extra={"fields": {"elapsed_ms": round(elapsed_ms, 1)}})
+
+def start_model_swap(version: str) -> None:
+    global _model_swap_task
+    _model_swap_task = asyncio.create_task(swap_model(version))
+
+async def watch_model_registry() -> None:
+    """레지스트리의 CURRENT 를 주기적으로 읽어 서빙 버전과 다르면 교체를 시작합니다. 실패한 버전은 다시 시도하지 않습니다."""
+    while True:
+        await asyncio.sleep(settings.MODEL_REGISTRY_POLL_SECONDS)
+        try:
+            current = await asyncio.to_thread(model_registry.current)
+        except OSError as e:
+            logger.warning(f"모델 레지스트리를 읽지 못했습니다: {e}")
+            continue
+        if current is None or current == model_state["version"] or model_swap_state["status"] == "loading":
+            continue
+        if model_swap_state["status"] == "failed" and model_swap_state["target"] == current:
+            continue
+        logger.info(f"레지스트리 CURRENT 변경 감지: {current}")
+        start_model_swap(current)
+
+async def load_cascade_model() -> None:
+    """캐스케이드 1단계 모델을 로드합니다. 파일이 없으면 캐스케이드 없이 모든 기사를 transformer 로 분석합니다."""
+    global cascade_model
+    if not os.path.exists(CASCADE_MODEL_PATH):
+        logger.warning(f"캐스케이드 1단계 모델을 찾을 수 없어 캐스케이드를 끕니다: {CASCADE_MODEL_PATH}")
+        return
+    started = time.perf_counter()
+    model = await asyncio.to_thread(LinearPreClassifier.load, CASCADE_MODEL_PATH)
+    model.predict_proba([WARMUP_TEXT])
+    cascade_model = model
+    _record_phase("cascade_load", (time.perf_counter() - started) * 1000.0)
+
+def cascade_fingerprint() -> str:
+    """결과 캐시 키에 넣을 캐스케이드 설정. 임계값이나 1단계 모델이 바뀌면 이전 결과를 쓰지 않습니다."""
+    if cascade_model is None:
+        return "cascade:off"
+    return f"cascade:{cascade_model.version}:{settings.CASCADE_THRESHOLD}"
+
+async def start_summary_jobs() -> None:
+    """요약 실행기와 작업 큐를 띄웁니다. 요약 모델 디렉토리가 없으면 요약 기능을 끄고 편향 분석만 제공합니다."""
+    global summary_jobs
+    if summary_jobs is None:
+        return
+    if not os.path.exists(SUMMARIZATION_MODEL_PATH):
+        logger.warning(f"요약 모델을 찾을 수 없어 요약 작업을 끕니다: {SUMMARIZATION_MODEL_PATH}")
+        summary_jobs = None
+        return
+    summary_executor.start()
+    await summary_jobs.start()
+    summary_jobs.namespace = await asyncio.to_thread(
+        model_fingerprint,
+        SUMMARIZATION_MODEL_PATH,
+        [settings.SUMMARY_MAX_INPUT_LENGTH, settings.SUMMARY_MAX_NEW_TOKENS, settings.SUMMARY_NUM_BEAMS],
+    )
+    logger.info(f"요약 작업 큐 시작 (실행기: {settings.SUMMARY_EXECUTOR}, 워커 {settings.SUMMARY_WORKERS}개)")
+
+def _ensure_model_ready() -> None:
+    """모델이 준비되지 않았으면 트래픽을 받지 않고 503 으로 돌려보냅니다."""
+    if model_state["status"] == "ready":
+        return
+    if model_state["status"] == "failed":
+        raise HTTPException(status_code=503, detail=f"AI 모델 로드에 실패했습니다: {model_state['error']}")
+    raise HTTPException(
+        status_code=503,
+        detail="AI 모델을 준비 중입니다. 잠시 후 다시 시도하세요.",
+        headers={"Retry-After": str(settings.INFERENCE_RETRY_AFTER_SECONDS)},
+    )
+
+@app.on_event("shutdown")
+async def stop_batcher():
+    for task in (_model_loader_task, _registry_watch_task, _model_swap_task):
+        if task is not None and not task.done():
+            task.cancel()
+    await bias_batcher.stop()
+    await paragraph_batcher.stop()
+    await attribution_batcher.stop()
+    if inference_executor is not None:
+        inference_executor.shutdown()
+    if result_cache is not None:
+        result_cache.close()
+    if paragraph_cache is not None:
+        paragraph_cache.close()
+    if summary_jobs is not None:
+        await summary_jobs.stop()
+    summary_executor.shutdown()
+    shutdown_logging()
+
+# WINDOW_MODE 가 켜져 있으면 512 토큰을 넘는 기사를 슬라이딩 윈도우로 나눠 점수화합니다.
+window_config = window_config_from_settings(settings)
+
+def get_bias_scores_batch(texts: List[str], trace: Optional[BatchTrace] = None) -> List[List[Dict[str, Any]]]:
+    """
+    여러 텍스트를 한 번의 모델 호출로 분석하고, 입력 순서대로 텍스트별 편향 점수를 반환하는 함수.
+    trace 가 주어지면 단계별 소요 시간과 입력별 토큰 수를 기록합니다.
+    """
+    # 모델 교체가 배치 도중에 일어나도 이 배치는 처음 잡은 엔진으로 끝냅니다.
+    engine = bias_engine
+    if engine is None:
+        raise RuntimeError("정치 편향 분석 모델 또는 토크나이저가 로드되지 않았습니다.")
+
+    logger.debug("정치 편향 모델: 배치 분석 중...", extra={"fields": {"batch_size": len(texts)}})
+    probabilities = engine.predict_proba_batch(texts, trace)
+
+    batch_scores = []
+    for row in probabilities:
+        bias_scores = []
+        for i, score in enumerate(row):
+            bias_scores.append({"category": label_name(i), "score": float(score)})
+        batch_scores.append(bias_scores)
+
+    return batch_scores
+
+def get_bias_scores_traced(texts: List[str]):
+    """배치 점수와 함께 BatchTrace 를 돌려줍니다. 실행기 워커에서 실행되어 지표를 메인 프로세스로 전달합니다."""
+    trace = BatchTrace()
+    return get_bias_scores_batch(texts, trace), trace
+
+def get_paragraph_logits_traced(texts: List[str]):
+    """문단별 로짓과 BatchTrace 를 돌려줍니다. 증분 분석의 문단 배처가 실행기 워커에서 호출합니다."""
+    engine = bias_engine
+    if engine is None:
+        raise RuntimeError("정치 편향 분석 모델 또는 토크나이저가 로드되지 않았습니다.")
+    trace = BatchTrace()
+    return engine.predict_logits_batch(texts, trace), trace
+
+def get_sentence_probabilities_traced(articles: List[List[str]]):
+    """
+    여러 기사의 문장을 모아 한 번의 동적 패딩 배치 추론으로 점수화하고, 기사별 문장 확률 목록과 BatchTrace 를 돌려줍니다.
+    문장은 ATTRIBUTION_MAX_TOKENS 에서 잘라 긴 문장 하나가 배치 전체의 패딩 길이를 늘리지 않게 합니다.
+    """
+    engine = bias_engine
+    if engine is None:
+        raise RuntimeError("정치 편향 분석 모델 또는 토크나이저가 로드되지 않았습니다.")
+    trace = BatchTrace()
+    sentences = [sentence for article in articles for sentence in article]
+    logits = engine.predict_logits_batch(sentences, trace, max_length=settings.ATTRIBUTION_MAX_TOKENS)
+    probabilities = torch.softmax(torch.tensor(logits), dim=-1).tolist() if logits else []
+    results, offset = [], 0
+    for article in articles:
+        results.append(probabilities[offset:offset + len(article)])
+        offset += len(article)
+    return results, trace
+
+def summarize_texts(texts: List[str]) -> List[str]:
+    """요약 실행기 워커에서 여러 기사를 한 번의 generate 로 요약합니다."""
+    return summarizer.summarize_batch(texts)
+
+def _init_summary_worker() -> None:
+    """process 요약 실행기의 워커가 편향 분석과 코어를 다투지 않도록 torch 스레드 수를 제한합니다."""
+    configure_torch_threads(max(1, settings.SUMMARY_TORCH_THREADS))
 
 def get_bias_scores(text: str) -> List[Dict[str, Any]]:
     """
     주어진 텍스트의 정치적 편향을 AI 모델로 분석하는 함수.
     """
-    if bias_tokenizer is None or bias_model is None:
-        raise RuntimeError("정치 편향 분석 모델 또는 토크나이저가 로드되지 않았습니다.")
+    return get_bias_scores_batch([text])[0]
+
+async def _run_inference(fn, texts, observe: bool = True):
+    """
+    실행기에서 배치를 추론하고 단계별 시간을 기록합니다. 배처에는 텍스트별 (점수, 토큰 수, 모델 버전) 을 돌려줍니다.
+    """
+    started = time.perf_counter()
+    batch_scores, trace = await inference_executor.run(fn, texts)
+    if observe:
+        latency_estimator.observe((time.perf_counter() - started) * 1000.0, [len(text) for text in texts], trace.token_lengths)
+    metrics.observe_trace("stage_duration_seconds", trace)
+    return [(scores, tokens, trace.model_version) for scores, tokens in zip(batch_scores, trace.token_lengths)]
 
-    print(f"정치 편향 모델: 텍스트 분석 중... (길이: {len(text)})")
+async def _run_paragraphs(fn, paragraphs):
+    """문단 배처의 배치를 추론합니다. 짧은 문단 배치가 기사 전체의 지연 추정을 끌어내리지 않도록 latency_estimator 에는 넣지 않습니다."""
+    return await _run_inference(fn, paragraphs, observe=False)
 
-    inputs = bias_tokenizer(
-        text,
-        return_tensors="pt", 
-        truncation=True,     
-        padding="max_length",
-        max_length=512   
-    )
+async def _run_attribution(fn, articles):
+    """문장 배처의 배치를 실행기에서 추론합니다. 기사 점수 지연 추정이 흐려지지 않도록 latency_estimator 에는 넣지 않습니다."""
+    batch_probabilities, _ = await inference_executor.run(fn, articles)
+    return batch_probabilities
+
+# 추론은 startup 에서 만들어지는 실행기에서 돌아가므로 이벤트 루프를 막지 않습니다.
+inference_executor: InferenceExecutor = None
 
-    with torch.no_grad():
-        outputs = bias_model(**inputs)
-        logits = outputs.logits 
+# 실제 배치 실행 시간으로 요청별 예상 지연을 계산해, 마감 시간 안에 끝나지 않을 요청은 추론 전에 걸러 냅니다.
+latency_estimator = LatencyEstimator(alpha=settings.ADMISSION_EWMA_ALPHA)
 
-    probabilities = torch.softmax(logits, dim=1).squeeze().tolist()
+# 기사/문단/문장 근거 배처가 같은 실행기를 쓰므로, 동시에 실행기에 올라가는 배치는 모두 합쳐 INFERENCE_WORKERS 개입니다.
+inference_slots = BatchSlots(settings.INFERENCE_WORKERS)
 
-    bias_scores = []
-    for i, score in enumerate(probabilities):
-        category = LABEL_MAP.get(i, f"알 수 없는 카테고리_{i}") 
-        bias_scores.append({"category": category, "score": float(score)}) 
+# 동시에 들어온 /analyze 요청을 모아 get_bias_scores_batch 한 번으로 처리합니다.
+# 대기열이 INFERENCE_MAX_QUEUE 를 넘으면 요청을 쌓지 않고 바로 503 으로 돌려보냅니다.
+bias_batcher = MicroBatcher(
+    get_bias_scores_traced,
+    max_batch_size=settings.BATCH_MAX_SIZE,
+    max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+    max_queue_size=settings.INFERENCE_MAX_QUEUE,
+    slots=inference_slots,
+    runner=_run_inference,
+    retry_after=settings.INFERENCE_RETRY_AFTER_SECONDS,
+)
+
+# 같은 기사를 여러 사용자가 열 때 분석을 반복하지 않도록 결과를 캐시합니다.
+result_cache = ResultCache(
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+    disk_path=settings.RESULT_CACHE_DISK_PATH or None,
+) if settings.RESULT_CACHE_ENABLED else None
+
+# 문단 단위 추론 배처. /analyze/stream 과 INCREMENTAL_MODE 가 씁니다. 여러 기사에서 들어온 문단들도
+# 한 번의 forward 로 묶습니다. INCREMENTAL_MODE 의 문단 캐시는 문단 본문 그대로(공백 포함)를 키로 씁니다.
+paragraph_batcher = MicroBatcher(
+    get_paragraph_logits_traced,
+    max_batch_size=settings.BATCH_MAX_SIZE,
+    max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+    max_queue_size=settings.PARAGRAPH_MAX_QUEUE,
+    slots=inference_slots,
+    runner=_run_paragraphs,
+    retry_after=settings.INFERENCE_RETRY_AFTER_SECONDS,
+)
+
+# 문장 단위 편향 근거 배처. 항목 하나가 기사 하나의 문장 목록이며, 같은 배치의 모든 문장이 한 번의 forward 로 처리됩니다.
+attribution_batcher = MicroBatcher(
+    get_sentence_probabilities_traced,
+    max_batch_size=settings.BATCH_MAX_SIZE,
+    max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+    max_queue_size=settings.ATTRIBUTION_MAX_QUEUE,
+    slots=inference_slots,
+    runner=_run_attribution,
+    retry_after=settings.INFERENCE_RETRY_AFTER_SECONDS,
+)
 
-    return bias_scores
+paragraph_cache = ResultCache(
+    max_entries=settings.PARAGRAPH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+    disk_path=settings.PARAGRAPH_CACHE_DISK_PATH or None,
+    normalize_keys=False,
+) if settings.INCREMENTAL_MODE else None
 
-def analyze_article_trust(article_text: str) -> List[Dict[str, str]]:
+# 요약은 편향 분석과 다른 실행기에서 돌려 /analyze 의 점수 응답이 생성(generate)을 기다리지 않게 합니다.
+summary_executor = InferenceExecutor(
+    kind=settings.SUMMARY_EXECUTOR,
+    max_workers=settings.SUMMARY_WORKERS,
+    initializer=_init_summary_worker if settings.SUMMARY_EXECUTOR == "process" else None,
+)
+
+summary_jobs: Optional[SummaryJobQueue] = SummaryJobQueue(
+    summarize_texts,
+    runner=summary_executor.run,
+    max_batch_size=settings.SUMMARY_BATCH_MAX_SIZE,
+    max_wait_ms=settings.SUMMARY_BATCH_MAX_WAIT_MS,
+    max_queue_size=settings.SUMMARY_MAX_QUEUE,
+    concurrency=settings.SUMMARY_WORKERS,
+    max_jobs=settings.SUMMARY_JOB_MAX_ENTRIES,
+    ttl_seconds=settings.SUMMARY_JOB_TTL_SECONDS,
+    notify=post_callback if settings.SUMMARY_CALLBACKS_ENABLED else None,
+) if settings.SUMMARY_ENABLED else None
+
+def _collect_runtime_gauges():
+    """/metrics 렌더링 시점에 배처, 캐시, 모델 상태를 읽어 내보냅니다. 캐시 이벤트처럼 누적값은 카운터로 등록되어 있습니다."""
+    yield "model_ready", {}, 1.0 if model_state["status"] == "ready" else 0.0
+    if model_state["version"] is not None:
+        yield "model_version_info", {"version": model_state["version"]}, 1.0
+    batching = bias_batcher.stats()
+    yield "batch_queue_depth", {}, batching["queue_depth"]
+    yield "batch_inflight", {}, batching["inflight_batches"]
+    if result_cache is not None:
+        cache = result_cache.stats()
+        for event in ("memory_hits", "disk_hits", "misses", "coalesced", "evictions", "expirations"):
+            yield "result_cache_events_total", {"event": event}, cache[event]
+    if summary_jobs is not None:
+        for status, count in summary_jobs.stats()["statuses"].items():
+            yield "summary_jobs", {"status": status}, count
+    yield "log_records_dropped", {}, dropped_records()
+
+metrics.add_collector(_collect_runtime_gauges)
+
+def analyze_article_trust(article_text: str) -> List[Dict[str, Any]]:
     """
     주어진 기사 텍스트에서 신뢰도를 떨어뜨릴 수 있는 의심스러운 지점을 탐지합니다.
-    탐지된 각 지점에 대해 이유와 관련 문구, 설명을 반환합니다.
-    """
-    suspicious_points: List[Dict[str, str]] = []
-
-    rules = {
-        "인용 출처 불분명": [
-            (r"\b관계자[는가]\s+말했다", "불분명한 '관계자' 인용. 구체적인 출처 명시 부족."),
-            (r"\b전문가[들은는]?\s+(우려|경고|지적|분석했다|제기했다)", "익명 '전문가' 의견. 어떤 분야의 전문가인지, 혹은 신뢰할 수 있는 단체 소속인지 불분명."),
-            (r"\b일각에서는", "'일각'이라는 불분명한 주체. 누가, 왜 그렇게 주장하는지 불명확."),
-            (r"\b소식통[에따르면]?", "'소식통'이라는 불분명한 출처. 정보의 신빙성 확인 필요."),
-            (r"\b익명의\s+[가-힣]+\s*에\s+따르면", "익명의 정보원 인용. 정보의 진위 확인 어려움."),
-        ],
-        "최신 정보 미반영 또는 오래된 데이터 사용": [
-            (r"(20[0-1][0-9]|202[0-3])년(도)?\s*(기준|통계|자료|연구|조사)(에따르면)?", "2000년대~2023년 데이터 사용. 최신 정보가 아닐 수 있음."),
-            (r"\b수년\s*전\b", "불분명한 과거 시점 언급. 정확한 시점 확인 필요."),
-            (r"\b구체적인\s+날짜\s*없이\s+.*발표", "구체적 날짜 없는 발표 인용. 정보의 시점 및 맥락 확인 필요.")
-        ],
-        "공신력 낮은 매체 인용 또는 자가 출처": [
-            (r"출처:\s*(자극적인뉴스|가짜뉴스일보|미확인방송|찌라시|커뮤니티|온라인\s*게시판)", "공신력 낮은 출처 인용. 정보의 신뢰성 검증 필요."),
-            (r"\b(온라인|인터넷)\s*커뮤니티[에서는]?", "검증되지 않은 온라인 커뮤니티 인용. 루머나 왜곡된 정보일 가능성."),
-            (r"\b(개인의\s*견해|주관적인\s*판단|일방적인\s*주장)\b", "객관성 부족한 서술. 사실이 아닌 개인의 의견 강조."),
-            (r"(\b[가-힣]+[뉴스신문통신]|이\s*매체는)\s+단독보도했다", "매체 자체의 단독 보도 강조. 교차 검증을 통해 사실 여부 확인 필요."),
-        ],
-        "전문성 부족 또는 불분명한 기자/작성자": [
-            (r"\b기자:\s*(홍길동|김아무개|익명)", "일반적인 이름 또는 익명 기자. 기자의 전문성이나 신뢰성 확인 필요."),
-            (r"\b(견습|인턴)\s*기자", "경험 부족 기자. 기사의 완성도나 정확도에 영향 가능성."),
-            (r"\b[가-힣]+\s*통신원", "불분명한 통신원. 정보의 출처 및 신뢰성 확인 필요."),
-            (r"\b무명\s*작성자", "무명 작성자. 정보의 책임 소재가 불분명.")
-        ],
-        "과도한 일반화 또는 확대 해석": [
-            (r"\b모든\s+[가-힣]+\s+.*[다들]\b", "'모든', '다들' 등의 과도한 일반화. 특정 사례를 전체로 확대 해석."),
-            (r"\b항상\s*.*(할\s*것이다|했다)", "'항상', '항시' 등의 과도한 일반화. 극단적인 표현 사용."),
-            (r"\b명백한\s*(사실|증거|결과)", "'명백한' 등의 단정적 표현 사용. 독자의 판단을 오도할 수 있음."),
-            (r"\b틀림없이\s*.*(할\s*것이다|했다)", "'틀림없이' 등의 단정적 표현 사용. 확정되지 않은 사실을 단정적으로 서술."),
-        ],
-        "선정적/자극적 표현": [
-            (r"\b충격적인\s*.*(사실|진실)", "'충격적인', '경악할' 등의 선정적 표현. 감정적인 반응 유도."),
-            (r"\b경악할\s*.*(수준|일)", "'충격적인', '경악할' 등의 선정적 표현. 사실 전달보다 감정적 자극 목적."),
-            (r"\b(분노|격분|경고|우려)\s*폭발", "감정적 과장 표현. 독자의 감정을 과도하게 자극."),
-            (r"\b(초토화|붕괴|궤멸|파괴)\s*.*(될\s*것이다|되었다)", "재앙적/극단적 표현. 사태를 과장하여 불안감 조성."),
-        ]
-    }
-
-    for reason, patterns_with_notes in rules.items():
-        for pattern_str, note in patterns_with_notes:
-            match = re.search(pattern_str, article_text, re.IGNORECASE)
-            if match:
-                suspicious_points.append({
-                    "reason": reason,    
-                    "phrase": match.group(0), 
-                    "note": note          
-                })
-    return suspicious_points
+    탐지된 모든 지점에 대해 이유와 관련 문구, 설명, 본문 내 위치(start/end)를 반환합니다.
+    """
+    return [match._asdict() for match in trust_engine.scan(article_text)]
 
 @app.get("/")
 async def root():
     """기본 엔드포인트: API 서버가 실행 중임을 확인."""
     return {"message": "Welcome to BiasBuster API!"}
 
+@app.get("/health/live")
+async def health_live():
+    """프로세스와 이벤트 루프가 응답하는지만 확인합니다. 모델 로드 여부와 무관하게 200 을 반환합니다."""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def health_ready():
+    """모델 로드와 워밍업이 끝나 트래픽을 받을 수 있을 때만 200 을 반환합니다."""
+    body = {
+        "status": model_state["status"],
+        "backend": settings.MODEL_BACKEND,
+        "model_version": model_state["version"],
+        "phases_ms": model_state["phases_ms"],
+    }
+    if model_state["registry_error"] is not None:
+        body["registry_error"] = model_state["registry_error"]
+    if model_state["status"] != "ready":
+        body["error"] = model_state["error"]
+        return JSONResponse(status_code=503, content=body)
+    return body
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """단계별 지연 시간 히스토그램과 요청/오류 수 등을 Prometheus 텍스트 형식으로 반환합니다."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/stats/batching")
+async def batching_stats():
+    """마이크로 배처의 큐 깊이와 배치 크기 통계를 반환합니다."""
+    stats = bias_batcher.stats()
+    stats["executor"] = inference_executor.stats() if inference_executor is not None else None
+    stats["paragraph_batcher"] = paragraph_batcher.stats()
+    stats["attribution_batcher"] = attribution_batcher.stats()
+    if summary_jobs is not None:
+        stats["summaries"] = summary_jobs.stats()
+    stats["admission"] = {"default_deadline_ms": settings.ANALYZE_DEADLINE_MS, **latency_estimator.stats()}
+    return stats
+
+@app.get("/stats/cache")
+async def cache_stats():
+    """결과 캐시의 적중/미스/제거 카운터를 반환합니다."""
+    stats = result_cache.stats() if result_cache is not None else {"enabled": False}
+    if paragraph_cache is not None:
+        stats["paragraph_cache"] = paragraph_cache.stats()
+    return stats
+
+def _check_admin_token(token: Optional[str]) -> None:
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="관리자 API 가 비활성화되어 있습니다 (ADMIN_TOKEN 미설정).")
+    if not token or not hmac.compare_digest(token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다.")
+
+@app.get("/admin/model")
+async def model_status(x_admin_token: Optional[str] = Header(None)):
+    """서빙 중인 모델 버전과 레지스트리 버전 목록, 진행 중인 교체 상태를 반환합니다."""
+    _check_admin_token(x_admin_token)
+    return {
+        "version": model_state["version"],
+        "path": political_bias_model_path,
+        "registry": await asyncio.to_thread(model_registry.describe) if model_registry is not None else None,
+        "swap": model_swap_state,
+    }
+
+@app.post("/admin/model/swap", status_code=202)
+async def model_swap(request: ModelSwapRequest, x_admin_token: Optional[str] = Header(None)):
+    """
+    레지스트리의 버전을 CURRENT 로 지정하고 백그라운드에서 로드/워밍업한 뒤 교체합니다. 요청은 바로 202 로 반환하며,
+    진행 상황은 GET /admin/model 의 swap 에서 확인합니다. 교체 중에도 기존 모델로 계속 요청을 처리합니다.
+    """
+    _check_admin_token(x_admin_token)
+    if model_registry is None:
+        raise HTTPException(status_code=400, detail="MODEL_REGISTRY_PATH 가 설정되어 있지 않습니다.")
+    if model_state["status"] != "ready":
+        raise HTTPException(status_code=409, detail="초기 모델 로드가 끝난 뒤에 교체할 수 있습니다.")
+    if model_swap_state["status"] == "loading":
+        raise HTTPException(status_code=409, detail=f"이미 {model_swap_state['target']} 버전으로 교체 중입니다.")
+    version = request.version or await asyncio.to_thread(model_registry.current)
+    try:
+        await asyncio.to_thread(model_registry.path, version or "")
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    # CURRENT 도 같이 바꿔 레지스트리 감시가 이전 버전으로 되돌리지 않게 하고, 재시작 후에도 같은 버전을 서빙하게 합니다.
+    await asyncio.to_thread(model_registry.set_current, version)
+    if version == model_state["version"]:
+        return {"status": "unchanged", "version": version}
+    start_model_swap(version)
+    return {"status": "loading", "version": version}
+
 @app.post("/analyze", response_model=AnalysisResult) 
 async def analyze_article_endpoint(request: ArticleRequest):
     """
     프론트엔드로부터 기사 본문 문자열을 받아 AI 모델로 분석하고 요약, 신뢰도 분석 결과를 반환합니다.
     """
+    _ensure_model_ready()
+    _validate_callback_url(request)
     article_text = request.text
-    print(f"프론트엔드로부터 받은 텍스트 {article_text}")
-    print(f"프론트엔드로부터 받은 텍스트 (길이: {len(article_text)})")
+    started = time.perf_counter()
+
+    # 문장 근거는 기사 점수와 동시에 계산해 응답 지연이 문장 배치 한 번 이상 늘어나지 않게 합니다.
+    attribution_task = start_attribution(request)
+    try:
+        result = await analyze_article_cached(article_text, deadline_after(
+            request.deadline_ms if request.deadline_ms is not None else settings.ANALYZE_DEADLINE_MS
+        ))
+        sentences = await finish_attribution(attribution_task, result)
+    finally:
+        if attribution_task is not None:
+            attribution_task.cancel()
+
+    summary_job_id = submit_summary_job(request)
+    log_analysis(article_text, result, summary_job_id, started)
+
+    with metrics.time("stage_duration_seconds", {"stage": "serialize", "length_bucket": "unknown"}):
+        return AnalysisResult(**result, summary_job_id=summary_job_id, sentences=sentences)
+
+@app.post("/analyze/stream")
+async def analyze_article_stream_endpoint(request: ArticleRequest):
+    """
+    /analyze 의 Server-Sent Events 버전. 결과를 단계별 이벤트로 보내 클라이언트가 느린 모델 추론을 기다리지 않고
+    그리기 시작할 수 있게 합니다.
+      trust   : 신뢰도 의심 지점 (규칙 검사라 바로 전송)
+      partial : 문단 하나의 점수가 나올 때마다 그 문단 점수와 지금까지의 누적 점수
+      result  : 최종 AnalysisResult (점수는 문단 로짓의 토큰 가중 평균, INCREMENTAL_MODE 의 /analyze 와 같은 방식).
+                attribution 요청이면 문장 근거(sentences)가 함께 실립니다
+      error   : 대기열 초과 등으로 점수를 끝내지 못함 (스트림 종료)
+    결과 캐시에 있는 기사나 캐스케이드 1단계가 확신하는 기사는 partial 없이 바로 result 를 보냅니다. deadline_ms 는 쓰지 않습니다.
+    INCREMENTAL_MODE 가 아니면 /analyze(기사 단위 점수)와 점수 계산 방식이 달라 결과 캐시를 별도 키로 씁니다.
+    """
+    _ensure_model_ready()
+    _validate_callback_url(request)
+    summary_job_id = submit_summary_job(request)
+    return StreamingResponse(
+        stream_analysis(request.text, summary_job_id, start_attribution(request)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def _validate_callback_url(request: ArticleRequest) -> None:
+    if request.callback_url is not None:
+        if not settings.SUMMARY_CALLBACKS_ENABLED:
+            raise HTTPException(status_code=400, detail="요약 콜백이 비활성화되어 있습니다. GET /summaries/{job_id} 로 조회하세요.")
+        if not request.callback_url.startswith(("http://", "https://")):
+            raise HTTPException(status_code=400, detail="callback_url 은 http(s) URL 이어야 합니다.")
+
+def submit_summary_job(request: ArticleRequest) -> Optional[str]:
+    """요약은 작업만 등록하고 기다리지 않습니다. 대기열이 가득 차면 작업 ID 없이 응답합니다."""
+    if not request.summarize or summary_jobs is None or not request.text.strip():
+        return None
+    job = summary_jobs.submit(request.text, request.callback_url)
+    return job.job_id if job is not None else None
+
+def log_analysis(article_text: str, result: Dict[str, Any], summary_job_id: Optional[str], started: float) -> None:
+    # 기사 본문은 남기지 않고 길이/해시만 기록합니다. LOG_BODY_SAMPLE_RATE 비율의 요청만 본문 앞부분을 함께 남깁니다.
+    fields = text_fields(article_text)
+    if should_log_body(settings.LOG_BODY_SAMPLE_RATE):
+        fields["body"] = article_text[:settings.LOG_BODY_MAX_CHARS]
+    top = max(result["scores"], key=lambda x: x["score"], default=None)
+    fields.update({
+        "bias_status": result.get("bias_status", "ok"),
+        "top_category": top["category"] if top else None,
+        "top_score": round(top["score"], 4) if top else None,
+        "trust_issues": len(result["trust_issues"]),
+        "summary_job_id": summary_job_id,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 1),
+    })
+    logger.info("분석 완료", extra={"fields": fields})
+
+async def attribute_sentences(article_text: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    기사 앞쪽 ATTRIBUTION_MAX_SENTENCES 개 문장을 문장 배처로 점수화해 편향이 가장 강한 문장 top-k 를 돌려줍니다.
+    문장 근거는 부가 정보라 대기열 초과나 추론 오류가 나도 요청을 실패시키지 않고 None 을 돌려줍니다.
+    """
+    sentences = split_sentences(article_text, settings.ATTRIBUTION_MIN_CHARS)[:settings.ATTRIBUTION_MAX_SENTENCES]
+    if not sentences:
+        return []
+    try:
+        with metrics.time("stage_duration_seconds", {"stage": "attribution", "length_bucket": "unknown"}):
+            probabilities = await attribution_batcher.submit([sentence.text for sentence in sentences])
+    except QueueFullError as e:
+        logger.warning(f"문장 근거 대기열 초과로 생략: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"문장 근거 분석 중 예상치 못한 오류 발생: {e}")
+        metrics.inc("analysis_errors_total", {"stage": "attribution"})
+        return None
+    return top_polarized(sentences, probabilities, settings.ATTRIBUTION_TOP_K)
+
+def start_attribution(request: ArticleRequest) -> Optional[asyncio.Task]:
+    return asyncio.create_task(attribute_sentences(request.text)) if request.attribution else None
+
+async def finish_attribution(task: Optional[asyncio.Task], result: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """기사 점수가 없는 축소 결과(bias_status != "ok")에는 문장 근거도 싣지 않습니다."""
+    if task is None:
+        return None
+    if result.get("bias_status", "ok") != "ok":
+        task.cancel()
+        return None
+    return await task
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def stream_analysis(article_text: str, summary_job_id: Optional[str], attribution_task: Optional[asyncio.Task] = None):
+    """analyze_article_stream_endpoint 의 이벤트를 만듭니다. 클라이언트가 연결을 끊으면 남은 문단 추론과 문장 근거 계산을 취소합니다."""
+    try:
+        async for event in _stream_events(article_text, summary_job_id, attribution_task):
+            yield event
+    finally:
+        if attribution_task is not None:
+            attribution_task.cancel()
+
+async def _stream_events(article_text: str, summary_job_id: Optional[str], attribution_task: Optional[asyncio.Task]):
+    started = time.perf_counter()
+    paragraphs = split_paragraphs(article_text, settings.PARAGRAPH_MIN_CHARS) or [Paragraph(article_text, 0, len(article_text))]
+    # 신뢰도 규칙은 여기서 한 번만 돌리고 문단 계산에는 그 결과를 넘깁니다. 문단 캐시가 있으면 캐시 항목과
+    # INCREMENTAL_MODE 의 /analyze 결과가 같아지도록 문단마다 검사하고, 없으면 기사 전체를 한 번에 검사합니다.
+    paragraph_trust: Optional[List[List[Dict[str, Any]]]] = None
+    try:
+        if paragraph_cache is not None:
+            paragraph_trust = await run_in_threadpool(lambda: [analyze_article_trust(p.text) for p in paragraphs])
+            trust = [match for paragraph, matches in zip(paragraphs, paragraph_trust) for match in offset_matches(paragraph, matches)]
+        else:
+            trust = await run_in_threadpool(analyze_article_trust, article_text)
+            paragraph_trust = [[] for _ in paragraphs]
+    except Exception as e:
+        logger.error(f"신뢰도 분석 중 예상치 못한 오류 발생: {e}")
+        metrics.inc("analysis_errors_total", {"stage": "trust"})
+        trust = [{"reason": "신뢰도 분석 오류", "phrase": "내부 서버 오류", "note": str(e)}]
+    yield sse_event("trust", {"trust_issues": trust})
+
+    # INCREMENTAL_MODE 면 /analyze 와 같은 문단 캐시/계산을 그대로 씁니다. 아니면 /analyze 의 기사 단위(윈도우) 점수와
+    # 계산 방식이 다르므로 결과 캐시를 별도 scope 의 키로 나눠 씁니다. 캐스케이드도 /analyze 와 같은 조건에서만 씁니다.
+    cache_key = result_cache.key_for(article_text, scope="stream") if result_cache is not None and paragraph_cache is None else None
+    result = await result_cache.get(cache_key) if cache_key is not None else None
+    if result is None and cascade_model is not None and paragraph_cache is None:
+        linear_scores = cascade_scores(article_text)
+        if linear_scores is not None:
+            result = {"summary": summarize_scores(linear_scores), "scores": linear_scores, "trust_issues": trust, "bias_model": "linear"}
+
+    if result is None:
+        model_version = model_state["version"]
+        recomputed = [False] * len(paragraphs)
+        entries: List[Optional[Dict[str, Any]]] = [None] * len(paragraphs)
+
+        async def indexed(index: int, coro):
+            return index, await coro
+
+        tasks = [
+            asyncio.create_task(indexed(i, coro))
+            for i, coro in enumerate(paragraph_coroutines(paragraphs, recomputed, paragraph_trust))
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                index, entry = await finished
+                entries[index] = entry
+                done = [e for e in entries if e is not None]
+                yield sse_event("partial", {
+                    "index": index,
+                    "start": paragraphs[index].start,
+                    "end": paragraphs[index].end,
+                    "completed": len(done),
+                    "total": len(paragraphs),
+                    "scores": pooled_scores([entry]),
+                    "aggregate": pooled_scores(done),
+                })
+        except QueueFullError as e:
+            logger.warning(f"분석 대기열 초과로 스트리밍 분석 중단: {e}")
+            yield sse_event("error", {"detail": str(e), "retry_after": e.retry_after})
+            return
+        except Exception as e:
+            logger.error(f"스트리밍 분석 중 예상치 못한 오류 발생: {e}")
+            metrics.inc("analysis_errors_total", {"stage": "stream"})
+            yield sse_event("error", {"detail": str(e)})
+            return
+        finally:
+            for task in tasks:
+                task.cancel()
+        metrics.observe("stage_duration_seconds", time.perf_counter() - started, {"stage": "stream", "length_bucket": token_length_bucket(sum(e["tokens"] for e in entries))})
 
+        analysis_scores = pooled_scores(entries)
+        stats = {"total": len(paragraphs), "recomputed": sum(recomputed)}
+        stats["reused"] = stats["total"] - stats["recomputed"]
+        result = {
+            "summary": summarize_scores(analysis_scores),
+            "scores": analysis_scores,
+            "trust_issues": trust,
+            "paragraphs": stats,
+            "bias_model": "transformer",
+            "model_version": model_version,
+        }
+        if cache_key is not None and _is_cacheable(result):
+            await result_cache.set(cache_key, result)
+
+    sentences = await finish_attribution(attribution_task, result)
+    log_analysis(article_text, result, summary_job_id, started)
+    yield sse_event("result", AnalysisResult(**{**result, "summary_job_id": summary_job_id, "sentences": sentences}).model_dump())
+
+@app.get("/summaries/{job_id}", response_model=SummaryJobResult)
+async def get_summary_job(job_id: str):
+    """요약 작업의 상태와 (끝났다면) 요약문을 반환합니다. 클라이언트는 status 가 done/failed 가 될 때까지 폴링합니다."""
+    if summary_jobs is None:
+        raise HTTPException(status_code=404, detail="요약 기능이 꺼져 있습니다.")
+    job = summary_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="요약 작업을 찾을 수 없습니다. 만료되었을 수 있으니 다시 분석을 요청하세요.")
+    return SummaryJobResult(**job.to_dict())
+
+@app.post("/analyze/batch")
+async def analyze_batch_endpoint(request: BatchArticleRequest):
+    """
+    여러 기사를 한 번에 받아 분석하고, 끝나는 순서대로 NDJSON 한 줄씩 스트리밍합니다.
+    기사별로 성공/실패를 따로 알려 주므로 일부 기사가 실패해도 나머지 결과는 그대로 받을 수 있습니다.
+    """
+    _ensure_model_ready()
+    articles = request.articles
+    if len(articles) > settings.BATCH_ENDPOINT_MAX_ARTICLES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 최대 {settings.BATCH_ENDPOINT_MAX_ARTICLES}개의 기사만 분석할 수 있습니다 (요청: {len(articles)}개).",
+        )
+    logger.info("배치 분석 요청 수신", extra={"fields": {"articles": len(articles)}})
+
+    # 한 요청이 공용 대기열을 모두 차지하지 않도록 동시에 제출하는 기사 수를 제한합니다.
+    # 제한 안에서는 마이크로 배처가 여러 기사를 한 번의 forward 로 묶어 처리합니다.
+    semaphore = asyncio.Semaphore(settings.BATCH_ENDPOINT_CONCURRENCY)
+
+    async def analyze_item(index: int, article: BatchArticle) -> BatchItemResult:
+        if not article.text.strip():
+            return BatchItemResult(id=article.id, index=index, ok=False, error="기사 본문이 비어 있습니다.")
+        async with semaphore:
+            try:
+                result = await analyze_article_cached(article.text)
+            except HTTPException as e:
+                return BatchItemResult(id=article.id, index=index, ok=False, error=str(e.detail))
+            except Exception as e:
+                logger.error(f"배치 항목 분석 중 예상치 못한 오류 발생 (id={article.id}): {e}")
+                return BatchItemResult(id=article.id, index=index, ok=False, error=str(e))
+        if not _is_cacheable(result):
+            return BatchItemResult(id=article.id, index=index, ok=False, result=AnalysisResult(**result), error="분석 중 오류가 발생했습니다.")
+        return BatchItemResult(id=article.id, index=index, ok=True, result=AnalysisResult(**result))
+
+    async def stream_results():
+        tasks = [asyncio.create_task(analyze_item(i, article)) for i, article in enumerate(articles)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                item = await finished
+                yield item.model_dump_json() + "\n"
+        finally:
+            # 클라이언트가 연결을 끊으면 남은 분석을 취소합니다.
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+async def analyze_article_cached(article_text: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    결과 캐시를 거쳐 analyze_article 을 실행합니다. 같은 기사의 동시 요청은 한 번만 계산됩니다.
+    deadline(time.perf_counter 기준)이 주어지면 그 안에 모델 점수를 낼 수 없을 때 규칙 결과만 돌려줍니다.
+    """
+    if paragraph_cache is not None:
+        # 문단 캐시가 기사 전체 재요청도 처리하므로 기사 단위 캐시는 거치지 않습니다.
+        return await analyze_article_incremental(article_text, deadline)
+    if result_cache is None:
+        return await analyze_article(article_text, deadline)
+    if deadline is not None:
+        # 마감 시간이 있는 요청은 캐시 적중만 재사용하고, 같은 기사의 계산을 함께 기다리지 않습니다.
+        # 마감 없는 요청이 마감 있는 요청의 축소 결과를 받아 가지 않게 하기 위함입니다.
+        cached = await result_cache.get(result_cache.key_for(article_text))
+        if cached is not None:
+            return cached
+        result = await analyze_article(article_text, deadline)
+        if _is_cacheable(result):
+            await result_cache.set(result_cache.key_for(article_text), result)
+        return result
+    return await result_cache.get_or_compute(
+        result_cache.key_for(article_text),
+        lambda: analyze_article(article_text),
+        should_store=_is_cacheable,
+    )
+
+def _is_cacheable(result: Dict[str, Any]) -> bool:
+    """분석 중 오류가 난 결과나 모델 점수가 빠진 축소 결과는 캐시에 남기지 않습니다."""
+    if result.get("bias_status", "ok") != "ok":
+        return False
+    if any(score["category"] == "분석 오류" for score in result["scores"]):
+        return False
+    return not any(issue["reason"] == "신뢰도 분석 오류" for issue in result["trust_issues"])
+
+async def analyze_article(article_text: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    기사 본문의 편향 점수와 신뢰도 의심 지점을 분석해 AnalysisResult 형태의 dict 로 반환합니다.
+    """
     analysis_scores: List[AnalysisScore] = []
     trust: List[SuspiciousPoint] = []
+    token_count: Optional[int] = None
+    model_version: Optional[str] = None
 
+    started = time.perf_counter()
+    linear_scores = cascade_scores(article_text) if cascade_model is not None else None
     try:
-        analysis_scores = get_bias_scores(article_text)
+        if linear_scores is not None:
+            analysis_scores = linear_scores
+        elif deadline is not None:
+            analysis_scores, token_count, model_version = await submit_with_deadline(article_text, deadline)
+        else:
+            analysis_scores, token_count, model_version = await bias_batcher.submit(article_text)
+    except AdmissionRejected as e:
+        return await analyze_article_rules_only(article_text, e.reason)
+    except QueueFullError as e:
+        logger.warning(f"분석 대기열 초과로 요청 거절: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except RuntimeError as e:
-        print(f"편향 분석 모델 로드 오류: {e}")
+        logger.error(f"편향 분석 모델 로드 오류: {e}")
+        metrics.inc("analysis_errors_total", {"stage": "bias"})
         analysis_scores = [{"category": "분석 오류", "score": 0.0}]
     except Exception as e:
-        print(f"정치 편향 분석 중 예상치 못한 오류 발생: {e}")
+        logger.error(f"정치 편향 분석 중 예상치 못한 오류 발생: {e}")
+        metrics.inc("analysis_errors_total", {"stage": "bias"})
         analysis_scores = [{"category": "분석 오류", "score": 0.0}]
+    length_bucket = token_length_bucket(token_count)
+    if linear_scores is None:
+        # 대기열 대기 시간을 포함해 요청 하나가 배처에서 결과를 받기까지 걸린 시간입니다.
+        metrics.observe("stage_duration_seconds", time.perf_counter() - started, {"stage": "inference", "length_bucket": length_bucket})
+
+    summary_text = summarize_scores(analysis_scores)
+
+    try:
+        with metrics.time("stage_duration_seconds", {"stage": "trust", "length_bucket": length_bucket}):
+            trust = await run_in_threadpool(analyze_article_trust, article_text)
+    except Exception as e:
+        logger.error(f"신뢰도 분석 중 예상치 못한 오류 발생: {e}")
+        metrics.inc("analysis_errors_total", {"stage": "trust"})
+        trust = [{"reason": "신뢰도 분석 오류", "phrase": "내부 서버 오류", "note": str(e)}]
+
+    logger.debug("분석 결과", extra={"fields": {"scores": analysis_scores, "trust_issues": len(trust), "tokens": token_count}})
+
+    return {
+        "summary": summary_text,
+        "scores": analysis_scores,
+        "trust_issues": trust,
+        "bias_model": "linear" if linear_scores is not None else "transformer",
+        "model_version": model_version,
+    }
+
+def cascade_scores(article_text: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    캐스케이드 1단계 선형 모델의 최대 확률이 CASCADE_THRESHOLD 이상이면 그 점수를 돌려주고,
+    아니면 None 을 돌려줘 transformer 로 넘기게 합니다.
+    """
+    with metrics.time("stage_duration_seconds", {"stage": "cascade", "length_bucket": "unknown"}):
+        probabilities = cascade_model.predict_proba([article_text])[0]
+    if probabilities.max() < settings.CASCADE_THRESHOLD:
+        metrics.inc("cascade_total", {"stage": "escalated"})
+        return None
+    metrics.inc("cascade_total", {"stage": "accepted"})
+    return [{"category": label_name(i), "score": float(score)} for i, score in enumerate(probabilities)]
 
+def summarize_scores(analysis_scores: List[Dict[str, Any]]) -> str:
+    """가장 높은 편향 점수를 한 문장으로 요약합니다."""
     summary_text = "기사 내용에 대한 편향성 분석이 완료되었습니다."
 
     if analysis_scores:
@@ -195,20 +1186,155 @@ async def analyze_article_endpoint(request: ArticleRequest):
         summary_text = f"이 기사는 '{top_score_category['category']}' 편향이 {top_score_category['score']*100:.0f}%로 가장 두드러집니다."
     else:
         summary_text = "분석 결과, 특정 편향이 감지되지     않거나 분석할 데이터가 부족합니다."
+    return summary_text
 
-    print(f"summary: {summary_text}")
+async def analyze_article_incremental(article_text: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    기사를 문단으로 나눠 캐시된 문단 결과(로짓, 문단 기준 신뢰도 매칭)를 재사용하고,
+    새로 생기거나 바뀐 문단만 추론/규칙 검사한 뒤 기사 단위 점수와 신뢰도 결과로 다시 합칩니다.
+    deadline 이 지나도록 문단 분석이 끝나지 않으면 규칙 결과만 돌려주고, 진행 중인 문단 분석은 계속해 캐시를 채웁니다.
+    """
+    paragraphs = split_paragraphs(article_text, settings.PARAGRAPH_MIN_CHARS)
+    if not paragraphs:
+        return await analyze_article(article_text, deadline)
+    recomputed = [False] * len(paragraphs)
+    # 캐시 키(네임스페이스)와 같은 시점의 버전입니다. 모델이 교체되면 새 네임스페이스로 문단을 다시 계산합니다.
+    model_version = model_state["version"]
 
+    started = time.perf_counter()
     try:
-        trust = analyze_article_trust(article_text)
+        pending = asyncio.gather(*paragraph_coroutines(paragraphs, recomputed))
+        if deadline is None:
+            entries = await pending
+        else:
+            try:
+                entries = await asyncio.wait_for(asyncio.shield(pending), max(remaining_ms(deadline), 0.0) / 1000.0)
+            except asyncio.TimeoutError:
+                metrics.inc("admission_total", {"decision": "timed_out"})
+                # 기다리는 쪽이 없어도 예외가 "never retrieved" 경고로 남지 않게 결과를 소비합니다.
+                pending.add_done_callback(lambda f: f.cancelled() or f.exception())
+                return await analyze_article_rules_only(article_text, "timed_out")
+    except QueueFullError as e:
+        if deadline is not None:
+            metrics.inc("admission_total", {"decision": "shed_queue_full"})
+            return await analyze_article_rules_only(article_text, "shed_queue_full")
+        logger.warning(f"분석 대기열 초과로 요청 거절: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except Exception as e:
-        print(f"신뢰도 분석 중 예상치 못한 오류 발생: {e}")
-        trust = [{"reason": "신뢰도 분석 오류", "phrase": "내부 서버 오류", "note": str(e)}]
+        # 문단 단위 분석이 실패하면 기사 전체를 기존 방식으로 분석합니다 (오류 결과 처리도 그쪽을 따릅니다).
+        logger.warning(f"문단 단위 분석 중 오류 발생, 기사 전체 분석으로 대체: {e}")
+        metrics.inc("analysis_errors_total", {"stage": "paragraphs"})
+        return await analyze_article(article_text, deadline)
+    token_count = sum(entry["tokens"] for entry in entries)
+    metrics.observe("stage_duration_seconds", time.perf_counter() - started, {"stage": "paragraphs", "length_bucket": token_length_bucket(token_count)})
+
+    analysis_scores = pooled_scores(entries)
+    trust = [match for paragraph, entry in zip(paragraphs, entries) for match in offset_matches(paragraph, entry["trust"])]
+
+    stats = {"total": len(paragraphs), "recomputed": sum(recomputed)}
+    stats["reused"] = stats["total"] - stats["recomputed"]
+    metrics.inc("paragraphs_total", {"outcome": "reused"}, stats["reused"])
+    metrics.inc("paragraphs_total", {"outcome": "recomputed"}, stats["recomputed"])
+    logger.debug("문단 단위 증분 분석", extra={"fields": {"paragraphs": stats}})
+
+    return {
+        "summary": summarize_scores(analysis_scores),
+        "scores": analysis_scores,
+        "trust_issues": trust,
+        "paragraphs": stats,
+        "bias_model": "transformer",
+        "model_version": model_version,
+    }
+
+def paragraph_coroutines(
+    paragraphs: List[Paragraph],
+    recomputed: List[bool],
+    paragraph_trust: Optional[List[List[Dict[str, Any]]]] = None,
+):
+    """
+    문단별 {"logits", "tokens", "trust"(문단 기준 위치)} 를 계산하는 코루틴 목록을 문단 순서대로 돌려줍니다.
+    문단 캐시(INCREMENTAL_MODE)가 있으면 캐시를 거치고, 새로 계산한 문단은 recomputed 에 표시합니다.
+    paragraph_trust 가 주어지면 신뢰도 규칙을 다시 돌리지 않고 그 문단별 매칭을 씁니다.
+    """
+    def compute_paragraph(index: int, paragraph: Paragraph):
+        async def compute() -> Dict[str, Any]:
+            recomputed[index] = True
+            logits, token_count, _ = await paragraph_batcher.submit(paragraph.text)
+            if paragraph_trust is not None:
+                matches = paragraph_trust[index]
+            else:
+                matches = await run_in_threadpool(analyze_article_trust, paragraph.text)
+            return {"logits": logits, "tokens": token_count, "trust": matches}
+        return compute
+
+    if paragraph_cache is None:
+        return [compute_paragraph(i, paragraph)() for i, paragraph in enumerate(paragraphs)]
+    return [
+        paragraph_cache.get_or_compute(paragraph_cache.key_for(paragraph.text), compute_paragraph(i, paragraph))
+        for i, paragraph in enumerate(paragraphs)
+    ]
+
+def pooled_scores(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """문단 로짓을 토큰 수로 가중 평균한 기사 점수."""
+    probabilities = pool_paragraph_probabilities([entry["logits"] for entry in entries], [entry["tokens"] for entry in entries])
+    return [{"category": label_name(i), "score": float(score)} for i, score in enumerate(probabilities)]
+
+def estimate_latency_ms(article_text: str) -> Optional[float]:
+    """지금 대기열 상태에서 이 기사의 편향 점수가 나오기까지 걸릴 시간(ms)을 추정합니다."""
+    stats = bias_batcher.stats()
+    # 문단/문장 근거 배처도 같은 실행기를 쓰므로, 그쪽에 쌓인 배치와 실행 중인 배치도 앞선 배치로 셉니다.
+    other_batches = 0
+    for batcher in (paragraph_batcher, attribution_batcher):
+        other = batcher.stats()
+        other_batches += math.ceil(other["queue_depth"] / batcher.max_batch_size) + other["inflight_batches"]
+    return latency_estimator.estimate_ms(
+        len(article_text),
+        queue_depth=stats["queue_depth"],
+        inflight_batches=stats["inflight_batches"] + other_batches,
+        max_batch_size=bias_batcher.max_batch_size,
+        concurrency=bias_batcher.concurrency,
+        max_wait_ms=bias_batcher.max_wait * 1000.0,
+        max_tokens=None if window_config is not None else MAX_LENGTH,
+    )
 
-    print(f"scores: {analysis_scores}")
-    print(f"trust_issues: {trust}")
+async def submit_with_deadline(article_text: str, deadline: float):
+    """
+    예상 지연이 남은 예산을 넘으면 대기열에 넣지 않고 AdmissionRejected 를 냅니다.
+    받은 요청도 마감 시간까지만 기다리며, 넘기면 배처에서 빠지고 AdmissionRejected("timed_out") 가 됩니다.
+    """
+    budget = remaining_ms(deadline)
+    estimated = estimate_latency_ms(article_text)
+    if budget <= 0 or (estimated is not None and estimated > budget):
+        metrics.inc("admission_total", {"decision": "shed_estimate"})
+        raise AdmissionRejected("shed_estimate", estimated)
+    try:
+        result = await asyncio.wait_for(bias_batcher.submit(article_text), budget / 1000.0)
+    except QueueFullError:
+        metrics.inc("admission_total", {"decision": "shed_queue_full"})
+        raise AdmissionRejected("shed_queue_full", estimated)
+    except asyncio.TimeoutError:
+        metrics.inc("admission_total", {"decision": "timed_out"})
+        raise AdmissionRejected("timed_out", estimated)
+    metrics.inc("admission_total", {"decision": "admitted"})
+    return result
 
-    return AnalysisResult(
-        summary=summary_text,
-        scores=analysis_scores,
-        trust_issues=trust
-    )
\ No newline at end of file
+async def analyze_article_rules_only(article_text: str, reason: str) -> Dict[str, Any]:
+    """모델 점수 없이 신뢰도 규칙 결과만으로 응답을 만듭니다. bias_status 는 "deferred" 입니다."""
+    logger.info("마감 시간 안에 편향 점수를 낼 수 없어 규칙 결과만 반환", extra={"fields": {"reason": reason}})
+    metrics.inc("degraded_results_total", {"reason": reason})
+    try:
+        trust = await run_in_threadpool(analyze_article_trust, article_text)
+    except Exception as e:
+        logger.error(f"신뢰도 분석 중 예상치 못한 오류 발생: {e}")
+        metrics.inc("analysis_errors_total", {"stage": "trust"})
+        trust = [{"reason": "신뢰도 분석 오류", "phrase": "내부 서버 오류", "note": str(e)}]
+    return {
+        "summary": "서버 요청이 많아 편향 점수 분석을 미뤘습니다. 신뢰도 분석 결과만 제공합니다.",
+        "scores": [],
+        "trust_issues": trust,
+        "bias_status": "deferred",
+    }
\ No newline at end of file
@@ -0,0 +1,90 @@
+# app/services/admission.py
+# 요청마다 마감 시간(지연 예산)을 두고, 모델 추론이 그 안에 끝날 수 있을지 추정해 받을지 정하는 승인 제어 헬퍼.
+import math
+import time
+from typing import Any, Dict, Optional, Sequence
+
+
+class AdmissionRejected(Exception):
+    """마감 시간 안에 모델 점수를 낼 수 없어 추론을 건너뛸 때 발생합니다. reason 은 지표 라벨로 쓰입니다."""
+
+    def __init__(self, reason: str, estimated_ms: Optional[float] = None):
+        super().__init__(reason)
+        self.reason = reason
+        self.estimated_ms = estimated_ms
+
+
+def deadline_after(budget_ms: Optional[float]) -> Optional[float]:
+    """지금부터 budget_ms 뒤의 time.perf_counter() 값을 돌려줍니다. 예산이 없거나 0 이하면 None (마감 없음)."""
+    if budget_ms is None or budget_ms <= 0:
+        return None
+    return time.perf_counter() + budget_ms / 1000.0
+
+
+def remaining_ms(deadline: float) -> float:
+    return (deadline - time.perf_counter()) * 1000.0
+
+
+class LatencyEstimator:
+    """
+    실제 배치 실행 기록(소요 시간, 글자 수, 토큰 수)의 지수 이동 평균으로 요청 하나가 결과를 받기까지의 시간을 추정합니다.
+    토큰 수는 미리 토크나이즈하지 않고 글자 수 x (토큰/글자) 로 어림하고, 대기열에 쌓인 요청은
+    배치 단위로 묶여 동시 실행 슬롯 수만큼 병렬로 처리된다고 봅니다.
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.batch_ms: Optional[float] = None
+        self.ms_per_token: Optional[float] = None
+        self.tokens_per_char: Optional[float] = None
+        self.observations = 0
+
+    def _update(self, current: Optional[float], value: float) -> float:
+        return value if current is None else current + self.alpha * (value - current)
+
+    def observe(self, elapsed_ms: float, char_lengths: Sequence[int], token_lengths: Sequence[Optional[int]]) -> None:
+        """배치 하나의 실행 시간과 입력 크기를 반영합니다. 윈도우 모드처럼 토큰 수를 모르면 배치 시간만 반영합니다."""
+        self.observations += 1
+        self.batch_ms = self._update(self.batch_ms, elapsed_ms)
+        known = [(chars, tokens) for chars, tokens in zip(char_lengths, token_lengths) if tokens]
+        if known:
+            tokens = sum(t for _, t in known)
+            chars = sum(c for c, _ in known)
+            self.ms_per_token = self._update(self.ms_per_token, elapsed_ms / tokens)
+            self.tokens_per_char = self._update(self.tokens_per_char, tokens / max(chars, 1))
+
+    def estimate_tokens(self, char_count: int, max_tokens: Optional[int] = None) -> Optional[int]:
+        if self.tokens_per_char is None:
+            return None
+        tokens = math.ceil(char_count * self.tokens_per_char)
+        return min(tokens, max_tokens) if max_tokens else tokens
+
+    def estimate_ms(
+        self,
+        char_count: int,
+        queue_depth: int,
+        inflight_batches: int,
+        max_batch_size: int,
+        concurrency: int,
+        max_wait_ms: float,
+        max_tokens: Optional[int] = None,
+    ) -> Optional[float]:
+        """
+        (배치 대기) + (앞선 배치들이 끝나기까지) + (이 요청의 forward) 를 ms 로 추정합니다.
+        아직 관측된 배치가 없으면 None 을 돌려주며, 호출자는 이때 요청을 그대로 받습니다.
+        """
+        if self.batch_ms is None:
+            return None
+        backlog_batches = math.ceil(queue_depth / max(max_batch_size, 1)) + inflight_batches
+        waiting = backlog_batches * self.batch_ms / max(concurrency, 1)
+        tokens = self.estimate_tokens(char_count, max_tokens)
+        own = tokens * self.ms_per_token if tokens is not None and self.ms_per_token is not None else self.batch_ms
+        return max_wait_ms + waiting + own
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "observations": self.observations,
+            "batch_ms": self.batch_ms,
+            "ms_per_token": self.ms_per_token,
+            "tokens_per_char": self.tokens_per_char,
+        }
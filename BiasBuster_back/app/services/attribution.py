@@ -0,0 +1,60 @@
+# app/services/attribution.py
+# 문장 단위 편향 근거(attribution). 기사를 문장으로 나눠 모든 문장을 한 번의 배치 추론으로 점수화하고,
+# 좌파/진보 또는 우파/보수 쪽 확률이 가장 높은 문장 top-k 를 본문 위치, 라벨별 확률과 함께 돌려줍니다.
+import re
+from typing import Any, Dict, List, NamedTuple, Sequence
+
+from .ml_service import NEUTRAL_LABEL, label_name
+
+# 마침표/물음표/느낌표(+닫는 따옴표·괄호) 뒤에 공백이 오거나 줄이 바뀌면 문장이 끝난 것으로 봅니다.
+# "3.5%" 처럼 뒤에 공백이 없는 마침표는 문장 끝으로 보지 않습니다.
+_BOUNDARY = re.compile(r"[.!?。…]+[\"'”’」』)\]]*(?=\s|$)|\n")
+
+
+class Sentence(NamedTuple):
+    text: str
+    start: int  # 기사 본문에서 문장이 시작하는 문자 위치
+    end: int
+
+
+def split_sentences(text: str, min_chars: int = 0) -> List[Sentence]:
+    """
+    기사 본문을 문장으로 나눕니다. 앞뒤 공백은 위치를 유지한 채 잘라 내고,
+    min_chars 보다 짧은 조각(사진 설명, 기자 이름 등)은 근거 후보에서 뺍니다.
+    """
+    sentences: List[Sentence] = []
+    position = 0
+    ends = [m.end() for m in _BOUNDARY.finditer(text)] + [len(text)]
+    for end in ends:
+        segment = text[position:end]
+        stripped = segment.strip()
+        if stripped and len(stripped) >= min_chars:
+            start = position + (len(segment) - len(segment.lstrip()))
+            sentences.append(Sentence(stripped, start, start + len(stripped)))
+        position = end
+    return sentences
+
+
+def top_polarized(
+    sentences: Sequence[Sentence],
+    probabilities: Sequence[Sequence[float]],
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    """
+    문장별 확률에서 중도를 뺀 라벨 중 확률이 가장 높은 쪽을 그 문장의 성향(category)으로,
+    그 확률을 편향 점수(score)로 보고 점수가 높은 순서대로 top_k 개를 돌려줍니다.
+    """
+    attributions = []
+    for sentence, row in zip(sentences, probabilities):
+        partisan = [i for i in range(len(row)) if label_name(i) != NEUTRAL_LABEL]
+        best = max(partisan, key=lambda i: row[i])
+        attributions.append({
+            "text": sentence.text,
+            "start": sentence.start,
+            "end": sentence.end,
+            "category": label_name(best),
+            "score": float(row[best]),
+            "probabilities": [{"category": label_name(i), "score": float(p)} for i, p in enumerate(row)],
+        })
+    attributions.sort(key=lambda a: a["score"], reverse=True)
+    return attributions[:max(top_k, 0)]
@@ -0,0 +1,71 @@
+# app/services/backends.py
+# 정치 편향 분류 모델을 CPU 추론 백엔드별로 로드하는 헬퍼.
+#   torch      : 학습 결과 그대로의 fp32 PyTorch 모델
+#   torch_int8 : Linear 레이어를 동적 INT8 양자화한 PyTorch 모델
+#   onnx       : scripts/convert_model.py 로 내보낸 ONNX 모델을 onnxruntime 으로 실행
+import os
+from typing import Optional
+
+import torch
+from transformers import AutoModelForSequenceClassification
+from transformers.modeling_outputs import SequenceClassifierOutput
+
+MODEL_BACKENDS = ("torch", "torch_int8", "onnx")
+ONNX_SUBDIR = "onnx"
+ONNX_FILENAME = "model.onnx"
+
+
+def default_onnx_path(model_path: str) -> str:
+    return os.path.join(model_path, ONNX_SUBDIR, ONNX_FILENAME)
+
+
+class OnnxSequenceClassifier:
+    """
+    onnxruntime 세션을 AutoModelForSequenceClassification 과 같은 방식(model(**inputs).logits)으로
+    호출할 수 있게 감싼 래퍼. 서빙 코드는 백엔드 종류를 몰라도 됩니다.
+    """
+
+    def __init__(self, onnx_path: str, num_threads: Optional[int] = None):
+        import onnxruntime as ort
+
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(
+                f"ONNX 모델을 찾을 수 없습니다: {onnx_path}. 'python scripts/convert_model.py export-onnx' 로 먼저 내보내세요."
+            )
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def __call__(self, **inputs) -> SequenceClassifierOutput:
+        feed = {name: tensor.cpu().numpy() for name, tensor in inputs.items() if name in self.input_names}
+        logits = self.session.run(["logits"], feed)[0]
+        return SequenceClassifierOutput(logits=torch.from_numpy(logits))
+
+    def eval(self):
+        return self
+
+
+def quantize_dynamic_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """Linear 레이어의 가중치를 INT8 로 양자화합니다. 활성값은 추론 시점에 동적으로 양자화됩니다."""
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_sequence_classifier(model_path: str, backend: str = "torch", onnx_path: Optional[str] = None):
+    """
+    backend 에 맞는 분류 모델을 eval 모드로 로드합니다. 반환된 객체는 model(**inputs).logits 로 호출합니다.
+    """
+    if backend not in MODEL_BACKENDS:
+        raise ValueError(f"지원하지 않는 모델 백엔드입니다: {backend} (허용: {', '.join(MODEL_BACKENDS)})")
+
+    if backend == "onnx":
+        return OnnxSequenceClassifier(onnx_path or default_onnx_path(model_path), num_threads=torch.get_num_threads())
+
+    # low_cpu_mem_usage 는 무작위 초기화 없이 safetensors 가중치를 mmap 으로 바로 읽어 로드 시간을 줄입니다.
+    model = AutoModelForSequenceClassification.from_pretrained(model_path, low_cpu_mem_usage=True)
+    model.eval()
+    if backend == "torch_int8":
+        model = quantize_dynamic_int8(model)
+    return model
@@ -0,0 +1,219 @@
+# app/services/batching.py
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+class QueueFullError(RuntimeError):
+    """대기 큐가 가득 차 요청을 더 받을 수 없을 때 발생하는 예외."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class BatchSlots:
+    """
+    같은 실행기를 쓰는 여러 MicroBatcher 가 함께 나눠 쓰는 실행 슬롯.
+    세마포어는 이벤트 루프마다 새로 만들어 앱을 다시 띄워도(테스트 등) 이전 루프에 묶이지 않게 합니다.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("limit는 1 이상이어야 합니다.")
+        self.limit = limit
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.limit)
+        return self._semaphore
+
+
+class MicroBatcher:
+    """
+    비동기 요청을 큐에 모아 한 번의 모델 호출로 처리하는 동적 마이크로 배처.
+    max_batch_size 개가 모이거나 첫 요청이 max_wait_ms 만큼 기다리면 배치를 실행하고,
+    batch_fn 이 돌려준 결과 리스트를 요청 순서대로 각 호출자에게 나눠 줍니다.
+
+    runner 가 주어지면 batch_fn 을 이벤트 루프가 아닌 runner(batch_fn, items) 로 실행하며,
+    동시에 실행되는 배치 수는 concurrency 로 제한되며, slots 가 주어지면 그 슬롯을 다른 배처와 함께 나눠 씁니다.
+    max_queue_size 를 넘는 요청은 기다리게 하지 않고 즉시 QueueFullError 로 거절합니다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        max_queue_size: int = 0,
+        concurrency: int = 1,
+        runner: Optional[Callable[..., Awaitable[List[Any]]]] = None,
+        retry_after: int = 1,
+        slots: Optional[BatchSlots] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size는 1 이상이어야 합니다.")
+        if concurrency < 1:
+            raise ValueError("concurrency는 1 이상이어야 합니다.")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max(max_wait_ms, 0.0) / 1000.0
+        self.max_queue_size = max(max_queue_size, 0)
+        self.concurrency = slots.limit if slots is not None else concurrency
+        self.slots = slots
+        self.runner = runner
+        self.retry_after = retry_after
+
+        self._queue: Optional[asyncio.Queue] = None
+        # 큐에 있거나 워커가 꺼내 실행 슬롯을 기다리는, 아직 배치로 넘어가지 않은 요청 수 (대기열 한도 기준)
+        self._waiting = 0
+        self._worker: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+        self._total_requests = 0
+        self._rejected_requests = 0
+        self._total_batches = 0
+        self._batch_size_counts: Counter = Counter()
+        self._total_queue_wait = 0.0
+        self._max_queue_depth = 0
+
+    async def start(self) -> None:
+        """배치 워커 태스크를 실행 중인 이벤트 루프에 띄웁니다."""
+        if self._worker is not None and not self._worker.done():
+            return
+        self._queue = asyncio.Queue()
+        self._waiting = 0
+        self._slots = self.slots.semaphore() if self.slots is not None else asyncio.Semaphore(self.concurrency)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """워커를 멈추고 아직 처리되지 않은 요청은 오류로 마무리합니다."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future, _ = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("배치 처리기가 종료되었습니다."))
+            self._waiting = 0
+
+    async def submit(self, item: Any) -> Any:
+        """항목 하나를 큐에 넣고, 해당 항목의 배치 결과가 나올 때까지 기다립니다."""
+        if self._worker is None or self._worker.done():
+            await self.start()
+
+        if self.max_queue_size and self._waiting >= self.max_queue_size:
+            self._rejected_requests += 1
+            raise QueueFullError(
+                f"분석 대기열이 가득 찼습니다 (최대 {self.max_queue_size}건).",
+                retry_after=self.retry_after,
+            )
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future, time.perf_counter()))
+        self._waiting += 1
+        self._total_requests += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._waiting)
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            # 요청이 온 뒤에 슬롯을 잡아 쉬고 있는 배처가 공유 슬롯을 붙들지 않게 합니다.
+            # 실행 슬롯이 빌 때까지 기다리는 동안 도착한 요청은 이 배치에 함께 묶입니다.
+            first = await self._queue.get()
+            batch = [first]
+            acquired = False
+            try:
+                await self._slots.acquire()
+                acquired = True
+                deadline = first[2] + self.max_wait
+
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        # 대기 시간이 지났더라도 이미 큐에 쌓인 요청은 같은 배치에 태웁니다.
+                        if self._queue.empty():
+                            break
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # 종료 중에 큐에서 꺼내 둔 요청은 stop() 이 비우는 큐에 없으므로 여기서 마무리합니다.
+                if acquired:
+                    self._slots.release()
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("배치 처리기가 종료되었습니다."))
+                raise
+            self._waiting -= len(batch)
+
+            task = asyncio.create_task(self._execute(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _execute(self, batch: List[Tuple[Any, asyncio.Future, float]]) -> None:
+        # 마감 시간이 지나 호출자가 이미 기다리기를 포기한(취소된) 요청은 계산하지 않습니다.
+        batch = [entry for entry in batch if not entry[1].done()]
+        if not batch:
+            self._slots.release()
+            return
+        now = time.perf_counter()
+        self._total_batches += 1
+        self._batch_size_counts[len(batch)] += 1
+        self._total_queue_wait += sum(now - enqueued_at for _, _, enqueued_at in batch)
+
+        items = [item for item, _, _ in batch]
+        try:
+            if self.runner is not None:
+                results = await self.runner(self.batch_fn, items)
+            else:
+                results = self.batch_fn(items)
+            if len(results) != len(items):
+                raise RuntimeError(f"배치 결과 개수 불일치: 입력 {len(items)}개, 결과 {len(results)}개")
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 깊이와 배치 크기 분포 등 튜닝용 통계를 반환합니다."""
+        batches = self._total_batches
+        processed = sum(size * count for size, count in self._batch_size_counts.items())
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "max_queue_size": self.max_queue_size,
+            "queue_depth": self._waiting,
+            "max_queue_depth": self._max_queue_depth,
+            "inflight_batches": len(self._inflight),
+            "total_requests": self._total_requests,
+            "rejected_requests": self._rejected_requests,
+            "total_batches": batches,
+            "avg_batch_size": processed / batches if batches else 0.0,
+            "avg_queue_wait_ms": self._total_queue_wait / processed * 1000.0 if processed else 0.0,
+            "batch_size_histogram": {str(size): count for size, count in sorted(self._batch_size_counts.items())},
+        }
@@ -0,0 +1,150 @@
+# app/services/cascade.py
+# 2단계 캐스케이드의 1단계: 해시 문자 n-gram TF-IDF + 선형 모델. 확신도가 높은 기사는 여기서 바로 답하고,
+# 최대 확률이 임계값보다 낮은 기사만 RoBERTa 로 넘깁니다. 학습은 scripts/train_cascade.py 가 합니다.
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_MAX_CHARS = 4000
+DEFAULT_NGRAM_RANGE = (2, 4)
+DEFAULT_N_FEATURES = 2 ** 20
+
+_HASH_MULTIPLIER = np.uint64(1000003)
+
+
+def hash_char_ngrams(text: str, ngram_range: Tuple[int, int], n_features: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    문자 n-gram 을 해시 공간의 인덱스로 바꾸고 (정렬된 인덱스, 등장 횟수) 를 돌려줍니다.
+    n-gram 을 문자열로 만들지 않고 코드 포인트 배열 위에서 한꺼번에 해시하므로 긴 기사도 수십 us 안에 끝납니다.
+    n_features 는 2 의 거듭제곱이어야 합니다.
+    """
+    codes = np.frombuffer(" ".join(text.lower().split()).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    hashes = []
+    with np.errstate(over="ignore"):
+        for n in range(ngram_range[0], ngram_range[1] + 1):
+            if len(codes) < n:
+                break
+            h = np.full(len(codes) - n + 1, n, dtype=np.uint64)
+            for k in range(n):
+                h = h * _HASH_MULTIPLIER + codes[k:len(codes) - n + 1 + k]
+            hashes.append(h ^ (h >> np.uint64(29)))
+    if not hashes:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    indices = (np.concatenate(hashes) & np.uint64(n_features - 1)).astype(np.int64)
+    return np.unique(indices, return_counts=True)
+
+
+class LinearPreClassifier:
+    """
+    학습은 sklearn(TfidfTransformer + LogisticRegression)으로 하고, 서빙에서는 idf 와 가중치 배열만 써서
+    해시 인덱스 위치의 값만 곱합니다. 긴 기사도 앞부분 max_chars 글자만 보므로 지연 시간이 기사 길이와 무관하게 일정합니다.
+    """
+
+    def __init__(
+        self,
+        n_features: int = DEFAULT_N_FEATURES,
+        ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+        max_chars: int = DEFAULT_MAX_CHARS,
+        num_labels: int = 3,
+    ):
+        if n_features & (n_features - 1):
+            raise ValueError(f"n_features 는 2 의 거듭제곱이어야 합니다: {n_features}")
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.max_chars = max_chars
+        self.num_labels = num_labels
+        self.idf: Optional[np.ndarray] = None
+        self.weights: Optional[np.ndarray] = None  # (n_features, num_labels)
+        self.bias: Optional[np.ndarray] = None
+        self.version = ""
+
+    def features(self, texts: Sequence[str]):
+        """학습용 sparse 행렬 (기사 x 해시 공간, 값은 등장 횟수)."""
+        from scipy.sparse import csr_matrix
+
+        indptr, indices, counts = [0], [], []
+        for text in texts:
+            idx, cnt = hash_char_ngrams(text[:self.max_chars], self.ngram_range, self.n_features)
+            indices.append(idx)
+            counts.append(cnt)
+            indptr.append(indptr[-1] + len(idx))
+        return csr_matrix(
+            (np.concatenate(counts).astype(np.float64) if counts else [], np.concatenate(indices) if indices else [], indptr),
+            shape=(len(texts), self.n_features),
+        )
+
+    def fit(self, texts: Sequence[str], labels: Sequence[int], c: float = 4.0) -> "LinearPreClassifier":
+        from sklearn.feature_extraction.text import TfidfTransformer
+        from sklearn.linear_model import LogisticRegression
+
+        tfidf = TfidfTransformer(sublinear_tf=True)
+        x = tfidf.fit_transform(self.features(texts))
+        clf = LogisticRegression(C=c, max_iter=1000).fit(x, list(labels))
+
+        # 학습 데이터에 없던 라벨은 확률이 0 이 되도록 bias 를 아주 작게 둡니다.
+        weights = np.zeros((self.n_features, self.num_labels), dtype=np.float32)
+        bias = np.full(self.num_labels, -1e9, dtype=np.float32)
+        classes = np.asarray(clf.classes_, dtype=int)
+        if len(classes) == 2:
+            # 이진 분류는 가중치 한 줄(양성 클래스 로짓)만 있으므로 음성 클래스 로짓을 0 으로 둡니다.
+            weights[:, classes[1]] = clf.coef_[0]
+            bias[classes] = [0.0, clf.intercept_[0]]
+        else:
+            weights[:, classes] = clf.coef_.T
+            bias[classes] = clf.intercept_
+        self.idf = tfidf.idf_.astype(np.float32)
+        self.weights = weights
+        self.bias = bias
+        return self
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """라벨 인덱스(0..num_labels-1) 순서의 확률 행렬."""
+        logits = np.zeros((len(texts), self.num_labels), dtype=np.float32)
+        for row, text in enumerate(texts):
+            idx, cnt = hash_char_ngrams(text[:self.max_chars], self.ngram_range, self.n_features)
+            values = (1.0 + np.log(cnt)).astype(np.float32) * self.idf[idx]
+            norm = np.sqrt(np.dot(values, values))
+            if norm > 0:
+                values /= norm
+            logits[row] = values @ self.weights[idx] + self.bias
+        logits -= logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        return probabilities / probabilities.sum(axis=1, keepdims=True)
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(
+            path,
+            idf=self.idf,
+            weights=self.weights,
+            bias=self.bias,
+            config=np.array([self.n_features, self.ngram_range[0], self.ngram_range[1], self.max_chars, self.num_labels]),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LinearPreClassifier":
+        import hashlib
+
+        with np.load(path) as data:
+            n_features, ngram_min, ngram_max, max_chars, num_labels = (int(v) for v in data["config"])
+            model = cls(n_features, (ngram_min, ngram_max), max_chars, num_labels)
+            model.idf = data["idf"]
+            model.weights = data["weights"]
+            model.bias = data["bias"]
+        # 결과 캐시 키에 넣어 1단계 모델을 다시 학습하면 이전 캐시 항목을 쓰지 않게 합니다.
+        with open(path, "rb") as f:
+            model.version = hashlib.sha256(f.read()).hexdigest()[:16]
+        return model
+
+
+def confident_rows(probabilities: np.ndarray, threshold: float) -> np.ndarray:
+    """최대 확률이 threshold 이상이라 1단계 결과를 그대로 쓸 행의 마스크."""
+    return probabilities.max(axis=1) >= threshold
+
+
+def cascade_predictions(
+    linear_probabilities: np.ndarray,
+    transformer_probabilities: np.ndarray,
+    escalated: np.ndarray,
+) -> np.ndarray:
+    """넘겨진(escalated) 행은 transformer 예측, 나머지는 1단계 예측을 씁니다."""
+    return np.where(escalated, transformer_probabilities.argmax(axis=1), linear_probabilities.argmax(axis=1))
@@ -0,0 +1,68 @@
+# app/services/executor.py
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class InferenceExecutor:
+    """
+    CPU 를 많이 쓰는 동기 추론 함수를 이벤트 루프 밖의 스레드/프로세스 풀에서 실행하는 래퍼.
+    process 모드에서는 각 워커가 spawn 으로 시작되며 initializer 로 모델을 직접 로드해야 합니다.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int = 1,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = (),
+    ):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"지원하지 않는 실행기 종류입니다: {kind} (허용: {', '.join(EXECUTOR_KINDS)})")
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다.")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self._pool: Optional[Executor] = None
+
+    def start(self) -> None:
+        if self._pool is not None:
+            return
+        if self.kind == "process":
+            # fork 는 이미 스레드를 띄운 torch 와 함께 쓰면 교착될 수 있어 spawn 을 사용합니다.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="inference",
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args) 를 풀에서 실행하고 결과를 기다립니다."""
+        if self._pool is None:
+            self.start()
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        wait=False 면 대기 중인 작업을 취소하고 바로 반환합니다 (서버 종료).
+        wait=True 면 이미 넘겨받은 작업이 모두 끝날 때까지 기다립니다 (모델 교체 후 이전 실행기 정리).
+        """
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "max_workers": self.max_workers, "running": self._pool is not None}
@@ -0,0 +1,195 @@
+# app/services/metrics.py
+# 외부 의존성 없이 카운터/게이지/히스토그램을 모아 Prometheus 텍스트 형식으로 내보내는 최소한의 지표 레지스트리.
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 단계별 지연 시간 히스토그램의 상한(초). 토크나이즈(수 ms)부터 긴 기사 forward(수 초)까지 덮습니다.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 입력 토큰 길이 구간. 마지막 구간을 넘는 입력(슬라이딩 윈도우 모드)은 gt_512 로 묶습니다.
+TOKEN_LENGTH_BUCKETS = (64, 128, 256, 512)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def token_length_bucket(token_count: Optional[int]) -> str:
+    """토큰 수를 히스토그램 라벨용 구간 이름(le_64, ..., gt_512, unknown)으로 바꿉니다."""
+    if token_count is None:
+        return "unknown"
+    for bound in TOKEN_LENGTH_BUCKETS:
+        if token_count <= bound:
+            return f"le_{bound}"
+    return f"gt_{TOKEN_LENGTH_BUCKETS[-1]}"
+
+
+class BatchTrace:
+    """
+    배치 하나를 추론하는 동안의 단계별 소요 시간(ms)과 입력별 토큰 수를 담습니다.
+    process 실행기의 워커에서 채워 메인 프로세스로 돌려보낼 수 있도록 단순한 값만 가집니다.
+    """
+
+    def __init__(self):
+        self.stages_ms: Dict[str, float] = {}
+        self.token_lengths: List[Optional[int]] = []
+        self.model_version: Optional[str] = None  # 배치를 처리한 모델 버전
+
+    def add(self, name: str, elapsed_ms: float) -> None:
+        self.stages_ms[name] = self.stages_ms.get(name, 0.0) + elapsed_ms
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - started) * 1000.0)
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """
+    관측은 잠금 아래에서 정수 몇 개를 올리는 것이 전부라 요청 경로에서 무시할 만한 비용입니다.
+    렌더링 시점에만 문자열을 만들고, 큐 깊이처럼 다른 객체가 가진 값은 collector 로 그때그때 읽습니다.
+    """
+
+    def __init__(self, namespace: str = "biasbuster"):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str]] = {}
+        self._buckets: Dict[str, Sequence[float]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._collectors: List[Callable[[], Iterator[Tuple[str, Dict[str, str], float]]]] = []
+
+    def _name(self, name: str) -> str:
+        return f"{self.namespace}_{name}"
+
+    def counter(self, name: str, help_text: str) -> None:
+        self._meta[self._name(name)] = ("counter", help_text)
+        self._counters.setdefault(self._name(name), {})
+
+    def gauge(self, name: str, help_text: str) -> None:
+        self._meta[self._name(name)] = ("gauge", help_text)
+        self._gauges.setdefault(self._name(name), {})
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self._meta[self._name(name)] = ("histogram", help_text)
+        self._buckets[self._name(name)] = tuple(buckets)
+        self._histograms.setdefault(self._name(name), {})
+
+    def add_collector(self, collector: Callable[[], Iterator[Tuple[str, Dict[str, str], float]]]) -> None:
+        """렌더링할 때마다 호출되어 (게이지 이름, 라벨, 값) 을 돌려주는 함수를 등록합니다."""
+        self._collectors.append(collector)
+
+    def inc(self, name: str, labels: Optional[Dict[str, str]] = None, value: float = 1.0) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters[self._name(name)]
+            series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        with self._lock:
+            self._gauges[self._name(name)][_label_key(labels)] = value
+
+    def add(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges[self._name(name)]
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        full_name = self._name(name)
+        buckets = self._buckets[full_name]
+        index = bisect_left(buckets, value)
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms[full_name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(len(buckets) + 1)
+            histogram.counts[index] += 1
+            histogram.total += value
+            histogram.count += 1
+
+    def observe_trace(self, name: str, trace: BatchTrace) -> None:
+        """
+        배치 단계 시간을 기록합니다. 패딩 후 길이가 비용을 정하므로 배치에서 가장 긴 입력의 구간으로 라벨을 붙입니다.
+        """
+        known = [n for n in trace.token_lengths if n is not None]
+        bucket = token_length_bucket(max(known) if known else None)
+        for stage, elapsed_ms in trace.stages_ms.items():
+            self.observe(name, elapsed_ms / 1000.0, {"stage": stage, "length_bucket": bucket})
+
+    @contextmanager
+    def time(self, name: str, labels: Optional[Dict[str, str]] = None) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, labels)
+
+    def render(self) -> str:
+        """등록된 모든 지표를 Prometheus text exposition format(0.0.4) 으로 만듭니다."""
+        collected: Dict[str, Dict[LabelKey, float]] = {}
+        for collector in self._collectors:
+            for name, labels, value in collector():
+                collected.setdefault(self._name(name), {})[_label_key(labels)] = value
+
+        lines: List[str] = []
+        with self._lock:
+            for full_name, (kind, help_text) in self._meta.items():
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                if kind == "histogram":
+                    buckets = self._buckets[full_name]
+                    for key, histogram in self._histograms[full_name].items():
+                        cumulative = 0
+                        for bound, count in zip(buckets, histogram.counts):
+                            cumulative += count
+                            lines.append(f"{full_name}_bucket{_format_labels(key + (('le', _format_value(bound)),))} {cumulative}")
+                        lines.append(f"{full_name}_bucket{_format_labels(key + (('le', '+Inf'),))} {histogram.count}")
+                        lines.append(f"{full_name}_sum{_format_labels(key)} {_format_value(histogram.total)}")
+                        lines.append(f"{full_name}_count{_format_labels(key)} {histogram.count}")
+                    continue
+                series = self._counters.get(full_name) or self._gauges.get(full_name) or {}
+                series = {**series, **collected.get(full_name, {})}
+                for key, value in series.items():
+                    lines.append(f"{full_name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items())) if labels else ()
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for k, v in key
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    # Prometheus 텍스트 형식은 무한대와 NaN 을 +Inf/-Inf/NaN 으로 씁니다 (repr 은 inf/nan).
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
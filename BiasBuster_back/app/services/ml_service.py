@@ -1,73 +1,154 @@
 # app/services/ml_service.py
-import pickle
 import os
 import logging
-from typing import Dict, Any
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import torch
+from transformers import AutoTokenizer
+
+from .backends import load_sequence_classifier
+from .metrics import BatchTrace
+from .tokenization import MAX_LENGTH, encode_texts, length_buckets, pad_batch
+from .windowing import WindowConfig, windowed_probabilities
 
 logger = logging.getLogger(__name__)
 
+# 학습 시 사용한 라벨 순서 (0: 좌파/진보, 1: 중도, 2: 우파/보수)
+LABEL_MAP = {
+    0: "좌파/진보",
+    1: "중도",
+    2: "우파/보수"
+}
+NEUTRAL_LABEL = "중도"
+
+
+def label_name(index: int) -> str:
+    return LABEL_MAP.get(index, f"알 수 없는 카테고리_{index}")
+
+
 class MLService:
-    def __init__(self, model_path: str):
-        self.model = self._load_model(model_path)
-        self.tokenizer = None 
+    """
+    Hugging Face 형식으로 저장된 정치 편향 분류 모델을 감싼 추론 엔진.
+    기사 여러 개를 한 번의 forward 로 점수화하고, 범주는 그 확률의 argmax 로 정합니다.
+    app/main.py 와 /api/v1 라우터가 모두 이 클래스를 통해 추론합니다.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        backend: str = "torch",
+        onnx_path: Optional[str] = None,
+        max_length: int = MAX_LENGTH,
+        max_batch_tokens: int = 8192,
+        window_config: Optional[WindowConfig] = None,
+        version: Optional[str] = None,
+    ):
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"정치 편향 모델 경로를 찾을 수 없습니다: {model_path}")
+        self.model_path = model_path
+        self.backend = backend
+        self.max_length = max_length
+        self.max_batch_tokens = max_batch_tokens
+        self.window_config = window_config
+        # 모델 레지스트리의 버전 이름(또는 모델 지문). 배치마다 BatchTrace 에 실려 응답과 지표에 표시됩니다.
+        self.version = version
+        self.load_phases_ms: Dict[str, float] = {}
+
+        started = time.perf_counter()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self.load_phases_ms["tokenizer_load"] = (time.perf_counter() - started) * 1000.0
+
+        started = time.perf_counter()
+        # backend 에 따라 fp32 / 동적 INT8 양자화 / ONNX Runtime 모델을 로드합니다.
+        self.model = load_sequence_classifier(model_path, backend, onnx_path)
+        self.load_phases_ms["model_load"] = (time.perf_counter() - started) * 1000.0
+        logger.info(f"모델을 성공적으로 로드했습니다: {model_path} (백엔드: {backend})")
+
+    def encode(self, texts: Sequence[str], max_length: Optional[int] = None) -> List[Dict[str, List[int]]]:
+        """텍스트를 패딩 없이 토크나이즈해 입력별 input_ids / attention_mask 목록으로 돌려줍니다."""
+        encodings = encode_texts(self.tokenizer, texts, max_length=max_length or self.max_length)
+        return [
+            {"input_ids": ids, "attention_mask": mask}
+            for ids, mask in zip(encodings["input_ids"], encodings["attention_mask"])
+        ]
 
-    def _load_model(self, model_path: str):
+    def forward_logits(self, features: List[Dict[str, List[int]]]) -> torch.Tensor:
         """
-        지정된 경로에서 AI 모델을 로드합니다.
-        실제 AI 모델 로딩 로직을 여기에 구현해야 합니다.
+        토크나이즈된 입력을 길이 버킷별로 동적 패딩해 모델에 통과시키고, 입력 순서대로 로짓 [N, C] 를 반환합니다.
         """
-        if not os.path.exists(model_path):
-            logger.warning(f"모델 파일이 존재하지 않습니다: {model_path}. 더미 모델을 로드합니다.")
-            return self._create_dummy_model()
-
-        try:
-            with open(model_path, 'rb') as f:
-                model = pickle.load(f)
-            logger.info(f"모델을 성공적으로 로드했습니다: {model_path}")
-            return model
-        except Exception as e:
-            logger.error(f"모델 로드 중 오류 발생 ({model_path}): {e}")
-            logger.warning("더미 모델을 로드합니다.")
-            return self._create_dummy_model()
-
-    def _create_dummy_model(self):
+        lengths = [len(f["input_ids"]) for f in features]
+        logits: List[torch.Tensor] = [None] * len(features)
+        for indices in length_buckets(lengths, max_batch_size=len(features), max_tokens=self.max_batch_tokens):
+            inputs = pad_batch(self.tokenizer, [features[i] for i in indices])
+            with torch.no_grad():
+                outputs = self.model(**inputs)
+            for idx, row in zip(indices, outputs.logits):
+                logits[idx] = row
+        return torch.stack(logits)
+
+    def predict_proba_batch(self, texts: Sequence[str], trace: Optional[BatchTrace] = None) -> List[List[float]]:
         """
-        모델 로드 실패 시 또는 테스트를 위한 더미 모델을 생성합니다.
+        텍스트마다 라벨 순서대로의 확률 분포를 반환합니다. 모든 텍스트가 한 번의 forward 로 처리됩니다.
+        trace 가 주어지면 단계별 소요 시간과 입력별 토큰 수를 기록합니다.
         """
-        logger.info("더미 ML 모델을 생성합니다.")
-        class DummyModel:
-            def predict(self, text: str) -> str:
-                if "정부" in text and "비판" in text:
-                    return "우편향"
-                elif "시민단체" in text and "옹호" in text:
-                    return "좌편향"
-                return "중립"
-
-            def predict_proba(self, text: str) -> Dict[str, float]:
-                # 더미 확률
-                bias_type = self.predict(text)
-                if bias_type == "우편향":
-                    return {"중립": 0.2, "좌편향": 0.1, "우편향": 0.7}
-                elif bias_type == "좌편향":
-                    return {"중립": 0.2, "좌편향": 0.7, "우편향": 0.1}
-                return {"중립": 0.8, "좌편향": 0.1, "우편향": 0.1}
-
-        return DummyModel()
+        trace = trace if trace is not None else BatchTrace()
+        trace.model_version = self.version
+        if not texts:
+            return []
 
-    def analyze_bias(self, text: str) -> Dict[str, Any]:
+        if self.window_config is not None:
+            # 긴 기사는 512 토큰에서 자르지 않고 슬라이딩 윈도우 전체를 점수화합니다.
+            # 윈도우 분할과 풀링은 forward 사이사이에 일어나므로 전체 시간에서 forward 시간을 뺀 값을 windowing 으로 기록합니다.
+            def timed_forward(features):
+                with trace.stage("forward"):
+                    return self.forward_logits(features)
+
+            started = time.perf_counter()
+            probabilities = windowed_probabilities(self.tokenizer, texts, timed_forward, self.window_config)
+            trace.add("windowing", (time.perf_counter() - started) * 1000.0 - trace.stages_ms.get("forward", 0.0))
+            trace.token_lengths = [None] * len(texts)
+            return probabilities
+
+        logits = self._traced_logits(texts, trace)
+        with trace.stage("softmax"):
+            return torch.softmax(logits, dim=1).tolist()
+
+    def predict_logits_batch(
+        self,
+        texts: Sequence[str],
+        trace: Optional[BatchTrace] = None,
+        max_length: Optional[int] = None,
+    ) -> List[List[float]]:
         """
-        입력된 텍스트의 편향성을 분석합니다.
-        실제 AI 모델 예측 로직을 여기에 구현해야 합니다.
+        텍스트마다 softmax 전 로짓을 반환합니다. 문단 단위 증분 분석에서 문단 로짓을 캐시해 두고
+        기사 점수를 다시 합칠 때 씁니다. 윈도우 모드와 무관하게 텍스트마다 max_length(없으면 모델 설정값)에서 자릅니다.
         """
-        if not self.model:
-            raise RuntimeError("ML 모델이 로드되지 않았습니다.")
+        trace = trace if trace is not None else BatchTrace()
+        trace.model_version = self.version
+        if not texts:
+            return []
+        return self._traced_logits(texts, trace, max_length).tolist()
 
-        predicted_category = self.model.predict(text)
-        predicted_proba = self.model.predict_proba(text)
+    def _traced_logits(self, texts: Sequence[str], trace: BatchTrace, max_length: Optional[int] = None) -> torch.Tensor:
+        with trace.stage("tokenize"):
+            features = self.encode(texts, max_length)
+        trace.token_lengths = [len(f["input_ids"]) for f in features]
+        with trace.stage("forward"):
+            return self.forward_logits(features)
 
-        bias_score = round(max(predicted_proba.values()) * 100, 2)
-        if predicted_category == "중립":
-            bias_score = 50.0 
+    def analyze_bias(self, text: str) -> Dict[str, Any]:
+        """
+        입력된 텍스트의 편향성을 분석합니다. 범주와 점수는 같은 forward 결과에서 구합니다.
+        """
+        probabilities = self.predict_proba_batch([text])[0]
+        best = max(range(len(probabilities)), key=lambda i: probabilities[i])
+        predicted_category = label_name(best)
+        predicted_proba = {label_name(i): p for i, p in enumerate(probabilities)}
+
+        bias_score = round(probabilities[best] * 100, 2)
+        if predicted_category == NEUTRAL_LABEL:
+            bias_score = 50.0
 
         keywords = []
         if "정부" in text: keywords.append("정부")
@@ -75,10 +156,9 @@ class MLService:
         if "비판" in text: keywords.append("비판")
         if "옹호" in text: keywords.append("옹호")
 
-
         return {
             "bias_score": bias_score,
             "bias_category": predicted_category,
             "keywords": keywords,
             "detailed_analysis": {"probabilities": predicted_proba}
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,73 @@
+# app/services/model_registry.py
+# 로컬 디렉토리 기반 모델 레지스트리. <root>/<버전>/ 에 학습된 모델 디렉토리를 버전별로 두고,
+# <root>/CURRENT 파일에 서빙할 버전 이름을 적습니다. 서버는 CURRENT 가 바뀌면(또는 관리자 API 호출 시)
+# 새 버전을 백그라운드에서 로드/워밍업한 뒤 교체합니다. scripts/model_registry.py 로 버전을 등록/전환합니다.
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+CURRENT_FILE = "CURRENT"
+
+_VERSION_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+_DIGITS = re.compile(r"(\d+)")
+
+
+def _natural_key(name: str):
+    # v2 < v10 이 되도록 숫자 부분은 숫자로 비교합니다.
+    return [int(part) if part.isdigit() else part for part in _DIGITS.split(name)]
+
+
+def validate_version(version: str) -> str:
+    if not _VERSION_NAME.match(version or ""):
+        raise ValueError(f"버전 이름은 영문/숫자/._- 만 쓸 수 있습니다: {version!r}")
+    return version
+
+
+class ModelRegistry:
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def versions(self) -> List[str]:
+        """config.json 이 있는(로드 가능한) 버전 디렉토리 이름을 이름 순(숫자는 크기 순)으로 돌려줍니다."""
+        if not os.path.isdir(self.root):
+            return []
+        names = [
+            name for name in os.listdir(self.root)
+            if _VERSION_NAME.match(name) and os.path.exists(os.path.join(self.root, name, "config.json"))
+        ]
+        return sorted(names, key=_natural_key)
+
+    def path(self, version: str) -> str:
+        path = os.path.join(self.root, validate_version(version))
+        if not os.path.exists(os.path.join(path, "config.json")):
+            raise KeyError(f"레지스트리에 없는 모델 버전입니다: {version}")
+        return path
+
+    def current(self) -> Optional[str]:
+        """CURRENT 에 적힌 버전. CURRENT 가 없으면 가장 최근(이름 순 마지막) 버전을 씁니다."""
+        try:
+            with open(os.path.join(self.root, CURRENT_FILE), encoding="utf8") as f:
+                version = f.read().strip()
+            if version:
+                return version
+        except FileNotFoundError:
+            pass
+        versions = self.versions()
+        return versions[-1] if versions else None
+
+    def set_current(self, version: str) -> None:
+        """CURRENT 를 임시 파일에 쓴 뒤 rename 으로 바꿔, 감시 중인 서버가 반쯤 쓰인 파일을 읽지 않게 합니다."""
+        self.path(version)
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = os.path.join(self.root, f".{CURRENT_FILE}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf8") as f:
+            f.write(version + "\n")
+        os.replace(tmp_path, os.path.join(self.root, CURRENT_FILE))
+
+    def version_of(self, model_path: str) -> Optional[str]:
+        """model_path 가 이 레지스트리의 버전 디렉토리면 버전 이름을, 아니면 None 을 돌려줍니다."""
+        path = os.path.abspath(model_path)
+        return os.path.basename(path) if os.path.dirname(path) == self.root else None
+
+    def describe(self) -> Dict[str, Any]:
+        return {"root": self.root, "current": self.current(), "versions": self.versions()}
@@ -0,0 +1,58 @@
+# app/services/paragraphs.py
+# 실시간으로 갱신되는 기사/블로그가 전체 본문을 다시 보내도 바뀐 문단만 다시 분석하도록
+# 본문을 문단으로 나누고, 문단별 결과(로짓, 신뢰도 규칙 매칭)를 기사 단위로 합치는 헬퍼.
+import re
+from typing import Any, Dict, List, NamedTuple, Sequence
+
+import torch
+
+from .windowing import pool_logits
+
+_LINE = re.compile(r"[^\n]+")
+
+
+class Paragraph(NamedTuple):
+    text: str
+    start: int  # 기사 본문에서 문단이 시작하는 문자 위치
+    end: int
+
+
+def split_paragraphs(text: str, min_chars: int = 0) -> List[Paragraph]:
+    """
+    줄바꿈 기준으로 문단을 나눕니다. 앞뒤 공백은 위치를 유지한 채 잘라 내고, 빈 줄은 건너뜁니다.
+    min_chars 보다 짧은 줄(사진 설명, 소제목 등)은 다음 줄과 합쳐 forward 한 번에 너무 짧은 입력이 들어가지 않게 합니다.
+    """
+    paragraphs: List[Paragraph] = []
+    pending_start = None
+    for match in _LINE.finditer(text):
+        line = match.group(0)
+        stripped = line.strip()
+        if not stripped:
+            continue
+        start = match.start() + (len(line) - len(line.lstrip()))
+        end = match.start() + len(line.rstrip())
+        if pending_start is None:
+            pending_start = start
+        if end - pending_start >= min_chars:
+            paragraphs.append(Paragraph(text[pending_start:end], pending_start, end))
+            pending_start = None
+    if pending_start is not None:
+        # 마지막까지 min_chars 를 채우지 못한 줄은 직전 문단에 붙이고, 문단이 하나도 없으면 그대로 둡니다.
+        end = len(text.rstrip())
+        if paragraphs:
+            last = paragraphs.pop()
+            paragraphs.append(Paragraph(text[last.start:end], last.start, end))
+        else:
+            paragraphs.append(Paragraph(text[pending_start:end], pending_start, end))
+    return paragraphs
+
+
+def pool_paragraph_probabilities(logits: Sequence[Sequence[float]], token_counts: Sequence[int]) -> List[float]:
+    """문단별 로짓을 토큰 수로 가중 평균해 기사 전체의 확률 분포로 만듭니다."""
+    pooled = pool_logits(torch.tensor(logits, dtype=torch.float32), list(token_counts), "length_weighted")
+    return torch.softmax(pooled, dim=-1).tolist()
+
+
+def offset_matches(paragraph: Paragraph, matches: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """문단 기준 위치로 저장된 신뢰도 규칙 매칭을 기사 본문 기준 위치로 옮깁니다."""
+    return [{**m, "start": m["start"] + paragraph.start, "end": m["end"] + paragraph.start} for m in matches]
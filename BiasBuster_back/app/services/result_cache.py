@@ -0,0 +1,248 @@
+# app/services/result_cache.py
+# 같은 기사가 반복 요청될 때 분석을 다시 하지 않도록 결과를 저장하는 2단(메모리 LRU + SQLite) 캐시.
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+# 가중치 파일 전체를 해시하면 시작이 느려지므로 앞뒤 일부와 크기만 사용합니다.
+_FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 NFKC 정규화 후 연속 공백을 한 칸으로 줄여, 표기만 다른 같은 기사를 같은 키로 만듭니다."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def _update_with_weights(digest, name: str, weight_path: str) -> None:
+    size = os.path.getsize(weight_path)
+    digest.update(f"{name}:{size}".encode())
+    with open(weight_path, "rb") as f:
+        digest.update(f.read(_FINGERPRINT_SAMPLE_BYTES))
+        if size > _FINGERPRINT_SAMPLE_BYTES:
+            f.seek(max(size - _FINGERPRINT_SAMPLE_BYTES, _FINGERPRINT_SAMPLE_BYTES))
+            digest.update(f.read())
+
+
+def model_fingerprint(model_path: str, extra: Iterable[str] = (), onnx_path: Optional[str] = None) -> str:
+    """
+    config.json 과 가중치 파일(앞뒤 샘플 + 크기)로 모델 지문을 만듭니다.
+    extra 에는 결과에 영향을 주는 추론 설정(윈도우 모드 등)을 넣어 설정이 바뀌면 캐시가 갈리게 합니다.
+    onnx 백엔드면 onnx_path 의 ONNX 파일도 넣어, 다시 내보낸 ONNX 모델이 이전 캐시 항목을 쓰지 않게 합니다.
+    """
+    digest = hashlib.sha256()
+    config_path = os.path.join(model_path, "config.json")
+    if os.path.exists(config_path):
+        with open(config_path, "rb") as f:
+            digest.update(f.read())
+
+    for name in ("model.safetensors", "pytorch_model.bin"):
+        weight_path = os.path.join(model_path, name)
+        if os.path.exists(weight_path):
+            _update_with_weights(digest, name, weight_path)
+    if onnx_path and os.path.exists(onnx_path):
+        _update_with_weights(digest, "onnx", onnx_path)
+
+    for item in extra:
+        digest.update(str(item).encode())
+    return digest.hexdigest()[:16]
+
+
+class _DiskTier:
+    """재시작 후에도 남는 SQLite 저장소. 호출은 이벤트 루프 밖(스레드)에서 이뤄집니다."""
+
+    def __init__(self, path: str, ttl_seconds: float):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite 연결은 fork 를 넘어 공유하면 안 되므로 (scripts/serve.py) 프로세스마다 처음 쓸 때 엽니다.
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._pid = os.getpid()
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        """(값, 만료되어 삭제했는지) 를 반환합니다."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT value, created_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None, False
+            if self.ttl_seconds > 0 and time.time() - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                conn.commit()
+                return None, True
+            return json.loads(row[0]), False
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+class ResultCache:
+    """
+    정규화된 텍스트 + 모델 지문으로 키를 만드는 분석 결과 캐시.
+    메모리 LRU(크기/TTL 제한) 뒤에 선택적으로 SQLite 디스크 계층을 두고,
+    같은 키로 동시에 들어온 요청은 하나만 계산하고 나머지는 그 결과를 기다립니다.
+    normalize_keys 를 끄면 공백까지 같은 텍스트만 같은 키가 됩니다 (본문 내 위치를 함께 저장하는 문단 캐시용).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        disk_path: Optional[str] = None,
+        normalize_keys: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.namespace = ""
+        self.normalize_keys = normalize_keys
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._disk = _DiskTier(disk_path, ttl_seconds) if disk_path else None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def key_for(self, text: str, scope: str = "") -> str:
+        """scope 가 주어지면 같은 텍스트라도 다른 방식으로 계산한 결과(예: 문단 풀링 점수)와 키가 갈립니다."""
+        body = normalize_text(text) if self.normalize_keys else text
+        payload = f"{self.namespace}\0{scope}\0{body}" if scope else f"{self.namespace}\0{body}"
+        return hashlib.sha256(payload.encode("utf8")).hexdigest()
+
+    def _memory_get(self, key: str) -> Optional[Any]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self.ttl_seconds > 0 and time.monotonic() > expires_at:
+            del self._memory[key]
+            self._counters["expirations"] += 1
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_set(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self._memory_get(key)
+        if value is not None:
+            self._counters["memory_hits"] += 1
+            return value
+        if self._disk is not None:
+            value, expired = await asyncio.to_thread(self._disk.get, key)
+            if expired:
+                self._counters["expirations"] += 1
+            if value is not None:
+                self._counters["disk_hits"] += 1
+                self._memory_set(key, value)
+                return value
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        self._memory_set(key, value)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.set, key, value)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        should_store: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """
+        캐시에 있으면 바로 돌려주고, 없으면 compute() 를 한 번만 실행해 결과를 저장합니다.
+        compute() 는 요청과 분리된 작업에서 실행되므로, 처음 요청한 클라이언트가 연결을 끊어도
+        같은 키를 기다리는 다른 요청은 계속 결과를 받습니다.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._counters["coalesced"] += 1
+        else:
+            self._counters["misses"] += 1
+            pending = asyncio.ensure_future(self._compute_and_store(key, compute, should_store))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda task: self._finish_inflight(key, task))
+        return await asyncio.shield(pending)
+
+    async def _compute_and_store(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        should_store: Callable[[Any], bool],
+    ) -> Any:
+        value = await compute()
+        if should_store(value):
+            await self.set(key, value)
+        return value
+
+    def _finish_inflight(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리는 요청이 모두 취소됐을 때 "exception was never retrieved" 경고가 나지 않도록 소비해 둡니다.
+        if not task.cancelled():
+            task.exception()
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._counters["memory_hits"] + self._counters["disk_hits"] + self._counters["misses"]
+        hits = self._counters["memory_hits"] + self._counters["disk_hits"]
+        return {
+            "namespace": self.namespace,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "disk_enabled": self._disk is not None,
+            "inflight": len(self._inflight),
+            "hit_rate": hits / lookups if lookups else 0.0,
+            **self._counters,
+        }
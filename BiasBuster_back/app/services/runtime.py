@@ -0,0 +1,28 @@
+# app/services/runtime.py
+# 한 서버에서 여러 프로세스가 추론할 때 코어를 나눠 쓰도록 torch 스레드 수를 정하는 헬퍼.
+import os
+from typing import Dict
+
+import torch
+
+
+def resolve_num_threads(num_threads: int, processes: int) -> int:
+    """
+    num_threads 가 0 이하이면 코어 수를 동시에 추론하는 프로세스(또는 스레드) 수로 나눈 값을 씁니다.
+    각자 전체 코어 수만큼 스레드를 띄우면 서로 코어를 빼앗아 오히려 느려집니다.
+    """
+    if num_threads > 0:
+        return num_threads
+    return max(1, (os.cpu_count() or 1) // max(1, processes))
+
+
+def configure_torch_threads(num_threads: int, interop_threads: int = 0) -> Dict[str, int]:
+    """현재 프로세스의 intra-op / inter-op 스레드 수를 설정하고 실제 적용된 값을 반환합니다."""
+    torch.set_num_threads(num_threads)
+    if interop_threads > 0 and torch.get_num_interop_threads() != interop_threads:
+        try:
+            torch.set_num_interop_threads(interop_threads)
+        except RuntimeError:
+            # inter-op 스레드 풀은 병렬 작업이 한 번이라도 실행된 뒤에는 바꿀 수 없습니다.
+            pass
+    return {"intra_op": torch.get_num_threads(), "interop": torch.get_num_interop_threads()}
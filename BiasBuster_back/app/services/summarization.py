@@ -0,0 +1,258 @@
+# app/services/summarization.py
+# KoBART 요약을 /analyze 응답과 분리된 백그라운드 작업으로 처리하는 작업 큐.
+# /analyze 는 작업 ID 만 받아 바로 응답하고, 요약은 별도 실행기에서 배치로 생성되어
+# GET /summaries/{job_id} 폴링 또는 콜백 URL 로 전달됩니다.
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from .batching import MicroBatcher, QueueFullError
+from .result_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+
+class Summarizer:
+    """
+    요약 모델(KoBART 등 seq2seq)을 처음 요약할 때 로드합니다. 서버 시작이나 편향 분석 모델 로드를 늦추지 않고,
+    process 실행기에서는 요약 워커 프로세스 안에서만 로드됩니다.
+    """
+
+    def __init__(self, model_path: str, max_input_length: int = 1024, max_new_tokens: int = 128, num_beams: int = 4):
+        self.model_path = model_path
+        self.max_input_length = max_input_length
+        self.max_new_tokens = max_new_tokens
+        self.num_beams = num_beams
+        self.tokenizer = None
+        self.model = None
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        with self._lock:
+            if self.model is not None:
+                return
+            from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+            started = time.perf_counter()
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+            model = AutoModelForSeq2SeqLM.from_pretrained(self.model_path, low_cpu_mem_usage=True)
+            model.eval()
+            self.model = model
+            logger.info(f"요약 모델 로드 완료: {self.model_path} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    def summarize_batch(self, texts: Sequence[str]) -> List[str]:
+        """텍스트 여러 개를 배치 내 최장 길이로 패딩해 한 번의 generate 로 요약합니다."""
+        import torch
+
+        if not texts:
+            return []
+        self.load()
+        inputs = self.tokenizer(
+            list(texts),
+            truncation=True,
+            max_length=self.max_input_length,
+            padding="longest",
+            return_token_type_ids=False,
+            return_tensors="pt",
+        )
+        with torch.no_grad():
+            output_ids = self.model.generate(
+                **inputs,
+                max_new_tokens=self.max_new_tokens,
+                num_beams=self.num_beams,
+                early_stopping=self.num_beams > 1,
+            )
+        return [text.strip() for text in self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)]
+
+
+@dataclass
+class SummaryJob:
+    job_id: str
+    status: str = "queued"
+    summary: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    callback_urls: List[str] = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "summary": self.summary,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class SummaryJobQueue:
+    """
+    요약 작업을 만들고 상태를 보관하는 큐. 실제 생성은 MicroBatcher 가 여러 작업을 묶어
+    runner(요약 전용 실행기) 에서 batch_fn 한 번으로 처리하며, 대기열이 가득 차면 작업을 만들지 않습니다.
+    작업 ID 는 정규화된 본문의 해시라서 같은 기사를 다시 요청하면 진행 중이거나 끝난 작업을 그대로 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[str]], List[str]],
+        runner: Callable[..., Awaitable[List[str]]],
+        max_batch_size: int = 4,
+        max_wait_ms: float = 50.0,
+        max_queue_size: int = 32,
+        concurrency: int = 1,
+        max_jobs: int = 1024,
+        ttl_seconds: float = 3600.0,
+        notify: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+    ):
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self.namespace = ""
+        self.max_queue_size = max(max_queue_size, 0)
+        self._runner = runner
+        self._notify = notify
+        self._batcher = MicroBatcher(
+            batch_fn,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+            concurrency=concurrency,
+            runner=self._run_batch,
+        )
+        self._jobs: "OrderedDict[str, SummaryJob]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+        # 등록됐지만 아직 요약이 끝나지 않은(대기 + 실행 중) 작업 수. submit() 에서 바로 자리를 잡아 두므로
+        # 같은 틱에 몰린 요청도, 이미 실행 중인 배치도 대기열 한도에 함께 계산됩니다.
+        self._pending = 0
+        self._counters = {"submitted": 0, "deduplicated": 0, "rejected": 0, "done": 0, "failed": 0}
+
+    async def start(self) -> None:
+        await self._batcher.start()
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await self._batcher.stop()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def job_id_for(self, text: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{normalize_text(text)}".encode("utf8")).hexdigest()[:32]
+
+    def get(self, job_id: str) -> Optional[SummaryJob]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job.finished and self.ttl_seconds > 0 and time.time() - job.finished_at > self.ttl_seconds:
+            del self._jobs[job_id]
+            return None
+        return job
+
+    def submit(self, text: str, callback_url: Optional[str] = None) -> Optional[SummaryJob]:
+        """
+        요약 작업을 등록하고 바로 돌려줍니다. 같은 본문의 작업이 이미 있으면 그 작업을 돌려주고,
+        요약 대기열이 가득 차 있으면 편향 분석 응답을 늦추지 않도록 작업을 만들지 않고 None 을 돌려줍니다.
+        """
+        job_id = self.job_id_for(text)
+        job = self.get(job_id)
+        if job is not None and job.status != "failed":
+            self._counters["deduplicated"] += 1
+            if callback_url:
+                if job.finished:
+                    self._spawn(self._deliver(callback_url, job))
+                else:
+                    job.callback_urls.append(callback_url)
+            return job
+
+        if self.max_queue_size and self._pending >= self.max_queue_size:
+            self._counters["rejected"] += 1
+            return None
+        self._pending += 1
+
+        job = SummaryJob(job_id, callback_urls=[callback_url] if callback_url else [])
+        self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        self._evict()
+        self._counters["submitted"] += 1
+        self._spawn(self._process(job, text))
+        return job
+
+    def _evict(self) -> None:
+        # 끝난 작업부터 오래된 순으로 지웁니다. 진행 중인 작업은 지우지 않습니다.
+        if len(self._jobs) <= self.max_jobs:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished]:
+            if len(self._jobs) <= self.max_jobs:
+                break
+            del self._jobs[job_id]
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch_fn, items: List[Tuple[str, str]]) -> List[str]:
+        for job_id, _ in items:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.status = "running"
+        return await self._runner(batch_fn, [text for _, text in items])
+
+    async def _process(self, job: SummaryJob, text: str) -> None:
+        try:
+            job.summary = await self._batcher.submit((job.job_id, text))
+            job.status = "done"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "요약 작업이 취소되었습니다."
+            raise
+        except QueueFullError as e:
+            job.status = "failed"
+            job.error = str(e)
+        except Exception as e:
+            logger.error(f"요약 생성 중 오류 발생 (job={job.job_id}): {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            self._pending -= 1
+            job.finished_at = time.time()
+            self._counters[job.status] += 1
+
+        for url in job.callback_urls:
+            await self._deliver(url, job)
+        job.callback_urls.clear()
+
+    async def _deliver(self, url: str, job: SummaryJob) -> None:
+        if self._notify is None:
+            return
+        try:
+            await self._notify(url, job.to_dict())
+        except Exception as e:
+            logger.warning(f"요약 콜백 전송 실패 ({url}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        statuses = {status: 0 for status in JOB_STATUSES}
+        for job in self._jobs.values():
+            statuses[job.status] += 1
+        return {"jobs": len(self._jobs), "max_jobs": self.max_jobs, "pending": self._pending, "statuses": statuses,
+                **self._counters, "batcher": self._batcher.stats()}
+
+
+async def post_callback(url: str, payload: Dict[str, Any], timeout: float = 5.0) -> None:
+    """끝난 요약 작업을 콜백 URL 로 POST 합니다."""
+    import httpx
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
@@ -0,0 +1,65 @@
+# app/services/tokenization.py
+# 서빙(app/main.py), 오프라인 예측(scripts/predict.py), 학습(scripts/train.py)이 함께 쓰는 토크나이즈 헬퍼.
+# 모든 입력을 512 토큰으로 패딩하지 않고, 배치 안에서 가장 긴 시퀀스 길이까지만 패딩합니다.
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+MAX_LENGTH = 512
+
+
+def encode_texts(tokenizer, texts: Sequence[str], max_length: int = MAX_LENGTH) -> Dict[str, List[List[int]]]:
+    """
+    텍스트를 패딩 없이 토크나이즈합니다. 길이 계산과 버킷팅을 위해 한 번만 토크나이즈하고,
+    실제 텐서는 pad_batch 로 버킷마다 만듭니다.
+    """
+    return tokenizer(list(texts), truncation=True, max_length=max_length, padding=False)
+
+
+def pad_batch(tokenizer, features: List[Dict[str, Any]], pad_to_multiple_of: Optional[int] = None, return_tensors: str = "pt"):
+    """인코딩된 샘플 리스트를 배치 내 최장 길이로 패딩해 텐서로 만듭니다."""
+    return tokenizer.pad(features, padding="longest", pad_to_multiple_of=pad_to_multiple_of, return_tensors=return_tensors)
+
+
+def tokenize_batch(tokenizer, texts: Sequence[str], max_length: int = MAX_LENGTH, return_tensors: str = "pt"):
+    """한 번에 모델에 넣을 텍스트 배치를 동적 패딩으로 토크나이즈합니다."""
+    return tokenizer(list(texts), truncation=True, max_length=max_length, padding="longest", return_tensors=return_tensors)
+
+
+def length_buckets(lengths: Sequence[int], max_batch_size: int, max_tokens: Optional[int] = None) -> Iterator[List[int]]:
+    """
+    토큰 길이 기준으로 정렬한 인덱스를 배치 단위로 묶어 돌려줍니다.
+    비슷한 길이끼리 묶이므로 패딩 낭비가 줄고, max_tokens 가 주어지면
+    (배치 크기 x 배치 내 최장 길이) 가 그 값을 넘지 않도록 배치를 나눕니다.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    bucket: List[int] = []
+    for idx in order:
+        longest = lengths[idx]  # 오름차순 정렬이므로 새로 들어오는 항목이 가장 깁니다.
+        too_many_tokens = max_tokens is not None and bucket and (len(bucket) + 1) * longest > max_tokens
+        if len(bucket) >= max_batch_size or too_many_tokens:
+            yield bucket
+            bucket = []
+        bucket.append(idx)
+    if bucket:
+        yield bucket
+
+
+def iter_bucketed_batches(
+    tokenizer,
+    texts: Sequence[str],
+    max_batch_size: int,
+    max_length: int = MAX_LENGTH,
+    max_tokens: Optional[int] = None,
+    return_tensors: str = "pt",
+):
+    """
+    텍스트를 길이 버킷별로 동적 패딩한 배치로 만들어 (원본 인덱스 리스트, 배치 텐서) 쌍을 순서대로 돌려줍니다.
+    호출자는 인덱스를 이용해 결과를 원래 순서로 되돌려 놓아야 합니다.
+    """
+    encodings = encode_texts(tokenizer, texts, max_length=max_length)
+    input_ids = encodings["input_ids"]
+    keys = list(encodings.keys())
+    lengths = [len(ids) for ids in input_ids]
+
+    for indices in length_buckets(lengths, max_batch_size, max_tokens=max_tokens):
+        features = [{key: encodings[key][i] for key in keys} for i in indices]
+        yield indices, pad_batch(tokenizer, features, return_tensors=return_tensors)
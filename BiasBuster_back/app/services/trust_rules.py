@@ -0,0 +1,99 @@
+# app/services/trust_rules.py
+# 기사 신뢰도 규칙을 import 시점에 한 번만 컴파일해 두고 재사용하는 규칙 엔진.
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# 규칙 집합이 바뀌면 올려서 결과 캐시 키가 갈리도록 합니다.
+RULES_VERSION = "2"
+
+# 반복되는 ".*" 는 한 줄짜리 긴 기사에서 과도한 역추적을 일으키므로 최대 길이를 제한합니다.
+_GAP = r".{0,80}?"
+
+# (이유, 정규식, 설명, 사전 필터용 필수 키워드들)
+# 키워드는 해당 정규식이 매칭될 때 반드시 포함되는 문자열이어야 합니다.
+TRUST_RULES: List[Tuple[str, str, str, Tuple[str, ...]]] = [
+    ("인용 출처 불분명", r"\b관계자[는가]\s+말했다", "불분명한 '관계자' 인용. 구체적인 출처 명시 부족.", ("관계자",)),
+    ("인용 출처 불분명", r"\b전문가[들은는]?\s+(우려|경고|지적|분석했다|제기했다)", "익명 '전문가' 의견. 어떤 분야의 전문가인지, 혹은 신뢰할 수 있는 단체 소속인지 불분명.", ("전문가",)),
+    ("인용 출처 불분명", r"\b일각에서는", "'일각'이라는 불분명한 주체. 누가, 왜 그렇게 주장하는지 불명확.", ("일각에서는",)),
+    ("인용 출처 불분명", r"\b소식통[에따르면]?", "'소식통'이라는 불분명한 출처. 정보의 신빙성 확인 필요.", ("소식통",)),
+    ("인용 출처 불분명", r"\b익명의\s+[가-힣]+\s*에\s+따르면", "익명의 정보원 인용. 정보의 진위 확인 어려움.", ("익명의",)),
+
+    ("최신 정보 미반영 또는 오래된 데이터 사용", r"(20[0-1][0-9]|202[0-3])년(도)?\s*(기준|통계|자료|연구|조사)(에따르면)?", "2000년대~2023년 데이터 사용. 최신 정보가 아닐 수 있음.", ("년",)),
+    ("최신 정보 미반영 또는 오래된 데이터 사용", r"\b수년\s*전\b", "불분명한 과거 시점 언급. 정확한 시점 확인 필요.", ("수년",)),
+    ("최신 정보 미반영 또는 오래된 데이터 사용", rf"\b구체적인\s+날짜\s*없이\s+{_GAP}발표", "구체적 날짜 없는 발표 인용. 정보의 시점 및 맥락 확인 필요.", ("구체적인",)),
+
+    ("공신력 낮은 매체 인용 또는 자가 출처", r"출처:\s*(자극적인뉴스|가짜뉴스일보|미확인방송|찌라시|커뮤니티|온라인\s*게시판)", "공신력 낮은 출처 인용. 정보의 신뢰성 검증 필요.", ("출처:",)),
+    ("공신력 낮은 매체 인용 또는 자가 출처", r"\b(온라인|인터넷)\s*커뮤니티[에서는]?", "검증되지 않은 온라인 커뮤니티 인용. 루머나 왜곡된 정보일 가능성.", ("커뮤니티",)),
+    ("공신력 낮은 매체 인용 또는 자가 출처", r"\b(개인의\s*견해|주관적인\s*판단|일방적인\s*주장)\b", "객관성 부족한 서술. 사실이 아닌 개인의 의견 강조.", ("개인의", "주관적인", "일방적인")),
+    ("공신력 낮은 매체 인용 또는 자가 출처", r"(\b[가-힣]+[뉴스신문통신]|이\s*매체는)\s+단독보도했다", "매체 자체의 단독 보도 강조. 교차 검증을 통해 사실 여부 확인 필요.", ("단독보도했다",)),
+
+    ("전문성 부족 또는 불분명한 기자/작성자", r"\b기자:\s*(홍길동|김아무개|익명)", "일반적인 이름 또는 익명 기자. 기자의 전문성이나 신뢰성 확인 필요.", ("기자:",)),
+    ("전문성 부족 또는 불분명한 기자/작성자", r"\b(견습|인턴)\s*기자", "경험 부족 기자. 기사의 완성도나 정확도에 영향 가능성.", ("견습", "인턴")),
+    ("전문성 부족 또는 불분명한 기자/작성자", r"\b[가-힣]+\s*통신원", "불분명한 통신원. 정보의 출처 및 신뢰성 확인 필요.", ("통신원",)),
+    ("전문성 부족 또는 불분명한 기자/작성자", r"\b무명\s*작성자", "무명 작성자. 정보의 책임 소재가 불분명.", ("무명",)),
+
+    ("과도한 일반화 또는 확대 해석", rf"\b모든\s+[가-힣]+\s+{_GAP}[다들]\b", "'모든', '다들' 등의 과도한 일반화. 특정 사례를 전체로 확대 해석.", ("모든",)),
+    ("과도한 일반화 또는 확대 해석", rf"\b항상\s*{_GAP}(할\s*것이다|했다)", "'항상', '항시' 등의 과도한 일반화. 극단적인 표현 사용.", ("항상",)),
+    ("과도한 일반화 또는 확대 해석", r"\b명백한\s*(사실|증거|결과)", "'명백한' 등의 단정적 표현 사용. 독자의 판단을 오도할 수 있음.", ("명백한",)),
+    ("과도한 일반화 또는 확대 해석", rf"\b틀림없이\s*{_GAP}(할\s*것이다|했다)", "'틀림없이' 등의 단정적 표현 사용. 확정되지 않은 사실을 단정적으로 서술.", ("틀림없이",)),
+
+    ("선정적/자극적 표현", rf"\b충격적인\s*{_GAP}(사실|진실)", "'충격적인', '경악할' 등의 선정적 표현. 감정적인 반응 유도.", ("충격적인",)),
+    ("선정적/자극적 표현", rf"\b경악할\s*{_GAP}(수준|일)", "'충격적인', '경악할' 등의 선정적 표현. 사실 전달보다 감정적 자극 목적.", ("경악할",)),
+    ("선정적/자극적 표현", r"\b(분노|격분|경고|우려)\s*폭발", "감정적 과장 표현. 독자의 감정을 과도하게 자극.", ("폭발",)),
+    ("선정적/자극적 표현", rf"\b(초토화|붕괴|궤멸|파괴)\s*{_GAP}(될\s*것이다|되었다)", "재앙적/극단적 표현. 사태를 과장하여 불안감 조성.", ("초토화", "붕괴", "궤멸", "파괴")),
+]
+
+
+class TrustMatch(NamedTuple):
+    reason: str
+    phrase: str
+    note: str
+    start: int
+    end: int
+
+
+class TrustRuleEngine:
+    """
+    규칙마다 필수 키워드를 두고, 모든 키워드를 하나의 정규식으로 묶어 본문을 한 번 훑어
+    등장한 키워드에 해당하는 규칙만 실행합니다. 각 규칙은 모든 매칭을 위치와 함께 돌려줍니다.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str, str, Tuple[str, ...]]] = TRUST_RULES):
+        self._rules = [(reason, re.compile(pattern, re.IGNORECASE), note) for reason, pattern, note, _ in rules]
+
+        self._rules_by_keyword: Dict[str, List[int]] = {}
+        for idx, (_, _, _, keywords) in enumerate(rules):
+            for keyword in keywords:
+                self._rules_by_keyword.setdefault(keyword.lower(), []).append(idx)
+
+        # 키워드를 전방 탐색으로 감싸 모든 위치에서 시도하므로 "수년" 안의 "년" 처럼 겹치는 키워드도 찾습니다.
+        # 같은 위치에서는 가장 긴 키워드만 잡히므로, 그 키워드의 접두어인 키워드 규칙도 함께 후보로 올립니다.
+        keywords = sorted(self._rules_by_keyword, key=len, reverse=True)
+        self._prefilter = re.compile("(?=(" + "|".join(re.escape(k) for k in keywords) + "))", re.IGNORECASE)
+        self._candidates_by_keyword: Dict[str, Set[int]] = {
+            keyword: {idx for other, ids in self._rules_by_keyword.items() if keyword.startswith(other) for idx in ids}
+            for keyword in keywords
+        }
+
+    def candidate_rules(self, text: str) -> List[int]:
+        """본문에 필수 키워드가 등장한 규칙의 인덱스를 규칙 정의 순서대로 반환합니다."""
+        found: Set[str] = {m.group(1).lower() for m in self._prefilter.finditer(text)}
+        candidates: Set[int] = set()
+        for keyword in found:
+            candidates.update(self._candidates_by_keyword[keyword])
+        return sorted(candidates)
+
+    def iter_matches(self, text: str, max_per_rule: Optional[int] = None) -> Iterator[TrustMatch]:
+        for idx in self.candidate_rules(text):
+            reason, pattern, note = self._rules[idx]
+            for count, match in enumerate(pattern.finditer(text)):
+                if max_per_rule is not None and count >= max_per_rule:
+                    break
+                yield TrustMatch(reason, match.group(0), note, match.start(), match.end())
+
+    def scan(self, text: str, max_per_rule: Optional[int] = None) -> List[TrustMatch]:
+        return list(self.iter_matches(text, max_per_rule=max_per_rule))
+
+
+# 규칙은 import 시점에 한 번만 컴파일합니다.
+default_engine = TrustRuleEngine()
@@ -0,0 +1,126 @@
+# app/services/windowing.py
+# 512 토큰을 넘는 긴 기사를 슬라이딩 윈도우로 나눠 모든 구간을 점수화하는 헬퍼.
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import torch
+
+POOLING_METHODS = ("mean", "length_weighted")
+
+
+@dataclass
+class WindowConfig:
+    window_size: int = 512  # 특수 토큰을 포함한 윈도우 길이
+    stride: int = 384  # 윈도우 시작 위치 간격 (window_size 보다 작으면 구간이 겹침)
+    max_windows: int = 8
+    pooling: str = "mean"
+    early_stop: bool = False
+    early_stop_chunk: int = 2  # 조기 종료 판단 전에 한 번에 처리할 윈도우 수
+    early_stop_tolerance: float = 0.02  # 직전 대비 확률 변화가 이보다 작으면 수렴으로 판단
+    early_stop_confidence: float = 0.9  # 최고 확률이 이 이상이면 바로 종료
+
+    def __post_init__(self):
+        if self.pooling not in POOLING_METHODS:
+            raise ValueError(f"지원하지 않는 풀링 방식입니다: {self.pooling} (허용: {', '.join(POOLING_METHODS)})")
+        if self.stride < 1 or self.max_windows < 1 or self.early_stop_chunk < 1:
+            raise ValueError("stride, max_windows, early_stop_chunk는 1 이상이어야 합니다.")
+
+
+def window_config_from_settings(settings) -> Optional[WindowConfig]:
+    """core.config 의 WINDOW_* 설정으로 WindowConfig 를 만듭니다. WINDOW_MODE 가 꺼져 있으면 None 입니다."""
+    if not settings.WINDOW_MODE:
+        return None
+    return WindowConfig(
+        window_size=settings.WINDOW_SIZE,
+        stride=settings.WINDOW_STRIDE,
+        max_windows=settings.WINDOW_MAX_COUNT,
+        pooling=settings.WINDOW_POOLING,
+        early_stop=settings.WINDOW_EARLY_STOP,
+        early_stop_chunk=settings.WINDOW_EARLY_STOP_CHUNK,
+        early_stop_tolerance=settings.WINDOW_EARLY_STOP_TOLERANCE,
+        early_stop_confidence=settings.WINDOW_EARLY_STOP_CONFIDENCE,
+    )
+
+
+def split_windows(tokenizer, texts: Sequence[str], config: WindowConfig) -> List[List[Dict[str, List[int]]]]:
+    """
+    텍스트마다 window_size 길이, stride 간격의 윈도우 입력(특수 토큰 포함)을 최대 max_windows 개 만듭니다.
+    512 토큰 이하의 텍스트는 기존 방식과 같은 윈도우 하나가 됩니다.
+    """
+    content_size = config.window_size - len(tokenizer("")["input_ids"])
+    if config.stride > content_size:
+        raise ValueError(f"stride({config.stride})가 윈도우 본문 길이({content_size})보다 클 수 없습니다.")
+
+    # fast 토크나이저의 overflow 기능을 사용하며, 여기서 stride 는 윈도우 간 겹치는 토큰 수를 뜻합니다.
+    encodings = tokenizer(
+        list(texts),
+        truncation=True,
+        max_length=config.window_size,
+        stride=content_size - config.stride,
+        return_overflowing_tokens=True,
+        padding=False,
+    )
+    windows: List[List[Dict[str, List[int]]]] = [[] for _ in texts]
+    for j, i in enumerate(encodings["overflow_to_sample_mapping"]):
+        if len(windows[i]) < config.max_windows:
+            windows[i].append({"input_ids": encodings["input_ids"][j], "attention_mask": encodings["attention_mask"][j]})
+    return windows
+
+
+def pool_logits(logits: torch.Tensor, lengths: Sequence[int], pooling: str = "mean") -> torch.Tensor:
+    """윈도우별 로짓 [N, C] 를 하나의 기사 로짓 [C] 로 합칩니다."""
+    if pooling == "length_weighted":
+        weights = torch.tensor(lengths, dtype=logits.dtype, device=logits.device)
+        return (logits * (weights / weights.sum()).unsqueeze(1)).sum(dim=0)
+    return logits.mean(dim=0)
+
+
+def has_settled(previous: Optional[torch.Tensor], current: torch.Tensor, config: WindowConfig) -> bool:
+    if current.max().item() >= config.early_stop_confidence:
+        return True
+    if previous is None:
+        return False
+    return (current - previous).abs().max().item() < config.early_stop_tolerance
+
+
+def windowed_probabilities(
+    tokenizer,
+    texts: Sequence[str],
+    forward_fn: Callable[[List[Dict[str, List[int]]]], torch.Tensor],
+    config: WindowConfig,
+) -> List[List[float]]:
+    """
+    각 텍스트를 윈도우로 나눠 forward_fn 으로 점수화하고, 윈도우 로짓을 풀링해 텍스트별 확률을 돌려줍니다.
+    조기 종료를 끄면 모든 텍스트의 모든 윈도우가 forward_fn 한 번으로 처리되고,
+    켜면 early_stop_chunk 개씩 나눠 처리하다가 분포가 수렴한 텍스트는 남은 윈도우를 건너뜁니다.
+    """
+    windows = split_windows(tokenizer, texts, config)
+
+    chunk = config.early_stop_chunk if config.early_stop else config.max_windows
+    window_logits: List[List[torch.Tensor]] = [[] for _ in texts]
+    probabilities: List[Optional[torch.Tensor]] = [None] * len(texts)
+    done = [False] * len(texts)
+
+    offset = 0
+    while not all(done):
+        features, owners = [], []
+        for i, text_windows in enumerate(windows):
+            if done[i]:
+                continue
+            for window in text_windows[offset:offset + chunk]:
+                features.append(window)
+                owners.append(i)
+
+        for row, i in zip(forward_fn(features), owners):
+            window_logits[i].append(row)
+        offset += chunk
+
+        for i in set(owners):
+            used = windows[i][:len(window_logits[i])]
+            pooled = pool_logits(torch.stack(window_logits[i]), [len(w["input_ids"]) for w in used], config.pooling)
+            current = torch.softmax(pooled, dim=-1)
+            if offset >= len(windows[i]) or (config.early_stop and has_settled(probabilities[i], current, config)):
+                done[i] = True
+            probabilities[i] = current
+
+    return [p.tolist() for p in probabilities]
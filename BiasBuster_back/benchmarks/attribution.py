@@ -0,0 +1,68 @@
+# benchmarks/attribution.py
+# 문장 단위 편향 근거의 비용을 긴 기사에서 잽니다: 기사 점수 1회(document), 문장마다 따로 추론(sequential),
+# 모든 문장을 한 번의 동적 패딩 배치로 추론(batched, 서빙 방식). batched/document 비율이 문장 근거를 켰을 때의 추가 비용입니다.
+# 사용법: python benchmarks/attribution.py [--tiny] [--repeat 5] [--sentences 60 200] [--output attribution.json]
+import argparse
+import json
+import random
+
+from bench_utils import default_model_path, model_kind, prepare_model_dir, run_metadata, synthetic_article, time_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문장 단위 편향 근거: 순차 추론 vs 배치 추론")
+    parser.add_argument("--model-path", default=default_model_path)
+    parser.add_argument("--random-init", action="store_true", help="가중치 대신 무작위 초기화 모델 사용")
+    parser.add_argument("--tiny", action="store_true", help="같은 구조의 작은 무작위 초기화 모델 사용")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sentences", type=int, nargs="+", default=[60, 200], help="기사 하나의 문장 수 (긴 기사 구간)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    import main as app_main
+    from services.attribution import split_sentences, top_polarized
+
+    model_dir = prepare_model_dir(args.model_path, random_init=args.random_init, tiny=args.tiny)
+    app_main.load_bias_model(model_dir)
+    settings = app_main.settings
+
+    results = {
+        "meta": run_metadata(model=model_kind(args.model_path, random_init=args.random_init, tiny=args.tiny),
+                             backend=settings.MODEL_BACKEND, repeat=args.repeat,
+                             max_sentences=settings.ATTRIBUTION_MAX_SENTENCES, max_tokens=settings.ATTRIBUTION_MAX_TOKENS),
+        "articles": {},
+    }
+    for num_sentences in args.sentences:
+        text = synthetic_article(num_sentences, random.Random(num_sentences))
+        sentences = split_sentences(text, settings.ATTRIBUTION_MIN_CHARS)[:settings.ATTRIBUTION_MAX_SENTENCES]
+        texts = [sentence.text for sentence in sentences]
+
+        def batched():
+            probabilities, _ = app_main.get_sentence_probabilities_traced([texts])
+            return top_polarized(sentences, probabilities[0], settings.ATTRIBUTION_TOP_K)
+
+        entry = {
+            "chars": len(text),
+            "sentences": len(sentences),
+            "document": time_call(lambda: app_main.get_bias_scores(text), repeat=args.repeat),
+            "sequential": time_call(lambda: [app_main.get_sentence_probabilities_traced([[t]]) for t in texts],
+                                    repeat=max(1, args.repeat // 2), warmup=1),
+            "batched": time_call(batched, repeat=args.repeat),
+        }
+        document_ms = entry["document"]["p50_ms"]
+        batched_ms = entry["batched"]["p50_ms"]
+        entry["speedup"] = entry["sequential"]["p50_ms"] / batched_ms if batched_ms else None
+        entry["overhead_vs_document"] = batched_ms / document_ms if document_ms else None
+        results["articles"][str(num_sentences)] = entry
+        print(f"[{num_sentences:3d}문장 -> {len(sentences):3d}개] document p50={document_ms:8.1f}ms  "
+              f"sequential p50={entry['sequential']['p50_ms']:8.1f}ms  batched p50={batched_ms:8.1f}ms  "
+              f"x{entry['speedup']:.1f} (기사 점수 대비 {entry['overhead_vs_document']:.2f}배)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# benchmarks/bench_utils.py
+# 벤치마크 스크립트들이 함께 쓰는 모델 로드, 합성 기사 생성, 시간 측정 헬퍼.
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import torch
+from transformers import AutoConfig, AutoModelForSequenceClassification, AutoTokenizer
+
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(bench_dir, '..'))
+app_dir = os.path.join(project_root, 'app')
+default_model_path = os.path.join(app_dir, 'data', 'models', 'political_bias_model')
+
+# 서빙 코드의 모듈(services.*, main)을 그대로 가져다 쓰기 위해 app 디렉토리를 import 경로에 추가
+sys.path.insert(0, app_dir)
+
+# git-lfs 포인터 파일은 수백 바이트에 불과하므로 실제 가중치가 있는지 크기로 판단합니다.
+_MIN_WEIGHT_BYTES = 1024 * 1024
+
+
+def has_real_weights(model_path: str) -> bool:
+    for name in ("model.safetensors", "pytorch_model.bin"):
+        weight_path = os.path.join(model_path, name)
+        if os.path.exists(weight_path) and os.path.getsize(weight_path) >= _MIN_WEIGHT_BYTES:
+            return True
+    return False
+
+
+# --tiny 일 때 config.json 에서 덮어쓸 값. 구조(RoBERTa 분류기)와 어휘는 그대로 두고 크기만 줄입니다.
+TINY_CONFIG_OVERRIDES = {"num_hidden_layers": 2, "hidden_size": 128, "num_attention_heads": 2, "intermediate_size": 512}
+
+
+def _random_init_model(model_path: str, tiny: bool = False):
+    torch.manual_seed(0)
+    config = AutoConfig.from_pretrained(model_path)
+    if tiny:
+        for key, value in TINY_CONFIG_OVERRIDES.items():
+            setattr(config, key, value)
+    return AutoModelForSequenceClassification.from_config(config)
+
+
+def load_model(model_path: str = default_model_path, random_init: bool = False, tiny: bool = False):
+    """
+    토크나이저와 분류 모델을 로드합니다. 가중치가 없거나(git-lfs 미설치 등) random_init 이면
+    config.json 과 같은 구조의 무작위 초기화 모델을 만들어 돌려줍니다. tiny 면 층과 차원을 줄입니다.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    if random_init or tiny or not has_real_weights(model_path):
+        print(f"[bench] 실제 가중치 없이 무작위 초기화 모델을 사용합니다{' (tiny)' if tiny else ''}: {model_path}")
+        model = _random_init_model(model_path, tiny=tiny)
+    else:
+        model = AutoModelForSequenceClassification.from_pretrained(model_path)
+    model.eval()
+    return tokenizer, model
+
+
+def prepare_model_dir(model_path: str = default_model_path, random_init: bool = False, tiny: bool = False) -> str:
+    """
+    서빙 코드(main.load_bias_model)가 그대로 읽을 수 있는 모델 디렉토리 경로를 돌려줍니다.
+    실제 가중치를 쓸 수 없으면 무작위 초기화 모델과 토크나이저를 임시 디렉토리에 한 번 저장해 재사용합니다.
+    """
+    if not (random_init or tiny) and has_real_weights(model_path):
+        return model_path
+    target = os.path.join(tempfile.gettempdir(), f"biasbuster_bench_model_{'tiny' if tiny else 'random'}")
+    if not os.path.exists(os.path.join(target, "config.json")):
+        print(f"[bench] 무작위 초기화 모델을 저장합니다{' (tiny)' if tiny else ''}: {target}")
+        AutoTokenizer.from_pretrained(model_path).save_pretrained(target)
+        _random_init_model(model_path, tiny=tiny).save_pretrained(target)
+    return target
+
+
+def model_kind(model_path: str, random_init: bool = False, tiny: bool = False) -> str:
+    if tiny:
+        return "tiny_random"
+    return "random" if random_init or not has_real_weights(model_path) else "trained"
+
+
+def peak_rss_mb(pid: Optional[int] = None) -> Dict[str, Optional[float]]:
+    """
+    최대 상주 메모리(MB). pid 가 없으면 현재 프로세스와 (종료된) 자식 프로세스의 값을,
+    있으면 /proc/<pid>/status 의 VmHWM 을 읽습니다 (Linux 전용).
+    """
+    if pid is not None:
+        try:
+            with open(f"/proc/{pid}/status", encoding="utf8") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return {"server": int(line.split()[1]) / 1024.0}
+        except OSError:
+            pass
+        return {"server": None}
+    # Linux 의 ru_maxrss 단위는 KB 입니다.
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024.0,
+    }
+
+
+def run_metadata(**extra: Any) -> Dict[str, Any]:
+    """결과 JSON 을 서로 비교할 수 있도록 실행 환경 정보를 함께 남깁니다."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "torch": torch.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "torch_threads": torch.get_num_threads(),
+        **extra,
+    }
+
+
+_SUBJECTS = ["정부는", "야당은", "여당 지도부는", "시민단체는", "경제계는", "전문가들은", "대통령실은", "국회는"]
+_OBJECTS = ["부동산 규제를", "세제 개편안을", "예산안을", "노동 정책을", "복지 확대를", "규제 완화를", "외교 정책을", "연금 개혁을"]
+_VERBS = ["강하게 비판했다.", "적극 옹호했다.", "재검토하겠다고 밝혔다.", "추진할 방침이다.", "우려를 제기했다.", "지지한다고 말했다."]
+_EXTRAS = ["관계자는 말했다.", "일각에서는 반대 목소리도 나온다.", "2021년 통계에 따르면 수치는 다소 달랐다.", "충격적인 사실이 드러났다.", ""]
+
+# 기사 길이 구간별 문장 수 (헤드라인 ~ 장문 기사)
+LENGTH_PROFILES = {"short": 1, "medium": 12, "long": 60}
+
+
+def synthetic_article(num_sentences: int, rng: random.Random) -> str:
+    sentences = []
+    for _ in range(num_sentences):
+        sentence = f"{rng.choice(_SUBJECTS)} {rng.choice(_OBJECTS)} {rng.choice(_VERBS)} {rng.choice(_EXTRAS)}"
+        sentences.append(sentence.strip())
+    return " ".join(sentences)
+
+
+def synthetic_corpus(count: int, profile: str = "mixed", seed: int = 0) -> List[str]:
+    """short/medium/long 또는 세 구간을 섞은 mixed 프로필로 합성 한국어 기사 목록을 만듭니다."""
+    rng = random.Random(seed)
+    profiles = list(LENGTH_PROFILES) if profile == "mixed" else [profile]
+    return [synthetic_article(LENGTH_PROFILES[rng.choice(profiles)], rng) for _ in range(count)]
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+def summarize_ms(samples: Sequence[float]) -> Dict[str, float]:
+    """초 단위 측정값을 밀리초 요약 통계로 바꿉니다."""
+    ms = [s * 1000.0 for s in samples]
+    return {
+        "n": len(ms),
+        "mean_ms": statistics.fmean(ms) if ms else 0.0,
+        "p50_ms": percentile(ms, 50),
+        "p95_ms": percentile(ms, 95),
+        "p99_ms": percentile(ms, 99),
+    }
+
+
+def time_call(fn: Callable[[], Any], repeat: int = 10, warmup: int = 2) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize_ms(samples)
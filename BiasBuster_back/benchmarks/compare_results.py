@@ -0,0 +1,63 @@
+# benchmarks/compare_results.py
+# 같은 벤치마크를 두 번 실행한 결과 JSON 을 비교해 지연 시간(p50/p95/p99)과 처리량 변화를 보여 줍니다.
+# --max-regression 을 주면 그보다 크게 느려진 항목이 있을 때 종료 코드 1 로 끝나 CI 에서 회귀를 잡을 수 있습니다.
+# 사용법: python benchmarks/compare_results.py base.json new.json [--max-regression 0.1]
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+# 값이 클수록 나쁜 지표와 좋은 지표
+_LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms", "mean_ms")
+_HIGHER_IS_BETTER = ("throughput_rps", "articles_per_sec")
+
+
+def iter_metrics(node: Any, path: str = "") -> Iterator[Tuple[str, str, float]]:
+    """결과 JSON 을 훑어 (경로, 지표 이름, 값) 을 돌려줍니다. 부하 단계는 동시성 값으로 경로를 만듭니다."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "meta":
+                continue
+            if key in _LOWER_IS_BETTER + _HIGHER_IS_BETTER and isinstance(value, (int, float)):
+                yield path, key, float(value)
+            else:
+                yield from iter_metrics(value, f"{path}/{key}" if path else key)
+    elif isinstance(node, list):
+        for i, item in enumerate(node):
+            label = f"c={item['concurrency']}" if isinstance(item, dict) and "concurrency" in item else str(i)
+            yield from iter_metrics(item, f"{path}/{label}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 결과 JSON 비교")
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--max-regression", type=float, default=None, help="허용할 최대 악화 비율 (예: 0.1 = 10%%)")
+    args = parser.parse_args()
+
+    with open(args.base, encoding="utf8") as f:
+        base: Dict[Tuple[str, str], float] = {(p, k): v for p, k, v in iter_metrics(json.load(f))}
+    with open(args.new, encoding="utf8") as f:
+        new: Dict[Tuple[str, str], float] = {(p, k): v for p, k, v in iter_metrics(json.load(f))}
+
+    regressions = 0
+    for key in sorted(base.keys() & new.keys()):
+        before, after = base[key], new[key]
+        if not before:
+            continue
+        change = (after - before) / before
+        # 악화 정도를 같은 부호로 맞춥니다: 양수면 느려졌거나 처리량이 줄어든 것.
+        worse = change if key[1] in _LOWER_IS_BETTER else -change
+        flag = ""
+        if args.max_regression is not None and worse > args.max_regression:
+            flag = "  <-- 회귀"
+            regressions += 1
+        print(f"{key[0]:45s} {key[1]:16s} {before:12.3f} -> {after:12.3f}  ({change * 100:+6.1f}%){flag}")
+
+    if regressions:
+        print(f"\n허용 범위({args.max_regression * 100:.0f}%)를 넘게 악화된 항목: {regressions}개")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
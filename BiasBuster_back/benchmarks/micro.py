@@ -0,0 +1,62 @@
+# benchmarks/micro.py
+# 서빙 경로의 단계별 마이크로 벤치마크: 토크나이즈(encode_texts), get_bias_scores(단건/배치), analyze_article_trust.
+# app/main.py 의 함수를 그대로 호출하므로 서빙 코드 변경의 영향을 HTTP 계층 없이 확인할 수 있습니다.
+# 사용법: python benchmarks/micro.py [--tiny] [--repeat 20] [--batch-size 8] [--output micro.json]
+import argparse
+import contextlib
+import json
+import os
+
+from bench_utils import default_model_path, model_kind, prepare_model_dir, run_metadata, synthetic_corpus, time_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description="토크나이즈 / 편향 점수 / 신뢰도 규칙 마이크로 벤치마크")
+    parser.add_argument("--model-path", default=default_model_path)
+    parser.add_argument("--random-init", action="store_true", help="가중치 대신 무작위 초기화 모델 사용")
+    parser.add_argument("--tiny", action="store_true", help="같은 구조의 작은 무작위 초기화 모델 사용")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    import main as app_main
+    from services.tokenization import MAX_LENGTH, encode_texts
+
+    model_dir = prepare_model_dir(args.model_path, random_init=args.random_init, tiny=args.tiny)
+    app_main.load_bias_model(model_dir)
+    tokenizer = app_main.bias_engine.tokenizer
+
+    results = {
+        "meta": run_metadata(model=model_kind(args.model_path, random_init=args.random_init, tiny=args.tiny),
+                             backend=app_main.settings.MODEL_BACKEND, repeat=args.repeat, batch_size=args.batch_size),
+        "tokenize": {},
+        "get_bias_scores": {},
+        "get_bias_scores_batch": {},
+        "analyze_article_trust": {},
+    }
+    # get_bias_scores_batch 의 요청별 print 가 측정에 섞이지 않도록 표준 출력을 버립니다.
+    with open(os.devnull, "w") as quiet:
+        for profile in ("short", "medium", "long"):
+            texts = synthetic_corpus(args.batch_size, profile=profile, seed=7)
+            tokens = len(encode_texts(tokenizer, texts[:1], max_length=MAX_LENGTH)["input_ids"][0])
+            with contextlib.redirect_stdout(quiet):
+                entries = {
+                    "tokenize": time_call(lambda: encode_texts(tokenizer, texts[:1], max_length=MAX_LENGTH), repeat=args.repeat),
+                    "get_bias_scores": time_call(lambda: app_main.get_bias_scores(texts[0]), repeat=args.repeat),
+                    "get_bias_scores_batch": time_call(lambda: app_main.get_bias_scores_batch(texts), repeat=max(1, args.repeat // 2)),
+                    "analyze_article_trust": time_call(lambda: app_main.analyze_article_trust(texts[0]), repeat=args.repeat * 5),
+                }
+            for name, stats in entries.items():
+                results[name][profile] = {"tokens": tokens, "chars": len(texts[0]), **stats}
+                print(f"[{name:22s}/{profile:6s}] tokens={tokens:3d}  p50={stats['p50_ms']:9.3f}ms  "
+                      f"p95={stats['p95_ms']:9.3f}ms  p99={stats['p99_ms']:9.3f}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
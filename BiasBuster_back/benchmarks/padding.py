@@ -0,0 +1,76 @@
+# benchmarks/padding.py
+# 고정 512 토큰 패딩(이전 방식)과 동적 패딩/길이 버킷팅의 추론 지연 시간을 비교합니다.
+# 사용법: python benchmarks/padding.py [--model-path DIR] [--random-init] [--repeat 10] [--output result.json]
+import argparse
+import json
+
+import torch
+
+from bench_utils import default_model_path, load_model, synthetic_corpus, time_call
+from services.tokenization import MAX_LENGTH, iter_bucketed_batches, tokenize_batch
+
+
+def forward_fixed(tokenizer, model, texts):
+    inputs = tokenizer(texts, return_tensors="pt", truncation=True, padding="max_length", max_length=MAX_LENGTH)
+    with torch.no_grad():
+        return model(**inputs).logits
+
+
+def forward_dynamic(tokenizer, model, texts):
+    inputs = tokenize_batch(tokenizer, texts)
+    with torch.no_grad():
+        return model(**inputs).logits
+
+
+def forward_bucketed(tokenizer, model, texts, batch_size):
+    for _, inputs in iter_bucketed_batches(tokenizer, texts, max_batch_size=batch_size):
+        with torch.no_grad():
+            model(**inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="고정 패딩 vs 동적 패딩 지연 시간 비교")
+    parser.add_argument("--model-path", default=default_model_path)
+    parser.add_argument("--random-init", action="store_true", help="가중치 대신 무작위 초기화 모델 사용")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    tokenizer, model = load_model(args.model_path, random_init=args.random_init)
+    results = {"single": {}, "mixed_batch": {}}
+
+    for profile in ("short", "medium", "long"):
+        text = synthetic_corpus(1, profile=profile, seed=1)
+        tokens = len(tokenizer(text[0], truncation=True, max_length=MAX_LENGTH)["input_ids"])
+        fixed = time_call(lambda: forward_fixed(tokenizer, model, text), repeat=args.repeat)
+        dynamic = time_call(lambda: forward_dynamic(tokenizer, model, text), repeat=args.repeat)
+        results["single"][profile] = {
+            "tokens": tokens,
+            "fixed_512": fixed,
+            "dynamic": dynamic,
+            "speedup": fixed["p50_ms"] / dynamic["p50_ms"] if dynamic["p50_ms"] else None,
+        }
+        print(f"[single/{profile:6s}] tokens={tokens:3d}  fixed p50={fixed['p50_ms']:8.1f}ms  "
+              f"dynamic p50={dynamic['p50_ms']:8.1f}ms  x{results['single'][profile]['speedup']:.2f}")
+
+    texts = synthetic_corpus(args.batch_size * 4, profile="mixed", seed=2)
+    mixed = {
+        "fixed_512": time_call(lambda: [forward_fixed(tokenizer, model, texts[i:i + args.batch_size])
+                                        for i in range(0, len(texts), args.batch_size)], repeat=max(1, args.repeat // 2)),
+        "dynamic": time_call(lambda: [forward_dynamic(tokenizer, model, texts[i:i + args.batch_size])
+                                      for i in range(0, len(texts), args.batch_size)], repeat=max(1, args.repeat // 2)),
+        "bucketed": time_call(lambda: forward_bucketed(tokenizer, model, texts, args.batch_size), repeat=max(1, args.repeat // 2)),
+    }
+    results["mixed_batch"] = {"num_texts": len(texts), "batch_size": args.batch_size, **mixed}
+    for name, stats in mixed.items():
+        print(f"[mixed/{name:9s}] {len(texts)} texts  p50={stats['p50_ms']:8.1f}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
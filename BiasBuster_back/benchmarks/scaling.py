@@ -0,0 +1,158 @@
+# benchmarks/scaling.py
+# scripts/serve.py 를 워커 수를 바꿔 가며 띄우고 같은 부하를 걸어, 워커 수에 따른 처리량 증가와 메모리 사용량을 비교합니다.
+# 메모리는 마스터와 워커의 RSS 합계와 PSS 합계(공유 페이지를 프로세스 수로 나눠 센 값)를 함께 기록하므로
+# 사전 로드(--preload 기본값)로 가중치가 실제로 공유되는지 확인할 수 있습니다. (Linux 전용: /proc 사용)
+#
+# 사용법:
+#   python benchmarks/scaling.py --workers 1 2 4 --requests 200 --output scaling.json
+#   python benchmarks/scaling.py --tiny --workers 1 2 --no-preload
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from bench_utils import (
+    default_model_path, model_kind, prepare_model_dir, project_root, run_metadata, synthetic_corpus,
+)
+from serving import _free_port, run_load
+
+
+def _child_pids(pid: int) -> List[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children", encoding="utf8") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+
+def _memory_kb(pid: int) -> Dict[str, int]:
+    memory = {"rss": 0, "pss": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="utf8") as f:
+            for line in f:
+                key = line.split(":")[0]
+                if key in ("Rss", "Pss"):
+                    memory[key.lower()] = int(line.split()[1])
+    except OSError:
+        pass
+    return memory
+
+
+def server_memory_mb(master_pid: int) -> Dict[str, Any]:
+    pids = [master_pid] + _child_pids(master_pid)
+    per_process = {pid: _memory_kb(pid) for pid in pids}
+    return {
+        "processes": len(pids),
+        "rss_total_mb": sum(m["rss"] for m in per_process.values()) / 1024.0,
+        "pss_total_mb": sum(m["pss"] for m in per_process.values()) / 1024.0,
+    }
+
+
+def wait_until_ready(url: str, workers: int, process: subprocess.Popen, timeout: float = 600.0) -> None:
+    """어느 워커가 응답할지 알 수 없으므로 준비 응답이 워커 수의 두 배만큼 연속으로 올 때까지 기다립니다."""
+    deadline = time.monotonic() + timeout
+    streak = 0
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 종료되었습니다 (종료 코드 {process.returncode}).")
+        try:
+            ok = httpx.get(f"{url}/health/ready", timeout=5.0).status_code == 200
+        except httpx.TransportError:
+            ok = False
+        streak = streak + 1 if ok else 0
+        if streak >= workers * 2:
+            return
+        time.sleep(0.1 if ok else 0.3)
+    raise TimeoutError("서버가 제한 시간 안에 준비되지 않았습니다.")
+
+
+def run_level(args, model_dir: str, workers: int, texts: List[str]) -> Dict[str, Any]:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}"
+    command = [
+        sys.executable, os.path.join(project_root, "scripts", "serve.py"),
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers),
+        "--model-path", model_dir, "--log-level", "warning",
+    ]
+    if args.threads_per_worker:
+        command += ["--threads-per-worker", str(args.threads_per_worker)]
+    if args.no_preload:
+        command.append("--no-preload")
+
+    log: Optional[Any] = None if args.verbose_server else subprocess.DEVNULL
+    process = subprocess.Popen(command, stdout=log, stderr=log)
+    try:
+        started = time.perf_counter()
+        wait_until_ready(url, workers, process)
+        ready_seconds = time.perf_counter() - started
+        idle_memory = server_memory_mb(process.pid)
+
+        concurrency = args.concurrency_per_worker * workers
+        if args.warmup:
+            asyncio.run(run_load(url, texts[-args.warmup:], args.warmup, min(concurrency, args.warmup), args.timeout))
+        level = asyncio.run(run_load(url, texts, args.requests, concurrency, args.timeout))
+        level.update({"workers": workers, "ready_seconds": ready_seconds, "memory_idle": idle_memory,
+                      "memory_loaded": server_memory_mb(process.pid)})
+        return level
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="멀티 워커 서빙(scripts/serve.py) 처리량/메모리 스케일링 벤치마크")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads-per-worker", type=int, default=0, help="0 이면 serve.py 기본값(코어 수 / 워커 수)")
+    parser.add_argument("--concurrency-per-worker", type=int, default=4, help="워커 하나당 동시 요청 수")
+    parser.add_argument("--requests", type=int, default=200, help="워커 수 단계별 요청 수")
+    parser.add_argument("--warmup", type=int, default=8)
+    parser.add_argument("--no-preload", action="store_true", help="워커마다 모델을 따로 로드 (메모리 비교용)")
+    parser.add_argument("--model-path", default=default_model_path)
+    parser.add_argument("--random-init", action="store_true", help="가중치 대신 무작위 초기화 모델 사용")
+    parser.add_argument("--tiny", action="store_true", help="같은 구조의 작은 무작위 초기화 모델 사용")
+    parser.add_argument("--profile", choices=["short", "medium", "long", "mixed"], default="mixed")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--verbose-server", action="store_true", help="서버 출력을 그대로 보여 줌")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    model_dir = prepare_model_dir(args.model_path, random_init=args.random_init, tiny=args.tiny)
+    results: Dict[str, Any] = {
+        "meta": run_metadata(model=model_kind(args.model_path, random_init=args.random_init, tiny=args.tiny),
+                             preload=not args.no_preload, profile=args.profile),
+        "levels": [],
+    }
+
+    baseline: Optional[float] = None
+    for workers in args.workers:
+        count = args.requests + args.warmup
+        texts = [f"{text} (기사 번호 {workers}-{i})"
+                 for i, text in enumerate(synthetic_corpus(count, profile=args.profile, seed=workers))]
+        level = run_level(args, model_dir, workers, texts)
+        baseline = baseline or level["throughput_rps"] / workers
+        level["scaling_efficiency"] = level["throughput_rps"] / (baseline * workers) if baseline else None
+        results["levels"].append(level)
+
+        latency = level["latency"]
+        print(f"[workers={workers}] ok {level['ok']}/{level['requests']} | {level['throughput_rps']:7.2f} req/s "
+              f"(효율 {level['scaling_efficiency'] or 0:.2f}) | p50 {latency['p50_ms']:8.1f}ms  p99 {latency['p99_ms']:8.1f}ms | "
+              f"RSS 합 {level['memory_loaded']['rss_total_mb']:.0f}MB  PSS 합 {level['memory_loaded']['pss_total_mb']:.0f}MB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# benchmarks/serving.py
+# app/main.py 를 같은 프로세스의 uvicorn 으로 띄우거나(기본) 이미 실행 중인 서버(--url)에 붙어
+# 합성 한국어 기사로 POST /analyze 부하를 걸고, 동시성 단계별 지연 시간 분포와 처리량, 최대 RSS 를 기록합니다.
+#
+# 사용법:
+#   python benchmarks/serving.py --concurrency 1 4 16 --requests 200 --output serving.json
+#   python benchmarks/serving.py --tiny --requests 50                        # 가중치 없이 작은 무작위 모델로
+#   python benchmarks/serving.py --url http://localhost:8001 --server-pid 12345
+# 서빙 설정(INFERENCE_WORKERS, BATCH_MAX_SIZE, MODEL_BACKEND 등)은 평소처럼 환경 변수로 바꿉니다.
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from bench_utils import default_model_path, model_kind, peak_rss_mb, prepare_model_dir, run_metadata, summarize_ms, synthetic_corpus
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class InProcessServer:
+    """app/main.py 의 app 을 백그라운드 스레드의 uvicorn 으로 실행합니다."""
+
+    def __init__(self, model_dir: str):
+        import uvicorn
+        import main
+
+        main.political_bias_model_path = model_dir
+        self.main = main
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=self.port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def start(self, timeout: float = 600.0) -> None:
+        self.thread.start()
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                response = httpx.get(f"{self.url}/health/ready", timeout=5.0)
+                if response.status_code == 200:
+                    return
+                if response.json().get("status") == "failed":
+                    raise RuntimeError(f"서버 모델 로드 실패: {response.json().get('error')}")
+            except httpx.TransportError:
+                pass
+            time.sleep(0.2)
+        raise TimeoutError("서버가 제한 시간 안에 준비되지 않았습니다.")
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=30)
+
+
+async def run_load(url: str, texts: List[str], num_requests: int, concurrency: int, timeout: float) -> Dict[str, Any]:
+    """
+    concurrency 개의 클라이언트가 각자 응답을 받으면 바로 다음 요청을 보내는 닫힌 루프 부하를 겁니다.
+    """
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    next_index = 0
+
+    async def client_loop(client: httpx.AsyncClient):
+        nonlocal next_index
+        while next_index < num_requests:
+            text = texts[next_index % len(texts)]
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await client.post(f"{url}/analyze", json={"text": text})
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - started
+            statuses[status] += 1
+            if status == "200":
+                latencies.append(elapsed)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[client_loop(client) for _ in range(concurrency)])
+        wall = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "requests": num_requests,
+        "ok": len(latencies),
+        "errors": num_requests - len(latencies),
+        "status_counts": dict(statuses),
+        "wall_seconds": wall,
+        "throughput_rps": len(latencies) / wall if wall else 0.0,
+        "latency": summarize_ms(latencies),
+    }
+
+
+def _server_stats(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        return httpx.get(f"{url}/stats/batching", timeout=5.0).json()
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/analyze 부하 테스트 (동시성 단계별 p50/p95/p99, 처리량, 최대 RSS)")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소. 없으면 app/main.py 를 같은 프로세스에서 띄웁니다.")
+    parser.add_argument("--server-pid", type=int, help="--url 서버의 PID (최대 RSS 측정용, Linux 전용)")
+    parser.add_argument("--model-path", default=default_model_path)
+    parser.add_argument("--random-init", action="store_true", help="가중치 대신 무작위 초기화 모델 사용")
+    parser.add_argument("--tiny", action="store_true", help="같은 구조의 작은 무작위 초기화 모델 사용")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=200, help="동시성 단계별 요청 수")
+    parser.add_argument("--warmup", type=int, default=8, help="측정 전에 보내는 요청 수")
+    parser.add_argument("--profile", choices=["short", "medium", "long", "mixed"], default="mixed")
+    parser.add_argument("--corpus-size", type=int, default=0,
+                        help="서로 다른 기사 수 (0 이면 요청마다 다른 기사라 결과 캐시에 적중하지 않음)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--verbose-server", action="store_true", help="같은 프로세스 서버의 INFO 로그와 print 출력을 그대로 보여 줌")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = args.url.rstrip("/")
+        kind = None
+    else:
+        model_dir = prepare_model_dir(args.model_path, random_init=args.random_init, tiny=args.tiny)
+        kind = model_kind(args.model_path, random_init=args.random_init, tiny=args.tiny)
+        if not args.verbose_server:
+            # 로그는 QueueListener 스레드가 설정 시점의 stdout 으로 쓰므로 redirect_stdout 으로는 막을 수 없습니다.
+            # main 을 가져오기 전에 서버 로그 수준을 올려 요청별 "분석 완료"/httpx 로그를 끕니다.
+            os.environ["LOG_LEVEL"] = "WARNING"
+        server = InProcessServer(model_dir)
+        print(f"[bench] 서버 시작 중... ({server.url}, 모델: {kind})")
+        server.start()
+        url = server.url
+
+    results: Dict[str, Any] = {
+        "meta": run_metadata(
+            url=args.url or "in-process",
+            model=kind,
+            profile=args.profile,
+            settings=server.main.settings.model_dump() if server is not None else None,
+        ),
+        "levels": [],
+    }
+    # 로그 외에 서버 코드에 남은 print 가 측정에 섞이지 않도록 같은 프로세스 서버의 표준 출력도 기본적으로 버립니다.
+    quiet = open(os.devnull, "w") if server is not None and not args.verbose_server else None
+
+    try:
+        for concurrency in args.concurrency:
+            count = args.corpus_size or args.requests + args.warmup
+            # 같은 시드에서 나온 기사가 겹쳐도 캐시에 적중하지 않도록 번호를 붙여 모두 다른 본문으로 만듭니다.
+            texts = [
+                f"{text} (기사 번호 {concurrency}-{i})"
+                for i, text in enumerate(synthetic_corpus(count, profile=args.profile, seed=args.seed + concurrency))
+            ]
+            with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+                if args.warmup:
+                    asyncio.run(run_load(url, texts[-args.warmup:], args.warmup, min(concurrency, args.warmup), args.timeout))
+                level = asyncio.run(run_load(url, texts, args.requests, concurrency, args.timeout))
+            level["peak_rss_mb"] = peak_rss_mb(args.server_pid if args.url else None)
+            level["server_batching"] = _server_stats(url)
+            results["levels"].append(level)
+
+            latency = level["latency"]
+            print(f"[c={concurrency:3d}] ok {level['ok']}/{level['requests']} | {level['throughput_rps']:7.2f} req/s | "
+                  f"p50 {latency['p50_ms']:8.1f}ms  p95 {latency['p95_ms']:8.1f}ms  p99 {latency['p99_ms']:8.1f}ms | "
+                  f"RSS {level['peak_rss_mb']}")
+    finally:
+        if quiet is not None:
+            quiet.close()
+        if server is not None:
+            server.stop()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/trust_rules.py
+# 기존 analyze_article_trust(호출마다 규칙 dict 생성 + 패턴별 re.search) 와
+# 사전 컴파일된 TrustRuleEngine 의 처리 시간을 비교합니다.
+# 사용법: python benchmarks/trust_rules.py [--repeat 200] [--output result.json]
+import argparse
+import json
+import re
+from typing import Dict, List
+
+from bench_utils import synthetic_corpus, time_call
+from services.trust_rules import TRUST_RULES, default_engine
+
+
+def legacy_analyze_article_trust(article_text: str) -> List[Dict[str, str]]:
+    """변경 전 구현과 같은 방식: 매 호출마다 규칙을 만들고 ".*" 패턴 그대로 패턴마다 첫 매칭만 찾습니다."""
+    rules: Dict[str, list] = {}
+    for reason, pattern, note, _ in TRUST_RULES:
+        rules.setdefault(reason, []).append((pattern.replace(r".{0,80}?", ".*"), note))
+
+    suspicious_points = []
+    for reason, patterns_with_notes in rules.items():
+        for pattern_str, note in patterns_with_notes:
+            match = re.search(pattern_str, article_text, re.IGNORECASE)
+            if match:
+                suspicious_points.append({"reason": reason, "phrase": match.group(0), "note": note})
+    return suspicious_points
+
+
+def main():
+    parser = argparse.ArgumentParser(description="신뢰도 규칙 엔진 마이크로 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    inputs = {profile: synthetic_corpus(1, profile=profile, seed=3)[0] for profile in ("short", "medium", "long")}
+    # 개행 없는 긴 한 줄에 "항상" 같은 앵커가 반복되면 ".*" 패턴이 줄 끝까지 역추적합니다.
+    inputs["pathological"] = "항상 그렇지는 않다 " * 3000
+    inputs["no_keywords"] = "오늘 날씨는 맑고 바람이 약하게 불겠습니다. " * 200
+
+    results = {}
+    for name, text in inputs.items():
+        repeat = max(1, args.repeat // 20) if name == "pathological" else args.repeat
+        legacy = time_call(lambda: legacy_analyze_article_trust(text), repeat=repeat, warmup=1)
+        engine = time_call(lambda: default_engine.scan(text), repeat=repeat, warmup=1)
+        results[name] = {
+            "chars": len(text),
+            "legacy": legacy,
+            "engine": engine,
+            "speedup": legacy["p50_ms"] / engine["p50_ms"] if engine["p50_ms"] else None,
+            "legacy_matches": len(legacy_analyze_article_trust(text)),
+            "engine_matches": len(default_engine.scan(text)),
+        }
+        print(f"[{name:12s}] chars={len(text):6d}  legacy p50={legacy['p50_ms']:9.3f}ms  "
+              f"engine p50={engine['p50_ms']:9.3f}ms  x{results[name]['speedup']:.1f}  "
+              f"matches {results[name]['legacy_matches']} -> {results[name]['engine_matches']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# scripts/bulk_predict.py
+# 대용량 CSV/JSONL 기사 코퍼스를 청크 단위로 스트리밍하며 정치 편향을 예측하고, 결과를 파트 파일로 저장합니다.
+# 중간에 중단되더라도 같은 명령을 다시 실행하면 체크포인트 이후부터 이어서 처리합니다.
+#
+# 사용법:
+#   python scripts/bulk_predict.py --input data/processed/test.csv --output-dir data/predictions/test \
+#       --text-column content --workers 4 --format parquet
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import torch
+
+from predict import PoliticalBiasPredictor, model_path as default_model_path
+
+CHECKPOINT_FILE = "_checkpoint.json"
+
+# 워커 프로세스마다 한 번 로드되는 예측기
+_predictor: Optional[PoliticalBiasPredictor] = None
+_batch_size = 16
+
+
+def iter_records(path: str, text_column: str, id_column: Optional[str]) -> Iterator[Tuple[int, Any, str]]:
+    """입력 파일을 한 행씩 읽어 (행 번호, id, 본문) 을 돌려줍니다. 파일 전체를 메모리에 올리지 않습니다."""
+    if path.endswith(".jsonl") or path.endswith(".ndjson"):
+        with open(path, encoding="utf8") as f:
+            for row_index, line in enumerate(f):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield row_index, record.get(id_column) if id_column else None, str(record.get(text_column) or "")
+    else:
+        # 긴 기사 본문이 csv 모듈의 기본 필드 크기 제한을 넘지 않도록 늘려 둡니다.
+        csv.field_size_limit(sys.maxsize)
+        with open(path, encoding="utf8", newline="") as f:
+            for row_index, record in enumerate(csv.DictReader(f)):
+                yield row_index, record.get(id_column) if id_column else None, str(record.get(text_column) or "")
+
+
+def iter_chunks(records: Iterator[Tuple[int, Any, str]], chunk_size: int) -> Iterator[Tuple[int, List[Tuple[int, Any, str]]]]:
+    chunk_index = 0
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk_index, chunk
+        chunk_index += 1
+
+
+def _init_worker(model_dir: str, num_threads: int, batch_size: int) -> None:
+    global _predictor, _batch_size
+    torch.set_num_threads(num_threads)
+    torch.set_num_interop_threads(1)
+    _predictor = PoliticalBiasPredictor(model_dir)
+    _batch_size = batch_size
+    if _predictor.model is None:
+        raise RuntimeError(f"모델을 로드하지 못했습니다: {model_dir}")
+
+
+def _score_chunk(job: Tuple[int, List[Tuple[int, Any, str]]]) -> Tuple[int, List[Dict[str, Any]]]:
+    chunk_index, records = job
+    predictions = _predictor.predict_political_bias_batch([text for _, _, text in records], batch_size=_batch_size)
+    rows = []
+    for (row_index, record_id, _), prediction in zip(records, predictions):
+        probabilities = prediction["probability_distribution"]
+        rows.append({
+            "row_index": row_index,
+            "id": record_id,
+            "predicted_bias_id": prediction["predicted_bias_id"],
+            "predicted_bias_label": prediction["predicted_bias_label"],
+            "prob_left": probabilities[0],
+            "prob_center": probabilities[1],
+            "prob_right": probabilities[2],
+        })
+    return chunk_index, rows
+
+
+def ordered_results(pool, jobs: Iterator, max_pending: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    청크를 워커 풀에 제출하되 동시에 대기 중인 청크는 max_pending 개로 제한해 입력을 메모리에 쌓지 않고,
+    결과는 제출 순서대로 돌려줘 체크포인트를 앞에서부터 차례로 전진시킬 수 있게 합니다.
+    (Pool.imap 은 입력 이터레이터를 별도 스레드에서 끝까지 소비해 버립니다.)
+    """
+    pending = deque()
+    for job in jobs:
+        pending.append(pool.apply_async(_score_chunk, (job,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def write_part(output_dir: str, chunk_index: int, rows: List[Dict[str, Any]], fmt: str) -> str:
+    """청크 결과를 파트 파일로 저장합니다. 임시 파일에 쓴 뒤 이름을 바꿔 반쯤 쓰인 파일이 남지 않게 합니다."""
+    path = os.path.join(output_dir, f"part-{chunk_index:06d}.{fmt}")
+    tmp_path = path + ".tmp"
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        pq.write_table(pa.Table.from_pylist(rows), tmp_path)
+    else:
+        with open(tmp_path, "w", encoding="utf8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_checkpoint(output_dir: str, input_path: str, chunk_size: int) -> Dict[str, Any]:
+    path = os.path.join(output_dir, CHECKPOINT_FILE)
+    fresh = {"input": os.path.abspath(input_path), "chunk_size": chunk_size, "next_chunk": 0, "rows_done": 0}
+    if not os.path.exists(path):
+        return fresh
+    with open(path, encoding="utf8") as f:
+        checkpoint = json.load(f)
+    # 청크 번호는 입력 파일과 청크 크기에 따라 정해지므로 둘 중 하나라도 다르면 이어서 처리할 수 없습니다.
+    if checkpoint.get("input") != fresh["input"] or checkpoint.get("chunk_size") != chunk_size:
+        raise SystemExit(
+            f"Error: {path} 는 다른 입력({checkpoint.get('input')}) 또는 청크 크기({checkpoint.get('chunk_size')})로 만들어졌습니다. "
+            "다른 --output-dir 을 사용하거나 체크포인트를 삭제하세요."
+        )
+    return checkpoint
+
+
+def save_checkpoint(output_dir: str, checkpoint: Dict[str, Any]) -> None:
+    path = os.path.join(output_dir, CHECKPOINT_FILE)
+    with open(path + ".tmp", "w", encoding="utf8") as f:
+        json.dump(checkpoint, f)
+    os.replace(path + ".tmp", path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 코퍼스 정치 편향 일괄 예측 (재시작 가능)")
+    parser.add_argument("--input", required=True, help="입력 CSV 또는 JSONL 파일")
+    parser.add_argument("--output-dir", required=True, help="파트 파일과 체크포인트를 저장할 디렉토리")
+    parser.add_argument("--model-path", default=default_model_path)
+    parser.add_argument("--text-column", default="content")
+    parser.add_argument("--id-column", default=None)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--chunk-size", type=int, default=256, help="체크포인트/파트 파일 단위 행 수")
+    parser.add_argument("--batch-size", type=int, default=16, help="한 번의 forward 에 넣을 최대 기사 수")
+    parser.add_argument("--workers", type=int, default=1, help="추론 워커 프로세스 수")
+    parser.add_argument("--threads-per-worker", type=int, default=None, help="워커별 torch 스레드 수 (기본: 코어 수 / 워커 수)")
+    args = parser.parse_args()
+
+    if args.format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("--format parquet 을 사용하려면 pyarrow 가 필요합니다: pip install pyarrow")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    checkpoint = load_checkpoint(args.output_dir, args.input, args.chunk_size)
+    threads = args.threads_per_worker or max(1, (os.cpu_count() or 1) // args.workers)
+    if checkpoint["next_chunk"]:
+        print(f"체크포인트에서 재개: 청크 {checkpoint['next_chunk']}부터 (완료된 행 {checkpoint['rows_done']}개)")
+
+    records = iter_records(args.input, args.text_column, args.id_column)
+    # 이미 저장된 청크는 읽기만 하고 추론하지 않습니다.
+    jobs = (job for job in iter_chunks(records, args.chunk_size) if job[0] >= checkpoint["next_chunk"])
+
+    if args.workers > 1:
+        pool = multiprocessing.get_context("spawn").Pool(
+            args.workers, initializer=_init_worker, initargs=(args.model_path, threads, args.batch_size)
+        )
+        results = ordered_results(pool, jobs, max_pending=args.workers * 2)
+    else:
+        pool = None
+        _init_worker(args.model_path, threads, args.batch_size)
+        results = map(_score_chunk, jobs)
+
+    print(f"일괄 예측 시작: 워커 {args.workers}개 x torch 스레드 {threads}개, 청크 {args.chunk_size}행")
+    started = time.perf_counter()
+    rows_this_run = 0
+    try:
+        for chunk_index, rows in results:
+            write_part(args.output_dir, chunk_index, rows, args.format)
+            rows_this_run += len(rows)
+            checkpoint = {**checkpoint, "next_chunk": chunk_index + 1, "rows_done": checkpoint["rows_done"] + len(rows)}
+            save_checkpoint(args.output_dir, checkpoint)
+
+            elapsed = time.perf_counter() - started
+            print(f"청크 {chunk_index} 저장 | 누적 {checkpoint['rows_done']}행 | "
+                  f"처리량 {rows_this_run / elapsed:.1f} articles/sec")
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    elapsed = time.perf_counter() - started
+    print(f"완료: 이번 실행 {rows_this_run}행, {elapsed:.1f}초 "
+          f"({rows_this_run / elapsed if elapsed else 0.0:.1f} articles/sec). 결과: {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# scripts/convert_model.py
+# 서빙용 추론 백엔드 변환 및 비교 스크립트.
+#   export-onnx : political_bias_model 을 ONNX 로 내보냅니다 (<모델 경로>/onnx/model.onnx).
+#   compare     : torch(fp32) 기준으로 torch_int8 / onnx 백엔드의 확률 편차, 라벨 일치율, 정확도, 지연 시간을 비교합니다.
+#
+# 사용법:
+#   python scripts/convert_model.py export-onnx
+#   python scripts/convert_model.py compare --limit 500 --tolerance 0.02
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+model_path = os.path.join(project_root, 'app', 'data', 'models', 'political_bias_model')
+test_data_path = os.path.join(project_root, 'data', 'processed', 'test.csv')
+
+# 서빙 코드와 같은 백엔드 로더와 토크나이즈 헬퍼를 사용하기 위해 app 디렉토리를 import 경로에 추가
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from services.backends import MODEL_BACKENDS, default_onnx_path, load_sequence_classifier
+from services.tokenization import iter_bucketed_batches, tokenize_batch
+
+
+def export_onnx(args):
+    output_path = args.output or default_onnx_path(args.model_path)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(args.model_path)
+    model = AutoModelForSequenceClassification.from_pretrained(args.model_path)
+    model.eval()
+
+    dummy = tokenize_batch(tokenizer, ["정부는 새로운 정책을 발표했다.", "여야는 예산안을 두고 팽팽하게 맞섰다."])
+    print(f"ONNX 내보내기 중... ({args.model_path} -> {output_path})")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy["input_ids"], dummy["attention_mask"]),
+            output_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            # 동적 패딩을 쓰므로 배치 크기와 시퀀스 길이를 모두 가변 축으로 둡니다.
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=args.opset,
+            dynamo=False,
+        )
+    print(f"ONNX 모델 저장 완료: {output_path} ({os.path.getsize(output_path) / 1024 / 1024:.1f} MB)")
+
+
+def predict_probabilities(tokenizer, model, texts, batch_size):
+    probabilities = np.zeros((len(texts), 3), dtype=np.float32)
+    started = time.perf_counter()
+    for indices, inputs in iter_bucketed_batches(tokenizer, texts, max_batch_size=batch_size):
+        with torch.no_grad():
+            logits = model(**inputs).logits
+        probabilities[indices] = torch.softmax(logits, dim=-1).numpy()
+    return probabilities, time.perf_counter() - started
+
+
+def single_latency_ms(tokenizer, model, texts, repeat):
+    samples = []
+    for text in texts[:repeat]:
+        inputs = tokenize_batch(tokenizer, [text])
+        start = time.perf_counter()
+        with torch.no_grad():
+            model(**inputs)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples) if samples else 0.0
+
+
+def compare(args):
+    try:
+        df = pd.read_csv(args.data)
+    except FileNotFoundError:
+        print(f"Error: 평가 데이터를 찾을 수 없습니다: {args.data}. preprocess_test.py 를 먼저 실행하세요.")
+        exit()
+    df = df.dropna(subset=['content'])
+    if args.limit:
+        df = df.head(args.limit)
+    texts = df['content'].astype(str).tolist()
+    labels = df['label'].to_numpy() if 'label' in df.columns else None
+    print(f"비교 데이터: {args.data} ({len(texts)}건)")
+
+    tokenizer = AutoTokenizer.from_pretrained(args.model_path)
+    report = {}
+    reference = None
+    for backend in args.backends:
+        try:
+            model = load_sequence_classifier(args.model_path, backend)
+        except (FileNotFoundError, ImportError) as e:
+            print(f"[{backend}] 건너뜀: {e}")
+            continue
+
+        # 첫 호출의 초기화 비용이 지연 시간에 섞이지 않도록 한 번 워밍업합니다.
+        predict_probabilities(tokenizer, model, texts[:2], args.batch_size)
+        probabilities, elapsed = predict_probabilities(tokenizer, model, texts, args.batch_size)
+        predictions = probabilities.argmax(axis=1)
+        if reference is None:
+            reference = probabilities
+
+        entry = {
+            "articles_per_sec": len(texts) / elapsed if elapsed else 0.0,
+            "single_p50_ms": single_latency_ms(tokenizer, model, texts, args.latency_samples),
+            "max_prob_deviation": float(np.abs(probabilities - reference).max()),
+            "label_agreement": float((predictions == reference.argmax(axis=1)).mean()),
+        }
+        if labels is not None:
+            entry["accuracy"] = float((predictions == labels).mean())
+        report[backend] = entry
+        print(f"[{backend:10s}] {entry['articles_per_sec']:7.2f} articles/sec | 단건 p50 {entry['single_p50_ms']:8.1f}ms | "
+              f"최대 확률 편차 {entry['max_prob_deviation']:.4f} | 라벨 일치율 {entry['label_agreement']:.4f}"
+              + (f" | 정확도 {entry['accuracy']:.4f}" if 'accuracy' in entry else ""))
+
+    # 허용 오차 안에 드는 백엔드 중 가장 빠른 것을 추천합니다.
+    eligible = [
+        name for name, entry in report.items()
+        if entry["max_prob_deviation"] <= args.tolerance and entry["label_agreement"] >= args.min_agreement
+    ]
+    if eligible:
+        best = max(eligible, key=lambda name: report[name]["articles_per_sec"])
+        print(f"\n추천 백엔드: MODEL_BACKEND={best} (허용 편차 {args.tolerance}, 최소 일치율 {args.min_agreement})")
+        report["recommended"] = best
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추론 백엔드 변환 및 정확도/지연 시간 비교")
+    parser.add_argument("--model-path", default=model_path)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export-onnx", help="모델을 ONNX 로 내보내기")
+    export_parser.add_argument("--output", help="기본값: <모델 경로>/onnx/model.onnx")
+    export_parser.add_argument("--opset", type=int, default=17)
+    export_parser.set_defaults(func=export_onnx)
+
+    compare_parser = subparsers.add_parser("compare", help="백엔드별 확률 편차/라벨 일치율/지연 시간 비교")
+    compare_parser.add_argument("--data", default=test_data_path)
+    compare_parser.add_argument("--limit", type=int, default=500, help="비교할 기사 수 (0 이면 전체)")
+    compare_parser.add_argument("--backends", nargs="+", choices=MODEL_BACKENDS, default=list(MODEL_BACKENDS),
+                                help="첫 번째 백엔드가 비교 기준이 됩니다.")
+    compare_parser.add_argument("--batch-size", type=int, default=16)
+    compare_parser.add_argument("--latency-samples", type=int, default=20)
+    compare_parser.add_argument("--tolerance", type=float, default=0.02, help="허용 최대 확률 편차")
+    compare_parser.add_argument("--min-agreement", type=float, default=0.99, help="최소 라벨 일치율")
+    compare_parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# scripts/dataset_cache.py
+# 토크나이즈한 학습/평가 데이터를 Arrow 파일로 저장해 두고, 학습과 평가에서 메모리 맵으로 바로 읽는 캐시.
+# 캐시 디렉토리는 토크나이저(어휘/설정의 해시)와 max_length 로 나뉘므로 둘 중 하나가 바뀌면 새로 만들어집니다.
+#   data/cache/<토크나이저 이름>-<해시>-len<max_length>/<split>.arrow (+ <split>.json 메타데이터)
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+import pyarrow as pa
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+CACHE_ROOT = os.path.join(project_root, 'data', 'cache')
+
+# 캐시 파일 구조가 바뀌면 올려서 이전 캐시를 쓰지 않게 합니다.
+CACHE_VERSION = 2
+
+SCHEMA = pa.schema([
+    ("input_ids", pa.list_(pa.int32())),
+    ("attention_mask", pa.list_(pa.int8())),
+    ("labels", pa.int64()),
+    # 패딩 전 토큰 수. 학습 시 길이별 샘플링(group_by_length)과 tokens/sec 계산에 씁니다.
+    ("length", pa.int32()),
+])
+
+
+def tokenizer_fingerprint(tokenizer) -> str:
+    """같은 이름이라도 어휘나 정규화 설정이 다르면 다른 값이 나오도록 토크나이저 정의 전체를 해시합니다."""
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    backend = getattr(tokenizer, "backend_tokenizer", None)
+    if backend is not None:
+        digest.update(backend.to_str().encode("utf8"))
+    else:
+        digest.update(json.dumps(sorted(tokenizer.get_vocab().items()), ensure_ascii=False).encode("utf8"))
+    digest.update(type(tokenizer).__name__.encode())
+    return digest.hexdigest()[:12]
+
+
+def cache_dir_for(tokenizer, max_length: int, root: str = CACHE_ROOT) -> str:
+    name = re.sub(r"[^0-9A-Za-z._-]+", "_", os.path.basename(str(tokenizer.name_or_path).rstrip("/\\")) or "tokenizer")
+    return os.path.join(root, f"{name}-{tokenizer_fingerprint(tokenizer)}-len{max_length}")
+
+
+class ArrowCacheWriter:
+    """
+    청크 단위로 토큰 ID 를 Arrow 스트림 파일에 이어 씁니다. 임시 파일에 쓴 뒤 close 에서 이름을 바꾸므로
+    중간에 중단되어도 반쯤 쓰인 캐시가 남지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.rows = 0
+        self._sink = pa.OSFile(self.tmp_path, "wb")
+        self._writer = pa.ipc.new_stream(self._sink, SCHEMA)
+
+    def write(self, input_ids: Sequence[List[int]], attention_mask: Sequence[List[int]], labels: Sequence[int]) -> None:
+        lengths = [len(ids) for ids in input_ids]
+        table = pa.table(
+            {"input_ids": input_ids, "attention_mask": attention_mask, "labels": labels, "length": lengths}, schema=SCHEMA
+        )
+        self._writer.write_table(table)
+        self.rows += len(labels)
+
+    def close(self, meta: Dict[str, Any]) -> None:
+        self._writer.close()
+        self._sink.close()
+        os.replace(self.tmp_path, self.path)
+        with open(os.path.splitext(self.path)[0] + ".json", "w", encoding="utf8") as f:
+            json.dump({**meta, "rows": self.rows, "cache_version": CACHE_VERSION}, f, ensure_ascii=False, indent=2)
+
+    def abort(self) -> None:
+        self._writer.close()
+        self._sink.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def split_path(tokenizer, max_length: int, split: str, root: str = CACHE_ROOT) -> str:
+    return os.path.join(cache_dir_for(tokenizer, max_length, root), f"{split}.arrow")
+
+
+def read_meta(tokenizer, max_length: int, split: str, root: str = CACHE_ROOT) -> Optional[Dict[str, Any]]:
+    meta_path = os.path.splitext(split_path(tokenizer, max_length, split, root))[0] + ".json"
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf8") as f:
+        return json.load(f)
+
+
+def load_tokenized_split(tokenizer, max_length: int, split: str, root: str = CACHE_ROOT):
+    """
+    캐시된 split 을 datasets.Dataset 으로 엽니다. Arrow 파일을 메모리 맵으로 읽으므로 데이터 크기와 무관하게 바로 열립니다.
+    캐시가 없으면 FileNotFoundError 를 냅니다.
+    """
+    from datasets import Dataset
+
+    path = split_path(tokenizer, max_length, split, root)
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"토크나이즈 캐시가 없습니다: {path}. "
+            f"'python scripts/preprocess.py --split {split} --tokenizer {tokenizer.name_or_path} --max-length {max_length}' 를 먼저 실행하세요."
+        )
+    return Dataset.from_file(path, in_memory=False)
@@ -0,0 +1,288 @@
+# scripts/distill.py
+# 학습된 political_bias_model(교사)의 soft label 로 레이어 수와 hidden size 를 줄인 학생 모델을 학습(지식 증류)하고,
+# test.csv 에서 교사 대비 정확도와 지연 시간을 비교합니다. 학생 모델은 교사와 같은 토크나이저/라벨 구성으로 저장되므로
+# 저장된 디렉토리를 그대로 political_bias_model 자리에 두면 서빙 코드가 바로 읽습니다.
+#   distill : 교사 soft label 계산 -> 학생 학습 -> 저장 -> 비교 리포트
+#   report  : 이미 만든 학생 모델과 교사를 비교만 합니다.
+#
+# 사용법:
+#   python scripts/distill.py distill --layers 4 --epochs 3                   # 교사와 같은 너비, 교사 레이어로 초기화
+#   python scripts/distill.py distill --layers 6 --temperature 2 --alpha 0.7
+#   python scripts/distill.py distill --layers 4 --hidden-size 384            # 더 좁은 학생 (무작위 초기화, 데이터가 많을 때만)
+#   python scripts/distill.py report --student data/models/political_bias_model_student --limit 1000
+import argparse
+import copy
+import os
+import re
+import sys
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from sklearn.metrics import precision_recall_fscore_support
+from transformers import AutoModelForSequenceClassification, AutoTokenizer, Trainer, TrainingArguments, set_seed
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+teacher_model_path = os.path.join(project_root, 'app', 'data', 'models', 'political_bias_model')
+student_output_dir = os.path.join(project_root, 'data', 'models', 'political_bias_model_student')
+train_data_path = os.path.join(project_root, 'data', 'processed', 'train.csv')
+test_data_path = os.path.join(project_root, 'data', 'processed', 'test.csv')
+
+# 서빙 코드와 같은 추론 엔진과 토크나이즈 헬퍼를 사용하기 위해 app 디렉토리를 import 경로에 추가
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from services.ml_service import MLService
+from services.runtime import configure_torch_threads
+from services.tokenization import MAX_LENGTH
+
+from convert_model import predict_probabilities, single_latency_ms
+from eval_utils import load_split, write_report
+from train import PaddingCollator, ThroughputCallback, compute_metrics, count_tokens, version_specific_kwargs
+
+
+class DistillationTrainer(Trainer):
+    """
+    교사 로짓(teacher_logits 컬럼)과의 KL divergence 와 정답 라벨 cross entropy 를 섞어 학습합니다.
+    loss = alpha * T^2 * KL(student/T || teacher/T) + (1 - alpha) * CE(student, labels)
+    """
+
+    def __init__(self, *args, temperature: float = 2.0, alpha: float = 0.5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.temperature = temperature
+        self.alpha = alpha
+
+    def compute_loss(self, model, inputs, return_outputs=False, **kwargs):
+        teacher_logits = inputs.pop("teacher_logits")
+        outputs = model(**inputs)
+        logits = outputs.logits
+        t = self.temperature
+        soft_loss = F.kl_div(
+            F.log_softmax(logits / t, dim=-1),
+            F.softmax(teacher_logits.to(logits.dtype) / t, dim=-1),
+            reduction="batchmean",
+        ) * (t * t)
+        hard_loss = F.cross_entropy(logits, inputs["labels"])
+        loss = self.alpha * soft_loss + (1.0 - self.alpha) * hard_loss
+        return (loss, outputs) if return_outputs else loss
+
+
+def teacher_logits(teacher: MLService, features: List[Dict[str, List[int]]], chunk_size: int) -> np.ndarray:
+    """교사 모델의 로짓을 서빙과 같은 길이 버킷 forward 로 구합니다."""
+    outputs = []
+    for start in range(0, len(features), chunk_size):
+        outputs.append(teacher.forward_logits(features[start:start + chunk_size]).float().numpy())
+        done = min(start + chunk_size, len(features))
+        print(f"[teacher] soft label {done}/{len(features)}")
+    return np.concatenate(outputs) if outputs else np.zeros((0, 3), dtype=np.float32)
+
+
+def build_student(teacher_model, num_layers: int, hidden_size: Optional[int]):
+    """
+    교사 설정에서 레이어 수와 hidden size 만 줄인 학생 모델을 만듭니다. hidden_size 가 None 이거나 교사와 같으면
+    교사의 임베딩과 균등 간격으로 고른 레이어, 분류 헤드로 초기화하고, 너비가 다르면 무작위로 초기화합니다.
+    """
+    config = copy.deepcopy(teacher_model.config)
+    config.num_hidden_layers = num_layers
+    if hidden_size and hidden_size != config.hidden_size:
+        config.hidden_size = hidden_size
+        config.num_attention_heads = max(1, hidden_size // 64)
+        config.intermediate_size = hidden_size * 4
+    student = AutoModelForSequenceClassification.from_config(config)
+
+    if config.hidden_size == teacher_model.config.hidden_size:
+        teacher_layers = teacher_model.config.num_hidden_layers
+        picks = np.linspace(0, teacher_layers - 1, num_layers).round().astype(int).tolist()
+        teacher_state = teacher_model.state_dict()
+        state = {}
+        for key in student.state_dict():
+            source = re.sub(r"\.layer\.(\d+)\.", lambda m: f".layer.{picks[int(m.group(1))]}.", key)
+            if source in teacher_state:
+                state[key] = teacher_state[source]
+        student.load_state_dict(state, strict=False)
+        print(f"학생 모델을 교사 레이어 {picks} 로 초기화했습니다.")
+    else:
+        print(f"Warning: 학생 hidden size({config.hidden_size})가 교사({teacher_model.config.hidden_size})와 달라 "
+              "사전학습 가중치 없이 무작위로 초기화합니다. 레이블 데이터만으로 처음부터 학습하므로 정확도가 크게 떨어질 수 있습니다.")
+    return student
+
+
+def parameter_count(model) -> int:
+    return sum(p.numel() for p in model.parameters())
+
+
+def build_report(teacher_path: str, student_path: str, args) -> Dict[str, Any]:
+    """test.csv 에서 교사와 학생의 정확도, 교사 대비 라벨 일치율, 처리량, 단건 지연 시간을 비교합니다."""
+    df = load_split(args.test_data, args.limit)
+    texts = df['content'].astype(str).tolist()
+    labels = df['label'].astype(int).to_numpy()
+    print(f"비교 데이터: {args.test_data} ({len(texts)}건)")
+
+    report: Dict[str, Any] = {}
+    reference = None
+    for name, path in (("teacher", teacher_path), ("student", student_path)):
+        tokenizer = AutoTokenizer.from_pretrained(path)
+        model = AutoModelForSequenceClassification.from_pretrained(path)
+        model.eval()
+        # 첫 호출의 초기화 비용이 지연 시간에 섞이지 않도록 한 번 워밍업합니다.
+        predict_probabilities(tokenizer, model, texts[:2], args.eval_batch_size)
+        probabilities, elapsed = predict_probabilities(tokenizer, model, texts, args.eval_batch_size)
+        predictions = probabilities.argmax(axis=1)
+        if reference is None:
+            reference = predictions
+        _, _, f1, _ = precision_recall_fscore_support(labels, predictions, average='weighted', zero_division=0)
+        report[name] = {
+            "path": path,
+            "layers": model.config.num_hidden_layers,
+            "hidden_size": model.config.hidden_size,
+            "parameters": parameter_count(model),
+            "accuracy": float((predictions == labels).mean()) if len(labels) else 0.0,
+            "f1": float(f1),
+            "teacher_agreement": float((predictions == reference).mean()) if len(labels) else 0.0,
+            "articles_per_sec": len(texts) / elapsed if elapsed else 0.0,
+            "single_p50_ms": single_latency_ms(tokenizer, model, texts, args.latency_samples),
+        }
+
+    teacher, student = report["teacher"], report["student"]
+    report["speedup"] = student["articles_per_sec"] / teacher["articles_per_sec"] if teacher["articles_per_sec"] else 0.0
+    report["accuracy_drop"] = teacher["accuracy"] - student["accuracy"]
+    for name in ("teacher", "student"):
+        entry = report[name]
+        print(f"[{name:7s}] {entry['layers']:2d}층/{entry['hidden_size']:4d} | 파라미터 {entry['parameters'] / 1e6:7.1f}M | "
+              f"{entry['articles_per_sec']:7.2f} articles/sec | 단건 p50 {entry['single_p50_ms']:7.1f}ms | "
+              f"정확도 {entry['accuracy']:.4f} | F1 {entry['f1']:.4f} | 교사 일치율 {entry['teacher_agreement']:.4f}")
+    print(f"처리량 {report['speedup']:.2f}배, 정확도 변화 {-report['accuracy_drop']:+.4f}")
+    return report
+
+
+def distill(args):
+    from datasets import Dataset
+
+    set_seed(args.seed)
+    teacher = MLService(args.teacher, max_length=args.max_length)
+    teacher.model.eval()
+
+    # 교사와 학생은 같은 토크나이저를 쓰므로 한 번 토크나이즈한 입력을 soft label 계산과 학생 학습에 함께 씁니다.
+    df = load_split(args.train_data, args.limit_train)
+    print(f"학습 데이터: {args.train_data} ({len(df)}건)")
+    features = teacher.encode(df['content'].astype(str).tolist())
+    soft_labels = teacher_logits(teacher, features, args.teacher_chunk_size)
+
+    train_dataset = Dataset.from_dict({
+        "input_ids": [f["input_ids"] for f in features],
+        "attention_mask": [f["attention_mask"] for f in features],
+        "labels": df['label'].astype(int).tolist(),
+        "length": [len(f["input_ids"]) for f in features],
+        "teacher_logits": soft_labels.tolist(),
+    })
+    split = train_dataset.train_test_split(test_size=args.eval_fraction, seed=args.seed)
+
+    student = build_student(teacher.model, args.layers, args.hidden_size)
+    print(f"교사 파라미터 {parameter_count(teacher.model) / 1e6:.1f}M -> 학생 {parameter_count(student) / 1e6:.1f}M")
+
+    use_cpu = not torch.cuda.is_available()
+    training_args = TrainingArguments(
+        output_dir=args.output_dir,
+        eval_strategy="epoch",
+        save_strategy="epoch",
+        per_device_train_batch_size=args.batch_size,
+        per_device_eval_batch_size=args.eval_batch_size,
+        gradient_accumulation_steps=args.grad_accum,
+        num_train_epochs=args.epochs,
+        learning_rate=args.lr,
+        weight_decay=args.weight_decay,
+        logging_steps=args.logging_steps,
+        save_total_limit=1,
+        load_best_model_at_end=True,
+        metric_for_best_model="eval_loss",
+        use_cpu=use_cpu,
+        dataloader_num_workers=args.num_workers,
+        dataloader_persistent_workers=args.num_workers > 0,
+        dataloader_pin_memory=not use_cpu,
+        # length / teacher_logits 컬럼을 남겨 두고, length 는 PaddingCollator 가, teacher_logits 는 compute_loss 가 뺍니다.
+        remove_unused_columns=False,
+        seed=args.seed,
+        report_to="none",
+        **version_specific_kwargs(group_by_length=True),
+    )
+    trainer = DistillationTrainer(
+        model=student,
+        args=training_args,
+        train_dataset=split["train"],
+        eval_dataset=split["test"],
+        data_collator=PaddingCollator(tokenizer=teacher.tokenizer),
+        compute_metrics=compute_metrics,
+        callbacks=[ThroughputCallback(len(split["train"]), count_tokens(split["train"]))],
+        temperature=args.temperature,
+        alpha=args.alpha,
+    )
+
+    print("Starting distillation...")
+    trainer.train()
+    trainer.save_model(args.output_dir)
+    teacher.tokenizer.save_pretrained(args.output_dir)
+    print(f"Student model and tokenizer saved to: {args.output_dir}")
+
+    del teacher
+    report = build_report(args.teacher, args.output_dir, args)
+    report["distillation"] = {
+        "temperature": args.temperature,
+        "alpha": args.alpha,
+        "epochs": args.epochs,
+        "train_samples": len(split["train"]),
+    }
+    write_report(report, args.output or os.path.join(args.output_dir, "distill_report.json"))
+
+
+def report(args):
+    result = build_report(args.teacher, args.student, args)
+    if args.output:
+        write_report(result, args.output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정치 편향 모델 지식 증류 및 교사/학생 비교")
+    parser.add_argument("--teacher", default=teacher_model_path, help="교사 모델 디렉토리")
+    parser.add_argument("--test-data", default=test_data_path)
+    parser.add_argument("--limit", type=int, default=1000, help="비교에 쓸 test 기사 수 (0 이면 전체)")
+    parser.add_argument("--eval-batch-size", type=int, default=16)
+    parser.add_argument("--latency-samples", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op 스레드 수 (0 이면 코어 수)")
+    parser.add_argument("--output", help="비교 결과를 저장할 JSON 파일 경로")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    distill_parser = subparsers.add_parser("distill", help="교사 soft label 로 학생 모델 학습 후 비교")
+    distill_parser.add_argument("--output-dir", default=student_output_dir)
+    distill_parser.add_argument("--train-data", default=train_data_path)
+    distill_parser.add_argument("--limit-train", type=int, help="앞에서부터 이 개수만 증류 (빠른 점검용)")
+    distill_parser.add_argument("--layers", type=int, default=4, help="학생 레이어 수")
+    distill_parser.add_argument("--hidden-size", type=int, default=None,
+                                help="학생 hidden size (기본: 교사와 같은 너비로 두고 교사 레이어로 초기화, "
+                                     "더 좁게 주면 무작위 초기화)")
+    distill_parser.add_argument("--temperature", type=float, default=2.0)
+    distill_parser.add_argument("--alpha", type=float, default=0.5, help="soft label 손실 비중 (나머지는 정답 라벨)")
+    distill_parser.add_argument("--epochs", type=float, default=3)
+    distill_parser.add_argument("--batch-size", type=int, default=16)
+    distill_parser.add_argument("--grad-accum", type=int, default=1)
+    distill_parser.add_argument("--lr", type=float, default=1e-4)
+    distill_parser.add_argument("--weight-decay", type=float, default=0.01)
+    distill_parser.add_argument("--max-length", type=int, default=MAX_LENGTH)
+    distill_parser.add_argument("--eval-fraction", type=float, default=0.05, help="학습 중 검증에 떼어 둘 비율")
+    distill_parser.add_argument("--teacher-chunk-size", type=int, default=256, help="soft label 계산 시 한 번에 넘길 기사 수")
+    distill_parser.add_argument("--num-workers", type=int, default=0)
+    distill_parser.add_argument("--logging-steps", type=int, default=50)
+    distill_parser.add_argument("--seed", type=int, default=42)
+    distill_parser.set_defaults(func=distill)
+
+    report_parser = subparsers.add_parser("report", help="교사와 학생 모델의 정확도/지연 시간 비교")
+    report_parser.add_argument("--student", default=student_output_dir)
+    report_parser.set_defaults(func=report)
+
+    args = parser.parse_args()
+    if args.threads > 0:
+        configure_torch_threads(args.threads)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
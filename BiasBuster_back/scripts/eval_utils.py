@@ -0,0 +1,26 @@
+# scripts/eval_utils.py
+# 학습/비교 스크립트(distill.py, train_cascade.py)가 함께 쓰는 가벼운 헬퍼. 전처리된 CSV 를 읽고 비교 리포트를 JSON 으로 저장합니다.
+# transformers 등 무거운 의존성 없이 import 할 수 있도록 pandas 만 씁니다.
+import json
+import sys
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+
+def load_split(path: str, limit: Optional[int] = None) -> pd.DataFrame:
+    try:
+        df = pd.read_csv(path)
+    except FileNotFoundError:
+        print(f"Error: 데이터를 찾을 수 없습니다: {path}. preprocess.py 를 먼저 실행하세요.")
+        sys.exit(1)
+    df = df.dropna(subset=['content', 'label'])
+    if limit:
+        df = df.head(limit)
+    return df
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {path}")
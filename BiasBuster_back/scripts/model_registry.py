@@ -0,0 +1,85 @@
+# scripts/model_registry.py
+# 로컬 모델 레지스트리(MODEL_REGISTRY_PATH)에 학습된 모델을 버전으로 등록하고 서빙 버전을 전환합니다.
+# 서버가 MODEL_REGISTRY_POLL_SECONDS 로 CURRENT 를 감시 중이면 activate 만으로 무중단 교체가 시작됩니다.
+#
+# 사용법:
+#   python scripts/model_registry.py list
+#   python scripts/model_registry.py publish ./results/political_bias_model --version v3 --activate
+#   python scripts/model_registry.py activate v2        # 이전 버전으로 되돌리기
+import argparse
+import os
+import shutil
+import sys
+import time
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from core.config import settings
+from services.model_registry import ModelRegistry, validate_version
+
+
+def list_versions(registry: ModelRegistry, args) -> None:
+    current = registry.current()
+    versions = registry.versions()
+    if not versions:
+        print(f"등록된 버전이 없습니다: {registry.root}")
+    for version in versions:
+        print(f"{'*' if version == current else ' '} {version}")
+
+
+def publish(registry: ModelRegistry, args) -> None:
+    if not os.path.exists(os.path.join(args.model_dir, "config.json")):
+        sys.exit(f"Error: 모델 디렉토리가 아닙니다 (config.json 없음): {args.model_dir}")
+    version = validate_version(args.version or time.strftime("v%Y%m%d-%H%M%S"))
+    target = os.path.join(registry.root, version)
+    if os.path.exists(target):
+        sys.exit(f"Error: 이미 있는 버전입니다: {version}")
+
+    # 복사가 끝나기 전에는 서버가 버전으로 인식하지 않도록 숨김 디렉토리에 복사한 뒤 rename 합니다.
+    os.makedirs(registry.root, exist_ok=True)
+    staging = os.path.join(registry.root, f".{version}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    shutil.copytree(args.model_dir, staging, ignore=shutil.ignore_patterns("checkpoint-*", "runs"))
+    os.replace(staging, target)
+    print(f"등록 완료: {version} -> {target}")
+    if args.activate:
+        registry.set_current(version)
+        print(f"서빙 버전 전환: {version}")
+
+
+def activate(registry: ModelRegistry, args) -> None:
+    try:
+        registry.set_current(args.version)
+    except (KeyError, ValueError) as e:
+        versions = ", ".join(registry.versions()) or "없음"
+        sys.exit(f"Error: {e.args[0]} (등록된 버전: {versions})")
+    print(f"서빙 버전 전환: {args.version}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 모델 레지스트리 관리")
+    parser.add_argument("--root", default=settings.MODEL_REGISTRY_PATH, help="레지스트리 디렉토리 (기본: MODEL_REGISTRY_PATH)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="등록된 버전 목록 (* 는 서빙 버전)").set_defaults(func=list_versions)
+
+    publish_parser = subparsers.add_parser("publish", help="학습된 모델 디렉토리를 새 버전으로 등록")
+    publish_parser.add_argument("model_dir")
+    publish_parser.add_argument("--version", help="버전 이름 (기본: v<날짜-시각>)")
+    publish_parser.add_argument("--activate", action="store_true", help="등록 후 바로 서빙 버전으로 전환")
+    publish_parser.set_defaults(func=publish)
+
+    activate_parser = subparsers.add_parser("activate", help="서빙 버전 전환 (CURRENT 갱신)")
+    activate_parser.add_argument("version")
+    activate_parser.set_defaults(func=activate)
+
+    args = parser.parse_args()
+    if not args.root:
+        parser.error("--root 또는 MODEL_REGISTRY_PATH 를 지정하세요.")
+    args.func(ModelRegistry(args.root), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,18 @@
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import os
+import sys
+from typing import List
 
 # 모델 저장 경로 설정
 script_dir = os.path.dirname(__file__)
 project_root = os.path.abspath(os.path.join(script_dir, '..'))
 model_path = os.path.join(project_root,'app', 'data', 'models', 'political_bias_model')
 
+# 서빙 코드와 같은 토크나이즈 헬퍼를 사용하기 위해 app 디렉토리를 import 경로에 추가
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from services.tokenization import MAX_LENGTH, iter_bucketed_batches, tokenize_batch
+
 # 라벨 매핑 (학습 시 사용한 라벨과 동일하게)
 # 0: 좌파/진보, 1: 중도, 2: 우파/보수
 LABEL_MAP = {
@@ -44,19 +50,32 @@ class PoliticalBiasPredictor:
                 "probability_distribution": []
             }
 
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            truncation=True,
-            padding="max_length",
-            max_length=512
-        ).to(self.device)
+        inputs = tokenize_batch(self.tokenizer, [text], max_length=MAX_LENGTH).to(self.device)
 
         with torch.no_grad():
             outputs = self.model(**inputs)
             logits = outputs.logits
             probabilities = torch.nn.functional.softmax(logits, dim=-1)[0] # 배치에서 첫 번째 결과
         
+        return self._to_result(probabilities)
+
+    def predict_political_bias_batch(self, texts: List[str], batch_size: int = 16):
+        """
+        여러 텍스트를 길이 버킷별 동적 패딩 배치로 예측합니다. 결과는 입력 순서를 따릅니다.
+        """
+        if not self.model or not self.tokenizer:
+            return [self.predict_political_bias(text) for text in texts]
+
+        results = [None] * len(texts)
+        for indices, inputs in iter_bucketed_batches(self.tokenizer, texts, max_batch_size=batch_size, max_length=MAX_LENGTH):
+            inputs = inputs.to(self.device)
+            with torch.no_grad():
+                probabilities = torch.nn.functional.softmax(self.model(**inputs).logits, dim=-1)
+            for idx, row in zip(indices, probabilities):
+                results[idx] = self._to_result(row)
+        return results
+
+    def _to_result(self, probabilities: torch.Tensor):
         # 가장 높은 확률을 가진 라벨 ID
         predicted_class_id = torch.argmax(probabilities).item()
         
@@ -81,9 +100,10 @@ if __name__ == "__main__":
         "문재인 정권의 소득주도성장 정책은 실패했으며, 막대한 국가 부채만 남긴 채 국민들에게 실망을 안겨주었다." # 우파성 비판
     ]
 
-    for i, text in enumerate(test_texts):
+    results = predictor.predict_political_bias_batch(test_texts)
+
+    for i, (text, result) in enumerate(zip(test_texts, results)):
         print(f"\n--- Test Text {i+1} ---")
         print(f"Text: {text[:100]}...") # 긴 텍스트는 일부만 출력
-        result = predictor.predict_political_bias(text)
         print(f"Predicted Bias: {result['predicted_bias_label']} (ID: {result['predicted_bias_id']})")
         print(f"Probabilities (Left/Center/Right): {result['probability_distribution']}")
\ No newline at end of file
@@ -0,0 +1,140 @@
+# scripts/preprocess.py
+# 원본 CSV(data/raw) 를 청크 단위로 스트리밍하며 전처리하고, 한 번만 토크나이즈해 Arrow 캐시(data/cache)로 저장합니다.
+# 전처리된 CSV(data/processed/<split>.csv) 도 함께 저장하므로 평가/변환 스크립트는 그대로 동작합니다.
+#
+# 사용법:
+#   python scripts/preprocess.py                         # train, test 모두
+#   python scripts/preprocess.py --split test --chunk-size 5000
+#   python scripts/preprocess.py --tokenizer klue/roberta-base --max-length 512 --no-csv
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+
+# 서빙 코드와 같은 토크나이즈 헬퍼를 사용하기 위해 app 디렉토리를 import 경로에 추가
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from services.tokenization import MAX_LENGTH, encode_texts
+
+from dataset_cache import CACHE_ROOT, ArrowCacheWriter, split_path
+
+RAW_FILES = {
+    "train": os.path.join(project_root, 'data', 'raw', 'complete_train_stratified.csv'),
+    "test": os.path.join(project_root, 'data', 'raw', 'complete_test_stratified.csv'),
+}
+PROCESSED_DIR = os.path.join(project_root, 'data', 'processed')
+DEFAULT_TOKENIZER = "klue/roberta-base"
+
+# label1 (1~5)을 3개의 클래스 (0:좌, 1:중도, 2:우)로 매핑
+# 1:매우진보, 2:진보 -> 0 / 3:중도 -> 1 / 4:보수, 5:매우보수 -> 2. 그 밖의 값은 제거합니다.
+LABEL1_TO_CLASS = {1: 0, 2: 0, 3: 1, 4: 2, 5: 2}
+
+OUTPUT_COLUMNS = ['title', 'content', 'label1', 'label2', 'label']
+
+
+def iter_clean_chunks(raw_path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """원본 CSV 를 chunk_size 행씩 읽어 결측/무효 라벨을 제거하고 정제한 DataFrame 을 돌려줍니다."""
+    reader = pd.read_csv(raw_path, encoding='utf8', usecols=['title', 'content', 'label1', 'label2'], chunksize=chunk_size)
+    for chunk in reader:
+        # content와 label1에 결측치가 있는 행 제거
+        chunk = chunk.dropna(subset=['content', 'label1'])
+        # 행마다 함수를 호출하지 않고 dict 매핑으로 한 번에 변환합니다. 매핑되지 않는 값은 NaN 이 되어 제거됩니다.
+        chunk = chunk.assign(label=pd.to_numeric(chunk['label1'], errors='coerce').map(LABEL1_TO_CLASS))
+        chunk = chunk.dropna(subset=['label'])
+        chunk['label'] = chunk['label'].astype(int)
+        # content 텍스트 정제 (개행 문자 제거 및 양쪽 공백 제거)
+        chunk['content'] = chunk['content'].astype(str).str.replace('\n', ' ', regex=False).str.strip()
+        yield chunk[OUTPUT_COLUMNS]
+
+
+def preprocess_split(split: str, raw_path: str, tokenizer, args) -> None:
+    if not os.path.exists(raw_path):
+        print(f"Error: Raw data file not found at {raw_path}")
+        print(f"Please ensure '{os.path.basename(raw_path)}' is in the 'data/raw/' directory.")
+        return
+
+    started = time.perf_counter()
+    csv_path = os.path.join(PROCESSED_DIR, f"{split}.csv")
+    csv_tmp_path = csv_path + ".tmp"
+    cache_path = split_path(tokenizer, args.max_length, split, args.cache_root) if tokenizer is not None else None
+    writer: Optional[ArrowCacheWriter] = ArrowCacheWriter(cache_path) if cache_path else None
+    if args.csv:
+        os.makedirs(PROCESSED_DIR, exist_ok=True)
+
+    rows = 0
+    label_counts: Counter = Counter()
+    try:
+        for i, chunk in enumerate(iter_clean_chunks(raw_path, args.chunk_size)):
+            if args.csv:
+                chunk.to_csv(csv_tmp_path, index=False, encoding='utf8', mode='w' if i == 0 else 'a', header=i == 0)
+            if writer is not None:
+                encodings = encode_texts(tokenizer, chunk['content'].tolist(), max_length=args.max_length)
+                writer.write(encodings["input_ids"], encodings["attention_mask"], chunk['label'].tolist())
+            rows += len(chunk)
+            label_counts.update(chunk['label'].tolist())
+            print(f"[{split}] 청크 {i} 처리 | 누적 {rows}행")
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        if os.path.exists(csv_tmp_path):
+            os.remove(csv_tmp_path)
+        raise
+
+    if args.csv:
+        if rows:
+            os.replace(csv_tmp_path, csv_path)
+        else:
+            pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(csv_path, index=False, encoding='utf8')
+    if writer is not None:
+        writer.close({
+            "split": split,
+            "source": os.path.abspath(raw_path),
+            "source_size": os.path.getsize(raw_path),
+            "source_mtime": os.path.getmtime(raw_path),
+            "tokenizer": str(tokenizer.name_or_path),
+            "max_length": args.max_length,
+            "label_counts": {str(k): v for k, v in sorted(label_counts.items())},
+        })
+
+    print(f"{split.capitalize()} 데이터 전처리 완료 ({time.perf_counter() - started:.1f}초).")
+    if args.csv:
+        print(f"  CSV 저장 경로: {csv_path}")
+    if cache_path:
+        print(f"  토크나이즈 캐시: {cache_path}")
+    print(f"최종 데이터 개수: {rows}")
+    print(f"라벨 분포:\n{pd.Series(label_counts).sort_index()}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="원본 데이터 전처리 + 토크나이즈 캐시 생성")
+    parser.add_argument("--split", choices=["train", "test", "all"], default="all")
+    parser.add_argument("--raw", help="원본 CSV 경로 (--split 이 train 또는 test 일 때만)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="한 번에 읽고 토크나이즈할 행 수")
+    parser.add_argument("--tokenizer", default=DEFAULT_TOKENIZER, help="학습에 쓰는 토크나이저 이름 또는 경로")
+    parser.add_argument("--max-length", type=int, default=MAX_LENGTH)
+    parser.add_argument("--cache-root", default=CACHE_ROOT)
+    parser.add_argument("--no-tokenize", dest="tokenize", action="store_false", help="CSV 만 만들고 토크나이즈 캐시는 생략")
+    parser.add_argument("--no-csv", dest="csv", action="store_false", help="전처리 CSV 는 만들지 않음")
+    args = parser.parse_args(argv)
+
+    if args.raw and args.split == "all":
+        parser.error("--raw 는 --split train 또는 --split test 와 함께 써야 합니다.")
+
+    tokenizer = None
+    if args.tokenize:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(args.tokenizer)
+
+    splits = ["train", "test"] if args.split == "all" else [args.split]
+    for split in splits:
+        preprocess_split(split, args.raw or RAW_FILES[split], tokenizer, args)
+
+
+if __name__ == "__main__":
+    main()
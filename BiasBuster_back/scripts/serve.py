@@ -0,0 +1,144 @@
+# scripts/serve.py
+# 여러 워커 프로세스로 API 서버를 실행합니다 (Linux/macOS, os.fork 필요).
+# 마스터가 모델을 한 번만 로드한 뒤 fork 하므로 워커들은 가중치 메모리 페이지를 copy-on-write 로 공유하고,
+# 각 워커의 torch 스레드 수는 코어 수 / 워커 수 (또는 TORCH_NUM_THREADS) 로 맞춰 코어를 나눠 씁니다.
+#
+# 사용법:
+#   python scripts/serve.py --workers 4 --port 8001
+#   SERVE_WORKERS=4 TORCH_NUM_THREADS=2 python scripts/serve.py
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+
+# 서빙 코드(main.py, core, services)를 그대로 쓰기 위해 app 디렉토리를 import 경로에 추가
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from core.config import settings
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """모든 워커가 함께 accept 할 리스닝 소켓을 마스터에서 만듭니다."""
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(sock: socket.socket, worker_index: int, log_level: str) -> None:
+    import uvicorn
+    import main as server_app
+
+    # 마스터의 종료 신호 처리기를 물려받지 않도록 기본값으로 되돌립니다. uvicorn 이 자체 처리기를 등록합니다.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    print(f"[serve] 워커 {worker_index} 시작 (pid {os.getpid()})")
+    config = uvicorn.Config(server_app.app, log_level=log_level)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델을 미리 로드한 뒤 fork 하는 멀티 워커 API 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--workers", type=int, default=settings.SERVE_WORKERS)
+    parser.add_argument("--threads-per-worker", type=int, default=settings.TORCH_NUM_THREADS,
+                        help="워커별 torch intra-op 스레드 수 (0 이면 코어 수 / 워커 수)")
+    parser.add_argument("--no-preload", action="store_true", help="fork 전에 모델을 로드하지 않고 워커마다 따로 로드")
+    parser.add_argument("--model-path", help="정치 편향 모델 디렉토리 (기본: app/data/models/political_bias_model)")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        parser.error("이 플랫폼은 os.fork 를 지원하지 않습니다. uvicorn --workers 를 사용하세요.")
+    if args.workers < 1:
+        parser.error("--workers 는 1 이상이어야 합니다.")
+
+    # 워커의 startup 에서 읽는 설정이므로 fork 전에 덮어써 둡니다.
+    settings.SERVE_WORKERS = args.workers
+    settings.TORCH_NUM_THREADS = args.threads_per_worker
+
+    import main as server_app
+    if args.model_path:
+        server_app.political_bias_model_path = os.path.abspath(args.model_path)
+
+    sock = bind_socket(args.host, args.port)
+
+    preload = settings.SERVE_PRELOAD and not args.no_preload
+    if preload and settings.INFERENCE_EXECUTOR == "process":
+        # process 실행기의 워커는 spawn 으로 새로 시작해 모델을 직접 로드하므로 미리 로드해도 공유되지 않습니다.
+        print("[serve] INFERENCE_EXECUTOR=process 에서는 모델 사전 로드를 건너뜁니다.")
+        preload = False
+    if preload and settings.MODEL_BACKEND != "torch":
+        # onnx 는 세션을 만들 때 (워커 스레드 수가 정해지기 전의) 코어 수만큼 스레드 풀을 띄우고,
+        # torch_int8 은 양자화하면서 마스터에서 torch 연산을 실행합니다. 어느 쪽이든 그 뒤에 fork 하면
+        # 워커가 교착되거나 코어를 과다하게 쓸 수 있으므로 워커마다 따로 로드합니다.
+        print(f"[serve] MODEL_BACKEND={settings.MODEL_BACKEND} 에서는 모델 사전 로드를 건너뜁니다.")
+        preload = False
+    if preload:
+        # fp32 torch 모델은 가중치만 읽고 torch 연산을 실행하지 않으므로 fork 전에 로드해도 됩니다.
+        # forward 는 워커에서만 실행합니다. 마스터가 torch 스레드 풀을 띄운 뒤 fork 하면 워커가 교착될 수 있습니다.
+        started = time.perf_counter()
+        server_app.load_bias_model(server_app.resolve_model_path())
+        print(f"[serve] fork 전 모델 로드 완료: {(time.perf_counter() - started) * 1000:.0f}ms")
+        # 이후 GC 가 공유 객체의 헤더를 건드려 페이지가 복사되지 않도록 지금까지 만든 객체를 GC 대상에서 뺍니다.
+        gc.freeze()
+
+    children: Dict[int, int] = {}
+
+    def spawn(worker_index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(sock, worker_index, args.log_level)
+            finally:
+                os._exit(0)
+        children[pid] = worker_index
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for i in range(args.workers):
+        spawn(i)
+    print(f"[serve] http://{args.host}:{args.port} 에서 워커 {args.workers}개 실행 "
+          f"(사전 로드: {'켜짐' if preload else '꺼짐'}, 마스터 pid {os.getpid()})")
+
+    # 비정상 종료한 워커는 다시 띄우고, 종료 신호를 받으면 모든 워커가 끝날 때까지 기다립니다.
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        worker_index = children.pop(pid, None)
+        if worker_index is None or stopping:
+            continue
+        print(f"[serve] 워커 {worker_index} (pid {pid}) 가 종료 코드 {os.waitstatus_to_exitcode(status)} 로 끝나 다시 시작합니다.")
+        time.sleep(1)
+        spawn(worker_index)
+
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,28 @@
 # scripts/train_model.py
-import pandas as pd
+# preprocess.py 가 만든 토크나이즈 캐시로 정치 편향 분류 모델을 학습합니다. GPU 없이 CPU 에서도 돌릴 수 있도록
+# 배치 내 동적 패딩, 길이별 샘플링, gradient accumulation, (지원하는 CPU 에서) bf16 autocast 를 사용합니다.
+#
+# 사용법:
+#   python scripts/train.py
+#   python scripts/train.py --batch-size 16 --grad-accum 4 --num-workers 2 --bf16
+#   python scripts/train.py --epochs 1 --max-train-samples 2000 --threads 8
+import argparse
+import dataclasses
+import json
 import os
-from datasets import Dataset
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, Trainer, TrainingArguments
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from transformers import (
+    AutoTokenizer,
+    AutoModelForSequenceClassification,
+    DataCollatorWithPadding,
+    Trainer,
+    TrainerCallback,
+    TrainingArguments,
+    set_seed,
+)
 from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 import numpy as np
 import torch
@@ -11,52 +31,107 @@ import torch
 script_dir = os.path.dirname(__file__)
 project_root = os.path.abspath(os.path.join(script_dir, '..'))
 
-train_data_path = os.path.join(project_root, 'data', 'processed', 'train.csv')
-test_data_path = os.path.join(project_root, 'data', 'processed', 'test.csv')
 model_output_dir = os.path.join(project_root, 'data', 'models', 'political_bias_model')
 
-# Ensure output directory exists
-os.makedirs(model_output_dir, exist_ok=True)
+# 서빙 코드와 같은 토크나이즈 헬퍼를 사용하기 위해 app 디렉토리를 import 경로에 추가
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from services.tokenization import MAX_LENGTH
+from services.runtime import configure_torch_threads
+
+from dataset_cache import CACHE_ROOT, load_tokenized_split
+
+DEFAULT_MODEL = "klue/roberta-base"
+
+
+class PaddingCollator(DataCollatorWithPadding):
+    """
+    배치 안의 최장 길이까지만 패딩합니다. 캐시의 length 컬럼은 길이별 샘플러만 쓰고 모델 입력에서는 뺍니다.
+    """
+
+    def __call__(self, features: List[Dict[str, Any]]) -> Dict[str, Any]:
+        features = [{k: v for k, v in f.items() if k != "length"} for f in features]
+        return super().__call__(features)
 
-# 2. 전처리된 데이터 로드
-try:
-    train_df = pd.read_csv(train_data_path)
-    test_df = pd.read_csv(test_data_path)
-except FileNotFoundError:
-    print("Error: Processed train/test data not found. Please run preprocess_train.py and preprocess_test.py first.")
-    exit()
 
-# 3. HuggingFace Dataset으로 변환
-# content와 label 컬럼만 사용
-train_dataset = Dataset.from_pandas(train_df[['content', 'label']])
-test_dataset = Dataset.from_pandas(test_df[['content', 'label']])
+class ThroughputCallback(TrainerCallback):
+    """에포크마다 학습 처리량(samples/sec, tokens/sec)을 출력하고 output_dir/throughput.json 에 남깁니다."""
 
-# 4. 토크나이저 및 전처리
-tokenizer = AutoTokenizer.from_pretrained("klue/roberta-base")
+    def __init__(self, num_samples: int, num_tokens: int):
+        self.num_samples = num_samples
+        self.num_tokens = num_tokens
+        self.history: List[Dict[str, float]] = []
+        self._started: Optional[float] = None
 
-def preprocess_function(examples):
-    # 'title' 컬럼도 있었다면, 제목과 본문을 결합하여 더 많은 정보를 모델에 제공할 수 있습니다.
-    # 예: return tokenizer(examples["title"] + " " + examples["content"], truncation=True, padding="max_length", max_length=512)
-    return tokenizer(examples["content"], truncation=True, padding="max_length", max_length=512)
+    def on_epoch_begin(self, args, state, control, **kwargs):
+        self._started = time.perf_counter()
 
-# map 함수 적용 시 'remove_columns'를 사용하여 불필요한 원본 컬럼 제거 (메모리 효율)
-train_dataset = train_dataset.map(preprocess_function, batched=True, remove_columns=['content'])
-test_dataset = test_dataset.map(preprocess_function, batched=True, remove_columns=['content'])
+    def on_epoch_end(self, args, state, control, **kwargs):
+        if self._started is None:
+            return
+        elapsed = time.perf_counter() - self._started
+        self._started = None
+        record = {
+            "epoch": round(state.epoch or 0.0, 2),
+            "seconds": round(elapsed, 2),
+            "samples_per_sec": round(self.num_samples / elapsed, 2),
+            "tokens_per_sec": round(self.num_tokens / elapsed, 1),
+        }
+        self.history.append(record)
+        print(f"[throughput] epoch {record['epoch']}: {record['seconds']}s | "
+              f"{record['samples_per_sec']} samples/sec | {record['tokens_per_sec']} tokens/sec")
 
-# 'label' 컬럼을 'labels'로 변경 (Hugging Face Trainer의 기본 기대값)
-# 이미 label 컬럼이 있으므로 rename_column만 필요
-train_dataset = train_dataset.rename_column("label", "labels")
-test_dataset = test_dataset.rename_column("label", "labels")
+    def on_train_end(self, args, state, control, **kwargs):
+        if self.history and state.is_world_process_zero:
+            os.makedirs(args.output_dir, exist_ok=True)
+            with open(os.path.join(args.output_dir, "throughput.json"), "w", encoding="utf8") as f:
+                json.dump(self.history, f, indent=2)
 
-# 'labels' 컬럼의 데이터 타입을 PyTorch 텐서에 맞게 설정 (int)
-train_dataset.set_format(type='torch', columns=['input_ids', 'attention_mask', 'labels'])
-test_dataset.set_format(type='torch', columns=['input_ids', 'attention_mask', 'labels'])
 
-# 5. 모델 로딩
-# num_labels는 전처리된 데이터의 실제 클래스 수(0, 1, 2 -> 3개)와 일치해야 합니다.
-model = AutoModelForSequenceClassification.from_pretrained("klue/roberta-base", num_labels=3)
+def cpu_supports_bf16() -> bool:
+    """CPU 가 bf16 연산을 네이티브로 지원하는지 (AVX512-BF16 또는 AMX) 확인합니다. 에뮬레이션은 fp32 보다 느립니다."""
+    for name in ("_is_avx512_bf16_supported", "_is_amx_tile_supported"):
+        check = getattr(torch.cpu, name, None)
+        try:
+            if check is not None and check():
+                return True
+        except RuntimeError:
+            pass
+    try:
+        with open("/proc/cpuinfo", encoding="utf8") as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
 
-# 6. 학습 설정 (compute_metrics 추가)
+
+def count_tokens(dataset) -> int:
+    """캐시에 저장된 length 컬럼으로 에포크당 (패딩 제외) 토큰 수를 구합니다."""
+    import pyarrow.compute as pc
+
+    if "length" not in dataset.column_names:
+        return sum(len(ids) for ids in dataset["input_ids"])
+    return int(pc.sum(dataset.with_format("arrow")["length"]).as_py() or 0)
+
+
+def version_specific_kwargs(group_by_length: bool) -> Dict[str, Any]:
+    """
+    transformers 버전마다 이름이 바뀌거나 없어진 TrainingArguments 옵션을 설치된 버전에 맞춰 넘깁니다.
+    (group_by_length -> train_sampling_strategy, logging_dir 제거)
+    """
+    fields = {f.name for f in dataclasses.fields(TrainingArguments)}
+    kwargs: Dict[str, Any] = {}
+    if "logging_dir" in fields:
+        kwargs["logging_dir"] = os.path.join(project_root, 'logs') # logs 폴더도 프로젝트 루트 아래에
+    if group_by_length:
+        kwargs["length_column_name"] = "length"
+        if "train_sampling_strategy" in fields:
+            kwargs["train_sampling_strategy"] = "group_by_length"
+        else:
+            kwargs["group_by_length"] = True
+    return kwargs
+
+
+# 5. 학습 설정 (compute_metrics 추가)
 def compute_metrics(p):
     predictions = np.argmax(p.predictions, axis=1)
     accuracy = accuracy_score(p.label_ids, predictions)
@@ -69,37 +144,125 @@ def compute_metrics(p):
         'recall': recall
     }
 
-training_args = TrainingArguments(
-    output_dir=model_output_dir,
-    eval_strategy="epoch",
-    save_strategy="epoch",
-    logging_dir=os.path.join(project_root, 'logs'), # logs 폴더도 프로젝트 루트 아래에
-    per_device_train_batch_size=8,
-    per_device_eval_batch_size=8,
-    num_train_epochs=3,
-    weight_decay=0.01,
-    logging_steps=10,
-    save_total_limit=1, # 가장 좋은 모델만 저장
-    load_best_model_at_end=True, # 학습 종료 시 최고의 모델 로드
-    metric_for_best_model="eval_loss", # 최고의 모델 선택 기준
-    report_to="none" # wandb 등 다른 로깅 시스템 사용하지 않을 경우
-)
 
-# 7. 트레이너 구성 및 학습 시작
-trainer = Trainer(
-    model=model,
-    args=training_args,
-    train_dataset=train_dataset,
-    eval_dataset=test_dataset,
-    compute_metrics=compute_metrics # 평가 지표 계산 함수 추가
-)
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="정치 편향 분류 모델 학습")
+    parser.add_argument("--model-name", default=DEFAULT_MODEL, help="사전학습 모델 이름 또는 경로")
+    parser.add_argument("--tokenizer", help="토크나이저 이름 또는 경로 (기본: --model-name)")
+    parser.add_argument("--output-dir", default=model_output_dir)
+    parser.add_argument("--cache-root", default=CACHE_ROOT, help="preprocess.py 의 --cache-root 와 같아야 합니다")
+    parser.add_argument("--max-length", type=int, default=MAX_LENGTH)
+    parser.add_argument("--epochs", type=float, default=3)
+    parser.add_argument("--batch-size", type=int, default=8, help="스텝당 학습 배치 크기")
+    parser.add_argument("--eval-batch-size", type=int, help="평가 배치 크기 (기본: --batch-size)")
+    parser.add_argument("--grad-accum", type=int, default=1,
+                        help="gradient accumulation 스텝 수. 실제 배치 = batch-size x grad-accum")
+    parser.add_argument("--lr", type=float, default=5e-5)
+    parser.add_argument("--weight-decay", type=float, default=0.01)
+    parser.add_argument("--warmup-steps", type=int, default=0, help="learning rate warmup 스텝 수")
+    parser.add_argument("--no-group-by-length", dest="group_by_length", action="store_false",
+                        help="길이가 비슷한 샘플끼리 배치를 묶지 않음")
+    parser.add_argument("--bf16", action="store_true", help="bf16 autocast 사용 (CPU 가 지원할 때만 켜짐)")
+    parser.add_argument("--num-workers", type=int, default=0, help="DataLoader 워커 프로세스 수")
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op 스레드 수 (0 이면 코어 수)")
+    parser.add_argument("--max-train-samples", type=int, help="앞에서부터 이 개수만 학습 (빠른 점검용)")
+    parser.add_argument("--logging-steps", type=int, default=10)
+    parser.add_argument("--save-total-limit", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    set_seed(args.seed)
+    use_cpu = not torch.cuda.is_available()
+    if use_cpu and args.threads > 0:
+        configure_torch_threads(args.threads)
+
+    bf16 = False
+    if args.bf16:
+        if not use_cpu or cpu_supports_bf16():
+            bf16 = True
+        else:
+            print("Warning: 이 CPU 는 bf16 을 네이티브로 지원하지 않아 fp32 로 학습합니다.")
+
+    # Ensure output directory exists
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # 2. 토크나이저 로드
+    tokenizer = AutoTokenizer.from_pretrained(args.tokenizer or args.model_name)
+
+    # 3. 토크나이즈된 데이터 로드
+    # preprocess.py 가 만든 Arrow 캐시를 메모리 맵으로 열기 때문에 학습할 때마다 다시 토크나이즈하지 않습니다.
+    # 캐시는 패딩 없이 저장되어 있고(input_ids, attention_mask, labels, length), 학습 시 PaddingCollator 가
+    # 배치 내 최장 길이까지만 패딩합니다.
+    try:
+        train_dataset = load_tokenized_split(tokenizer, args.max_length, "train", args.cache_root)
+        test_dataset = load_tokenized_split(tokenizer, args.max_length, "test", args.cache_root)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.max_train_samples is not None:
+        train_dataset = train_dataset.select(range(min(args.max_train_samples, len(train_dataset))))
+
+    # 시퀀스 길이가 샘플마다 다르므로 텐서 변환은 collator 에서 배치 단위로 수행합니다.
+    data_collator = PaddingCollator(tokenizer=tokenizer)
+
+    # 4. 모델 로딩
+    # num_labels는 전처리된 데이터의 실제 클래스 수(0, 1, 2 -> 3개)와 일치해야 합니다.
+    model = AutoModelForSequenceClassification.from_pretrained(args.model_name, num_labels=3)
+
+    training_args = TrainingArguments(
+        output_dir=args.output_dir,
+        eval_strategy="epoch",
+        save_strategy="epoch",
+        per_device_train_batch_size=args.batch_size,
+        per_device_eval_batch_size=args.eval_batch_size or args.batch_size,
+        gradient_accumulation_steps=args.grad_accum,
+        num_train_epochs=args.epochs,
+        learning_rate=args.lr,
+        weight_decay=args.weight_decay,
+        warmup_steps=args.warmup_steps,
+        logging_steps=args.logging_steps,
+        save_total_limit=args.save_total_limit, # 가장 좋은 모델만 저장
+        load_best_model_at_end=True, # 학습 종료 시 최고의 모델 로드
+        metric_for_best_model="eval_loss", # 최고의 모델 선택 기준
+        bf16=bf16,
+        use_cpu=use_cpu,
+        dataloader_num_workers=args.num_workers,
+        dataloader_persistent_workers=args.num_workers > 0, # 에포크마다 워커를 다시 띄우지 않음
+        dataloader_pin_memory=not use_cpu,
+        # length 컬럼을 샘플러가 읽을 수 있도록 남겨 두고, 모델 입력에서는 PaddingCollator 가 뺍니다.
+        remove_unused_columns=False,
+        seed=args.seed,
+        report_to="none", # wandb 등 다른 로깅 시스템 사용하지 않을 경우
+        **version_specific_kwargs(args.group_by_length),
+    )
+
+    throughput = ThroughputCallback(len(train_dataset), count_tokens(train_dataset))
+
+    # 6. 트레이너 구성 및 학습 시작
+    trainer = Trainer(
+        model=model,
+        args=training_args,
+        train_dataset=train_dataset,
+        eval_dataset=test_dataset,
+        data_collator=data_collator, # 배치 단위 동적 패딩
+        compute_metrics=compute_metrics, # 평가 지표 계산 함수 추가
+        callbacks=[throughput],
+    )
+
+    print(f"Starting model training... (effective batch {args.batch_size * args.grad_accum}, "
+          f"bf16={bf16}, group_by_length={args.group_by_length}, workers={args.num_workers})")
+    trainer.train()
+    print("Model training completed.")
+
+    # load_best_model_at_end=True 이므로 메모리의 모델이 베스트 체크포인트입니다. 서빙이 output_dir 을 바로 읽도록 저장합니다.
+    trainer.save_model(args.output_dir)
+    tokenizer.save_pretrained(args.output_dir) # 토크나이저도 함께 저장
 
-print("Starting model training...")
-trainer.train()
-print("Model training completed.")
+    print(f"Best model and tokenizer saved to: {args.output_dir}")
 
-# 학습이 끝난 후, 최종 모델을 명시적으로 저장 (load_best_model_at_end=True이므로 베스트 모델이 저장됨)
-# trainer.save_model(model_output_dir) # Trainer가 자동으로 수행하므로, 명시적으로 호출할 필요 없음.
-tokenizer.save_pretrained(model_output_dir) # 토크나이저도 함께 저장    
 
-print(f"Best model and tokenizer saved to: {model_output_dir}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
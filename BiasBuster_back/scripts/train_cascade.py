@@ -0,0 +1,166 @@
+# scripts/train_cascade.py
+# 2단계 캐스케이드의 1단계 선형 분류기(해시 문자 n-gram TF-IDF + 로지스틱 회귀)를 train.csv 로 학습하고,
+# test.csv 에서 임계값별 RoBERTa 호출 비율(escalation rate), transformer 단독 대비 정확도, 평균 지연 시간 절감을 비교합니다.
+#   train  : 1단계 모델 학습 -> 저장 -> 비교 리포트
+#   report : 이미 만든 1단계 모델과 transformer 를 비교만 합니다.
+#
+# 사용법:
+#   python scripts/train_cascade.py train
+#   python scripts/train_cascade.py report --thresholds 0.7 0.8 0.9 0.95 --limit 1000
+# 서빙: CASCADE_MODE=true CASCADE_THRESHOLD=0.9 (모델 경로는 CASCADE_MODEL_PATH, 기본 app/data/models/bias_cascade.npz)
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+transformer_model_path = os.path.join(project_root, 'app', 'data', 'models', 'political_bias_model')
+cascade_model_path = os.path.join(project_root, 'app', 'data', 'models', 'bias_cascade.npz')
+train_data_path = os.path.join(project_root, 'data', 'processed', 'train.csv')
+test_data_path = os.path.join(project_root, 'data', 'processed', 'test.csv')
+
+sys.path.insert(0, os.path.join(project_root, 'app'))
+from services.cascade import (
+    DEFAULT_MAX_CHARS, DEFAULT_N_FEATURES, LinearPreClassifier, cascade_predictions, confident_rows,
+)
+from services.ml_service import MLService
+from services.runtime import configure_torch_threads
+
+from eval_utils import load_split, write_report
+
+
+def per_article_ms(predict, texts: List[str]) -> np.ndarray:
+    """기사 하나씩 predict 를 호출해 서빙의 단건 요청과 같은 조건으로 기사별 지연 시간(ms)을 잽니다."""
+    samples = np.zeros(len(texts), dtype=np.float64)
+    for i, text in enumerate(texts):
+        started = time.perf_counter()
+        predict([text])
+        samples[i] = (time.perf_counter() - started) * 1000.0
+    return samples
+
+
+def transformer_probabilities(engine: MLService, texts: List[str], chunk_size: int) -> np.ndarray:
+    outputs = []
+    for start in range(0, len(texts), chunk_size):
+        outputs.append(np.asarray(engine.predict_proba_batch(texts[start:start + chunk_size]), dtype=np.float32))
+    return np.concatenate(outputs) if outputs else np.zeros((0, 3), dtype=np.float32)
+
+
+def build_report(cascade_path: str, args) -> Dict[str, Any]:
+    """
+    test.csv 전체로 정확도와 escalation rate 를, 앞쪽 latency_samples 건으로 기사별 지연 시간을 잽니다.
+    캐스케이드 지연 시간은 기사마다 (1단계 시간 + 넘겨졌다면 transformer 시간) 으로 계산합니다.
+    """
+    df = load_split(args.test_data, args.limit)
+    texts = df['content'].astype(str).tolist()
+    labels = df['label'].astype(int).to_numpy()
+    print(f"비교 데이터: {args.test_data} ({len(texts)}건)")
+
+    linear = LinearPreClassifier.load(cascade_path)
+    engine = MLService(args.transformer)
+    engine.predict_proba_batch(texts[:2])  # 워밍업
+
+    linear_probs = linear.predict_proba(texts)
+    transformer_probs = transformer_probabilities(engine, texts, args.eval_batch_size)
+
+    sample = texts[:args.latency_samples]
+    linear_ms = per_article_ms(linear.predict_proba, sample)
+    transformer_ms = per_article_ms(engine.predict_proba_batch, sample)
+    transformer_mean = float(transformer_ms.mean()) if len(sample) else 0.0
+
+    def accuracy(predictions: np.ndarray) -> float:
+        return float((predictions == labels).mean()) if len(labels) else 0.0
+
+    report: Dict[str, Any] = {
+        "cascade_model": cascade_path,
+        "transformer_model": args.transformer,
+        "articles": len(texts),
+        "latency_samples": len(sample),
+        "linear_only": {"accuracy": accuracy(linear_probs.argmax(axis=1)), "mean_ms": float(linear_ms.mean()) if len(sample) else 0.0},
+        "transformer_only": {"accuracy": accuracy(transformer_probs.argmax(axis=1)), "mean_ms": transformer_mean},
+        "thresholds": [],
+    }
+    print(f"[linear     ] 정확도 {report['linear_only']['accuracy']:.4f} | 평균 {report['linear_only']['mean_ms']:.3f}ms")
+    print(f"[transformer] 정확도 {report['transformer_only']['accuracy']:.4f} | 평균 {transformer_mean:.1f}ms")
+
+    for threshold in args.thresholds:
+        escalated = ~confident_rows(linear_probs, threshold)
+        predictions = cascade_predictions(linear_probs, transformer_probs, escalated)
+        sample_escalated = escalated[:len(sample)]
+        cascade_ms = linear_ms + np.where(sample_escalated, transformer_ms, 0.0)
+        cascade_mean = float(cascade_ms.mean()) if len(sample) else 0.0
+        entry = {
+            "threshold": threshold,
+            "escalation_rate": float(escalated.mean()) if len(texts) else 0.0,
+            "accuracy": accuracy(predictions),
+            "accuracy_delta": accuracy(predictions) - report["transformer_only"]["accuracy"],
+            "mean_ms": cascade_mean,
+            "latency_saving": 1.0 - cascade_mean / transformer_mean if transformer_mean else 0.0,
+        }
+        report["thresholds"].append(entry)
+        print(f"[임계값 {threshold:.2f}] escalation {entry['escalation_rate']:6.1%} | 정확도 {entry['accuracy']:.4f} "
+              f"({entry['accuracy_delta']:+.4f}) | 평균 {cascade_mean:7.1f}ms | 지연 절감 {entry['latency_saving']:6.1%}")
+    return report
+
+
+def train(args):
+    df = load_split(args.train_data, args.limit_train)
+    print(f"학습 데이터: {args.train_data} ({len(df)}건)")
+    model = LinearPreClassifier(args.n_features, (args.ngram_min, args.ngram_max), args.max_chars)
+    started = time.perf_counter()
+    model.fit(df['content'].astype(str).tolist(), df['label'].astype(int).tolist(), c=args.c)
+    print(f"1단계 모델 학습 완료 ({time.perf_counter() - started:.1f}s)")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output_model)), exist_ok=True)
+    model.save(args.output_model)
+    print(f"1단계 모델 저장: {args.output_model} ({os.path.getsize(args.output_model) / 1e6:.1f}MB)")
+
+    result = build_report(args.output_model, args)
+    write_report(result, args.output or os.path.splitext(args.output_model)[0] + "_report.json")
+
+
+def report(args):
+    result = build_report(args.model, args)
+    if args.output:
+        write_report(result, args.output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캐스케이드 1단계 선형 분류기 학습 및 transformer 단독 대비 비교")
+    parser.add_argument("--transformer", default=transformer_model_path, help="2단계 transformer 모델 디렉토리")
+    parser.add_argument("--test-data", default=test_data_path)
+    parser.add_argument("--limit", type=int, default=0, help="비교에 쓸 test 기사 수 (0 이면 전체)")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.6, 0.7, 0.8, 0.9, 0.95])
+    parser.add_argument("--eval-batch-size", type=int, default=16)
+    parser.add_argument("--latency-samples", type=int, default=200, help="기사별 지연 시간을 잴 기사 수")
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op 스레드 수 (0 이면 코어 수)")
+    parser.add_argument("--output", help="비교 결과를 저장할 JSON 파일 경로")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = subparsers.add_parser("train", help="1단계 모델 학습 후 비교")
+    train_parser.add_argument("--output-model", default=cascade_model_path)
+    train_parser.add_argument("--train-data", default=train_data_path)
+    train_parser.add_argument("--limit-train", type=int, help="앞에서부터 이 개수만 학습 (빠른 점검용)")
+    train_parser.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help="기사 앞부분 몇 글자만 볼지")
+    train_parser.add_argument("--ngram-min", type=int, default=2)
+    train_parser.add_argument("--ngram-max", type=int, default=4)
+    train_parser.add_argument("--n-features", type=int, default=DEFAULT_N_FEATURES, help="해시 공간 크기 (2 의 거듭제곱)")
+    train_parser.add_argument("--c", type=float, default=4.0, help="로지스틱 회귀 규제 역수")
+    train_parser.set_defaults(func=train)
+
+    report_parser = subparsers.add_parser("report", help="저장된 1단계 모델과 transformer 비교")
+    report_parser.add_argument("--model", default=cascade_model_path)
+    report_parser.set_defaults(func=report)
+
+    args = parser.parse_args()
+    if args.threads > 0:
+        configure_torch_threads(args.threads)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# tests/conftest.py
+# 서빙 코드(services.*, core.*, main)를 앱과 같은 방식으로 import 할 수 있도록 app 디렉토리를 경로에 추가합니다.
+# 실행: BiasBuster_back 에서 python -m pytest -q
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import pytest
+
+BUNDLED_MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "data", "models", "political_bias_model")
+# 테스트용 작은 무작위 초기화 모델 (benchmarks/bench_utils.py 의 --tiny 와 같은 크기)
+TINY_CONFIG_OVERRIDES = {"num_hidden_layers": 2, "hidden_size": 128, "num_attention_heads": 2, "intermediate_size": 512}
+
+
+def save_tiny_model(target: str, seed: int = 0) -> str:
+    """기본 모델의 config/토크나이저로 작은 무작위 초기화 분류 모델을 target 에 저장합니다."""
+    import torch
+    from transformers import AutoConfig, AutoModelForSequenceClassification, AutoTokenizer
+
+    torch.manual_seed(seed)
+    config = AutoConfig.from_pretrained(BUNDLED_MODEL_PATH)
+    for key, value in TINY_CONFIG_OVERRIDES.items():
+        setattr(config, key, value)
+    AutoTokenizer.from_pretrained(BUNDLED_MODEL_PATH).save_pretrained(target)
+    AutoModelForSequenceClassification.from_config(config).save_pretrained(target)
+    return target
+
+
+@pytest.fixture(scope="session")
+def model_registry_dir(tmp_path_factory):
+    """v1, v2 두 버전이 등록되고 CURRENT 가 v1 인 레지스트리 디렉토리."""
+    root = tmp_path_factory.mktemp("registry")
+    save_tiny_model(str(root / "v1"), seed=0)
+    save_tiny_model(str(root / "v2"), seed=1)
+    (root / "CURRENT").write_text("v1\n")
+    return root
@@ -0,0 +1,88 @@
+# tests/test_admission.py
+import asyncio
+
+import pytest
+
+from services.admission import LatencyEstimator, deadline_after, remaining_ms
+
+
+def test_deadline_is_disabled_without_budget():
+    assert deadline_after(None) is None
+    assert deadline_after(0) is None
+    deadline = deadline_after(500)
+    assert 0 < remaining_ms(deadline) <= 500
+
+
+def test_estimate_is_unknown_before_first_batch():
+    estimator = LatencyEstimator()
+    assert estimator.estimate_ms(100, queue_depth=0, inflight_batches=0, max_batch_size=8,
+                                 concurrency=1, max_wait_ms=10) is None
+    assert estimator.estimate_tokens(100) is None
+
+
+def test_estimate_uses_token_rate_and_backlog():
+    estimator = LatencyEstimator(alpha=0.5)
+    # 400자 -> 200토큰 배치가 100ms 걸렸다면 토큰당 0.5ms, 글자당 0.5토큰입니다.
+    estimator.observe(100.0, [400], [200])
+    assert estimator.ms_per_token == pytest.approx(0.5)
+    assert estimator.tokens_per_char == pytest.approx(0.5)
+
+    idle = estimator.estimate_ms(1000, queue_depth=0, inflight_batches=0, max_batch_size=8,
+                                 concurrency=1, max_wait_ms=10)
+    assert idle == pytest.approx(10 + 500 * 0.5)
+    # 토큰 수는 모델 최대 길이에서 잘립니다.
+    assert estimator.estimate_tokens(1000, max_tokens=128) == 128
+
+    # 대기열 9건 = 배치 2개 + 실행 중 1개, 슬롯 2개가 나눠 처리합니다.
+    busy = estimator.estimate_ms(1000, queue_depth=9, inflight_batches=1, max_batch_size=8,
+                                 concurrency=2, max_wait_ms=10)
+    assert busy == pytest.approx(idle + 3 * 100.0 / 2)
+
+
+def test_windowed_batches_only_update_batch_time():
+    estimator = LatencyEstimator(alpha=0.5)
+    estimator.observe(100.0, [400], [None])
+    estimator.observe(200.0, [400], [None])
+    assert estimator.batch_ms == pytest.approx(150.0)
+    assert estimator.ms_per_token is None
+    # 토큰 비율을 모르면 요청 자신의 forward 시간도 배치 평균으로 어림합니다.
+    assert estimator.estimate_ms(400, queue_depth=0, inflight_batches=0, max_batch_size=8,
+                                 concurrency=1, max_wait_ms=0) == pytest.approx(150.0)
+
+
+class _FakeExecutor:
+    async def run(self, fn, texts):
+        from services.metrics import BatchTrace
+
+        trace = BatchTrace()
+        trace.token_lengths = [len(text) for text in texts]
+        return [[0.0] for _ in texts], trace
+
+
+def test_paragraph_batches_do_not_feed_the_article_estimate(monkeypatch):
+    import main
+
+    estimator = LatencyEstimator()
+    monkeypatch.setattr(main, "latency_estimator", estimator)
+    monkeypatch.setattr(main, "inference_executor", _FakeExecutor())
+
+    asyncio.run(main._run_paragraphs(None, ["짧은 문단"]))
+    assert estimator.observations == 0
+    asyncio.run(main._run_inference(None, ["기사 본문"]))
+    assert estimator.observations == 1
+
+
+def test_estimate_counts_backlog_of_batchers_sharing_the_executor(monkeypatch):
+    import main
+
+    estimator = LatencyEstimator()
+    estimator.observe(100.0, [10], [None])
+    monkeypatch.setattr(main, "latency_estimator", estimator)
+    idle = main.estimate_latency_ms("기사")
+
+    size = main.paragraph_batcher.max_batch_size
+    monkeypatch.setattr(main.paragraph_batcher, "stats", lambda: {"queue_depth": size + 1, "inflight_batches": 1})
+    monkeypatch.setattr(main.attribution_batcher, "stats", lambda: {"queue_depth": 0, "inflight_batches": 1})
+    # 문단 배치 2개 + 실행 중 1개, 문장 근거 실행 중 1개가 먼저 실행기를 씁니다.
+    busy = main.estimate_latency_ms("기사")
+    assert busy == pytest.approx(idle + 4 * 100.0 / main.bias_batcher.concurrency)
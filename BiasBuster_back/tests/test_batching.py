@@ -0,0 +1,181 @@
+# tests/test_batching.py
+import asyncio
+import time
+
+import pytest
+
+from services.batching import BatchSlots, MicroBatcher, QueueFullError
+
+
+def _blocking_runner(release: asyncio.Event, started: asyncio.Event):
+    async def runner(batch_fn, items):
+        started.set()
+        await release.wait()
+        return batch_fn(items)
+    return runner
+
+
+def test_full_queue_rejects_immediately_with_retry_after():
+    async def scenario():
+        release, started = asyncio.Event(), asyncio.Event()
+        batcher = MicroBatcher(lambda items: [i * 2 for i in items], max_batch_size=1, max_wait_ms=0,
+                               max_queue_size=2, runner=_blocking_runner(release, started), retry_after=7)
+        await batcher.start()
+        # 첫 요청은 워커가 꺼내 실행 중이고, 실행 슬롯이 하나뿐이라 다음 두 요청은 큐에 남습니다.
+        first = asyncio.create_task(batcher.submit(1))
+        await started.wait()
+        queued = [asyncio.create_task(batcher.submit(i)) for i in (2, 3)]
+        # 워커가 실행 슬롯을 기다리며 꺼내 둔 요청도 대기열 한도에 계산됩니다.
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(QueueFullError) as excinfo:
+            await batcher.submit(4)
+        assert excinfo.value.retry_after == 7
+        stats = batcher.stats()
+        assert stats["rejected_requests"] == 1
+        assert stats["queue_depth"] == 2
+
+        release.set()
+        assert await asyncio.gather(first, *queued) == [2, 4, 6]
+        assert batcher.stats()["total_requests"] == 3
+        await batcher.stop()
+
+    asyncio.run(scenario())
+
+
+def test_partial_batch_is_flushed_after_max_wait():
+    async def scenario():
+        batches = []
+
+        def batch_fn(items):
+            batches.append(list(items))
+            return [i + 1 for i in items]
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50)
+        started = time.perf_counter()
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(3))), timeout=2)
+        elapsed = time.perf_counter() - started
+
+        assert results == [1, 2, 3]
+        # 배치가 다 차지 않아도 첫 요청이 max_wait_ms 를 기다린 뒤 한 번에 실행됩니다.
+        assert batches == [[0, 1, 2]]
+        assert elapsed >= 0.04
+        await batcher.stop()
+
+    asyncio.run(scenario())
+
+
+def test_full_batch_runs_without_waiting_for_timeout():
+    async def scenario():
+        batches = []
+
+        def batch_fn(items):
+            batches.append(len(items))
+            return list(items)
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait_ms=10_000)
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(8))), timeout=2)
+
+        assert results == list(range(8))
+        assert batches == [4, 4]
+        assert batcher.stats()["batch_size_histogram"] == {"4": 2}
+        await batcher.stop()
+
+    asyncio.run(scenario())
+
+
+def test_batch_error_propagates_to_every_caller():
+    async def scenario():
+        def batch_fn(items):
+            raise ValueError("boom")
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait_ms=5)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        # 실패한 배치도 실행 슬롯을 돌려주므로 다음 요청은 정상 처리됩니다.
+        batcher.batch_fn = lambda items: list(items)
+        assert await asyncio.wait_for(batcher.submit(9), timeout=2) == 9
+        await batcher.stop()
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_is_skipped_in_batch():
+    async def scenario():
+        release, started = asyncio.Event(), asyncio.Event()
+        seen = []
+
+        def batch_fn(items):
+            seen.append(list(items))
+            return list(items)
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait_ms=0, runner=_blocking_runner(release, started))
+        first = asyncio.create_task(batcher.submit("a"))
+        await started.wait()
+        # 실행 슬롯을 기다리는 동안 취소된 요청은 다음 배치에서 계산하지 않습니다.
+        dropped = asyncio.create_task(batcher.submit("b"))
+        kept = asyncio.create_task(batcher.submit("c"))
+        await asyncio.sleep(0)
+        dropped.cancel()
+
+        release.set()
+        assert await first == "a"
+        assert await kept == "c"
+        assert seen == [["a"], ["c"]]
+        await batcher.stop()
+
+    asyncio.run(scenario())
+
+
+def test_stop_fails_pending_requests():
+    async def scenario():
+        release, started = asyncio.Event(), asyncio.Event()
+        batcher = MicroBatcher(lambda items: list(items), max_batch_size=1, max_wait_ms=0,
+                               runner=_blocking_runner(release, started))
+        first = asyncio.create_task(batcher.submit(1))
+        await started.wait()
+        pending = asyncio.create_task(batcher.submit(2))
+        await asyncio.sleep(0)
+
+        release.set()
+        await batcher.stop()
+        assert await first == 1
+        with pytest.raises(RuntimeError):
+            await pending
+
+    asyncio.run(scenario())
+
+
+def test_batchers_share_execution_slots():
+    async def scenario():
+        slots = BatchSlots(1)
+        release, started = asyncio.Event(), asyncio.Event()
+        order = []
+
+        async def recording_runner(batch_fn, items):
+            order.append(items[0])
+            return batch_fn(items)
+
+        first = MicroBatcher(lambda items: list(items), max_batch_size=1, max_wait_ms=0,
+                             runner=_blocking_runner(release, started), slots=slots)
+        second = MicroBatcher(lambda items: list(items), max_batch_size=1, max_wait_ms=0,
+                              runner=recording_runner, slots=slots)
+        await second.start()
+        # 쉬고 있는 배처는 슬롯을 잡지 않으므로 다른 배처의 첫 배치가 바로 실행됩니다.
+        held = asyncio.create_task(first.submit("a"))
+        await asyncio.wait_for(started.wait(), timeout=2)
+
+        waiting = asyncio.create_task(second.submit("b"))
+        await asyncio.sleep(0.01)
+        assert order == []
+        assert second.stats()["queue_depth"] == 1
+
+        release.set()
+        assert await held == "a"
+        assert await asyncio.wait_for(waiting, timeout=2) == "b"
+        assert order == ["b"]
+        await first.stop()
+        await second.stop()
+
+    asyncio.run(scenario())
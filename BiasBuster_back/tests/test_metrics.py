@@ -0,0 +1,36 @@
+# tests/test_metrics.py
+from services.metrics import MetricsRegistry, _format_value
+
+
+def test_special_values_use_prometheus_spelling():
+    assert _format_value(float("inf")) == "+Inf"
+    assert _format_value(float("-inf")) == "-Inf"
+    assert _format_value(float("nan")) == "NaN"
+    assert _format_value(3.0) == "3"
+    assert _format_value(0.25) == "0.25"
+
+
+def test_collected_counter_renders_as_counter():
+    registry = MetricsRegistry(namespace="t")
+    registry.counter("cache_events_total", "누적 이벤트 수")
+    registry.gauge("queue_depth", "대기열 길이")
+    registry.add_collector(lambda: iter([("cache_events_total", {"event": "misses"}, 3), ("queue_depth", {}, float("nan"))]))
+
+    lines = registry.render().splitlines()
+    assert "# TYPE t_cache_events_total counter" in lines
+    assert 't_cache_events_total{event="misses"} 3' in lines
+    assert "t_queue_depth NaN" in lines
+
+
+def test_histogram_sum_and_buckets():
+    registry = MetricsRegistry(namespace="t")
+    registry.histogram("duration_seconds", "소요 시간", buckets=(0.1, 1.0))
+    registry.observe("duration_seconds", 0.05)
+    registry.observe("duration_seconds", 5.0)
+
+    lines = registry.render().splitlines()
+    assert 't_duration_seconds_bucket{le="0.1"} 1' in lines
+    assert 't_duration_seconds_bucket{le="1"} 1' in lines
+    assert 't_duration_seconds_bucket{le="+Inf"} 2' in lines
+    assert "t_duration_seconds_sum 5.05" in lines
+    assert "t_duration_seconds_count 2" in lines
@@ -0,0 +1,96 @@
+# tests/test_model_registry.py
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from services.model_registry import ModelRegistry, validate_version
+
+
+@pytest.fixture
+def registry(model_registry_dir, tmp_path):
+    # 테스트마다 CURRENT 를 바꿔도 다른 테스트에 영향이 없도록 복사본을 씁니다.
+    root = tmp_path / "registry"
+    shutil.copytree(model_registry_dir, root)
+    return ModelRegistry(str(root))
+
+
+def test_versions_current_and_set_current(registry):
+    assert registry.versions() == ["v1", "v2"]
+    assert registry.current() == "v1"
+    registry.set_current("v2")
+    assert registry.current() == "v2"
+    with pytest.raises(KeyError):
+        registry.set_current("v9")
+    with pytest.raises(ValueError):
+        validate_version("../v1")
+
+
+def test_resolve_model_path_falls_back_when_current_is_broken(registry, monkeypatch):
+    import main
+
+    with open(os.path.join(registry.root, "CURRENT"), "w", encoding="utf8") as f:
+        f.write("v9\n")
+    monkeypatch.setattr(main, "model_registry", registry)
+    monkeypatch.setattr(main, "political_bias_model_path", main.BUNDLED_MODEL_PATH)
+    monkeypatch.setitem(main.model_state, "registry_error", None)
+
+    assert main.resolve_model_path() == registry.path("v2")
+    assert "v9" in main.model_state["registry_error"]
+
+
+def test_hot_swap_with_requests_in_flight(registry, monkeypatch):
+    import main
+    from fastapi.testclient import TestClient
+
+    headers = {"X-Admin-Token": "secret"}
+    monkeypatch.setattr(main, "model_registry", registry)
+    monkeypatch.setattr(main, "political_bias_model_path", main.BUNDLED_MODEL_PATH)
+    monkeypatch.setattr(main, "bias_engine", None)
+    monkeypatch.setattr(main, "summary_jobs", None)
+    monkeypatch.setattr(main.settings, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(main.settings, "MODEL_REGISTRY_POLL_SECONDS", 0.0)
+    monkeypatch.setattr(main, "model_state", {"status": "loading", "error": None, "phases_ms": {}, "version": None, "registry_error": None})
+    monkeypatch.setattr(main, "model_swap_state", {"status": "idle", "target": None, "error": None, "last_swap_ms": None})
+
+    with TestClient(main.app) as client:
+        for _ in range(600):
+            if client.get("/health/ready").status_code == 200:
+                break
+            time.sleep(0.05)
+        assert client.get("/health/ready").json()["model_version"] == "v1"
+
+        results, stop = [], threading.Event()
+
+        def send_requests(worker: int) -> None:
+            count = 0
+            while not stop.is_set():
+                # 결과 캐시에 걸리지 않도록 요청마다 다른 본문을 보냅니다.
+                response = client.post("/analyze", json={"text": f"정부는 {worker}-{count}번째 예산안을 발표했다.", "summarize": False})
+                results.append((response.status_code, response.json().get("model_version")))
+                count += 1
+
+        threads = [threading.Thread(target=send_requests, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.3)
+        assert client.post("/admin/model/swap", json={"version": "v2"}, headers=headers).status_code == 202
+        for _ in range(600):
+            if client.get("/admin/model", headers=headers).json()["swap"]["status"] != "loading":
+                break
+            time.sleep(0.05)
+        time.sleep(0.3)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        state = client.get("/admin/model", headers=headers).json()
+        assert state["version"] == "v2"
+        assert registry.current() == "v2"
+        assert {status for status, _ in results} == {200}
+        versions = [version for _, version in results]
+        assert set(versions) == {"v1", "v2"}
+        # 교체 이후 응답이 이전 버전으로 되돌아가지 않습니다.
+        assert versions[versions.index("v2"):].count("v1") <= len(threads)
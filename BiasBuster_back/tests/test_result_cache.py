@@ -0,0 +1,130 @@
+# tests/test_result_cache.py
+import asyncio
+
+import pytest
+
+from services.result_cache import ResultCache, model_fingerprint
+
+
+def test_coalesced_waiters_survive_owner_cancellation():
+    async def scenario():
+        cache = ResultCache()
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await release.wait()
+            return {"value": 1}
+
+        owner = asyncio.create_task(cache.get_or_compute("k", compute))
+        await started.wait()
+        waiters = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        release.set()
+
+        results = await asyncio.gather(*waiters)
+        assert results == [{"value": 1}] * 3
+        assert calls == 1
+        assert cache.stats()["coalesced"] == 3
+        assert cache.stats()["inflight"] == 0
+        # 계산이 끝난 결과는 캐시에 남아 다음 요청은 바로 적중합니다.
+        assert await cache.get("k") == {"value": 1}
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_requests_share_one_computation():
+    async def scenario():
+        cache = ResultCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"value": 1}
+
+        tasks = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        assert await asyncio.gather(*tasks) == [{"value": 1}] * 3
+        assert calls == 1
+        assert cache.stats()["coalesced"] == 2
+        assert await cache.get("k") == {"value": 1}
+
+    asyncio.run(scenario())
+
+
+def test_compute_error_reaches_waiters_and_is_not_stored():
+    async def scenario():
+        cache = ResultCache()
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert await cache.get("k") is None
+        assert cache.stats()["inflight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_should_store_false_skips_cache():
+    async def scenario():
+        cache = ResultCache()
+
+        async def compute():
+            return {"bias_status": "deferred"}
+
+        await cache.get_or_compute("k", compute, should_store=lambda value: value["bias_status"] == "ok")
+        assert await cache.get("k") is None
+
+    asyncio.run(scenario())
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    async def scenario():
+        path = str(tmp_path / "cache.sqlite")
+        first = ResultCache(disk_path=path)
+        await first.set("k", {"value": 1})
+        first.close()
+
+        second = ResultCache(disk_path=path)
+        assert await second.get("k") == {"value": 1}
+        assert second.stats()["disk_hits"] == 1
+        second.close()
+
+    asyncio.run(scenario())
+
+
+def test_key_for_normalizes_whitespace_and_namespace():
+    cache = ResultCache()
+    assert cache.key_for("정부는  예산안을\n발표했다.") == cache.key_for("정부는 예산안을 발표했다.")
+    before = cache.key_for("기사")
+    cache.namespace = "v2"
+    assert cache.key_for("기사") != before
+
+
+def test_fingerprint_includes_onnx_file(tmp_path):
+    (tmp_path / "config.json").write_text("{}")
+    onnx_path = tmp_path / "model.onnx"
+    onnx_path.write_bytes(b"a" * 100)
+    first = model_fingerprint(str(tmp_path), onnx_path=str(onnx_path))
+    onnx_path.write_bytes(b"b" * 100)
+    assert model_fingerprint(str(tmp_path), onnx_path=str(onnx_path)) != first
+    assert model_fingerprint(str(tmp_path)) == model_fingerprint(str(tmp_path), onnx_path=None)
@@ -0,0 +1,54 @@
+# tests/test_summarization.py
+import asyncio
+
+from services.summarization import SummaryJobQueue
+
+
+def test_burst_submit_rejects_beyond_queue_limit():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def runner(batch_fn, texts):
+            await release.wait()
+            return batch_fn(texts)
+
+        queue = SummaryJobQueue(lambda texts: [f"요약:{t}" for t in texts], runner,
+                                max_batch_size=1, max_wait_ms=0, max_queue_size=2)
+        await queue.start()
+        # 같은 틱에 몰린 요청도 submit() 안에서 자리를 잡으므로 한도를 넘는 작업은 만들지 않습니다.
+        jobs = [queue.submit(f"기사 {i}") for i in range(10)]
+        accepted = [job for job in jobs if job is not None]
+        assert len(accepted) == 2
+        assert queue.stats()["rejected"] == 8
+        assert queue.stats()["pending"] == 2
+
+        release.set()
+        for _ in range(100):
+            if all(job.finished for job in accepted):
+                break
+            await asyncio.sleep(0.01)
+        assert [job.status for job in accepted] == ["done", "done"]
+        assert accepted[0].summary == "요약:기사 0"
+        assert queue.stats()["pending"] == 0
+        # 자리가 비면 다시 작업을 받습니다.
+        assert queue.submit("기사 10") is not None
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_duplicate_submit_returns_existing_job():
+    async def scenario():
+        async def runner(batch_fn, texts):
+            return batch_fn(texts)
+
+        queue = SummaryJobQueue(lambda texts: list(texts), runner, max_queue_size=1)
+        await queue.start()
+        first = queue.submit("같은 기사")
+        # 같은 본문은 새 자리를 잡지 않고 진행 중인 작업을 돌려줍니다.
+        assert queue.submit("같은  기사") is first
+        assert queue.stats()["deduplicated"] == 1
+        assert queue.stats()["rejected"] == 0
+        await queue.stop()
+
+    asyncio.run(scenario())
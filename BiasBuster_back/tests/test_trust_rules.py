@@ -0,0 +1,100 @@
+# tests/test_trust_rules.py
+import re
+
+import pytest
+
+from services.trust_rules import _GAP, TRUST_RULES, TrustRuleEngine, default_engine
+
+# 규칙마다 매칭되어야 하는 예문 (TRUST_RULES 순서)
+RULE_EXAMPLES = [
+    "정부 관계자는 말했다 이번 조치는 불가피하다고.",
+    "전문가는 우려를 나타냈다.",
+    "일각에서는 반대 목소리도 나온다.",
+    "복수의 소식통에 따르면 회담이 연기됐다.",
+    "익명의 관계자 에 따르면 협상은 결렬됐다.",
+    "2021년 통계에 따르면 수치는 다소 달랐다.",
+    "이 사건은 수년 전 일어났다.",
+    "그는 구체적인 날짜 없이 조만간 결과를 발표하겠다고 했다.",
+    "출처: 온라인 게시판",
+    "인터넷 커뮤니티에서는 소문이 퍼졌다.",
+    "이는 일방적인 주장 에 불과하다.",
+    "한국뉴스 단독보도했다.",
+    "기자: 홍길동",
+    "인턴 기자가 작성한 기사다.",
+    "현지 통신원이 전했다.",
+    "무명 작성자의 글이다.",
+    "모든 국민이 반대한다 다",
+    "그는 항상 그렇게 했다.",
+    "이것은 명백한 사실이다.",
+    "그는 틀림없이 승리할 것이다.",
+    "충격적인 내부 문건의 사실이 드러났다.",
+    "경악할 만한 수준이다.",
+    "시민들의 분노 폭발로 이어졌다.",
+    "경제가 붕괴 직전으로 내몰려 결국 붕괴되었다.",
+]
+
+NEGATIVE_EXAMPLES = [
+    "",
+    "정부는 오늘 국회에서 내년도 예산안을 발표했다.",
+    "2025년 통계에 따르면 물가가 올랐다.",
+    "그 사람은 항상 웃는다.",
+]
+
+
+def _legacy_rules():
+    # 최적화 전 규칙: 제한된 간격(_GAP) 대신 ".*", 사전 필터 없이 모든 규칙을 실행.
+    return [(reason, re.compile(pattern.replace(_GAP, ".*"), re.IGNORECASE), note) for reason, pattern, note, _ in TRUST_RULES]
+
+
+def _legacy_first_matches(text):
+    return {(reason, note, m.start()) for reason, pattern, note in _legacy_rules() for m in [pattern.search(text)] if m}
+
+
+def _engine_first_matches(text):
+    seen, result = set(), set()
+    for match in default_engine.iter_matches(text):
+        key = (match.reason, match.note)
+        if key not in seen:
+            seen.add(key)
+            result.add((match.reason, match.note, match.start))
+    return result
+
+
+def test_examples_cover_every_rule():
+    assert len(RULE_EXAMPLES) == len(TRUST_RULES)
+    for example, (reason, pattern, note, _) in zip(RULE_EXAMPLES, TRUST_RULES):
+        assert re.search(pattern, example, re.IGNORECASE), (reason, note, example)
+
+
+@pytest.mark.parametrize("text", RULE_EXAMPLES + NEGATIVE_EXAMPLES + [" ".join(RULE_EXAMPLES), "\n".join(RULE_EXAMPLES)])
+def test_engine_matches_legacy_rules(text):
+    # 같은 규칙이 같은 위치에서 처음 매칭되어야 합니다 (".*" 는 탐욕적이라 phrase 끝은 다를 수 있음).
+    assert _engine_first_matches(text) == _legacy_first_matches(text)
+
+
+def test_prefilter_does_not_drop_rules():
+    # 사전 필터 없이 모든 규칙을 돌린 결과와 같아야 합니다.
+    engine = TrustRuleEngine()
+    text = " ".join(RULE_EXAMPLES)
+    unfiltered = [
+        (reason, m.start(), m.end())
+        for reason, pattern, _ in engine._rules
+        for m in pattern.finditer(text)
+    ]
+    assert sorted((m.reason, m.start, m.end) for m in engine.scan(text)) == sorted(unfiltered)
+
+
+def test_all_matches_and_offsets():
+    text = "관계자는 말했다. 그리고 다른 관계자가 말했다."
+    matches = default_engine.scan(text)
+    assert [(m.start, m.end) for m in matches] == [(0, 8), (17, 25)]
+    for m in matches:
+        assert text[m.start:m.end] == m.phrase
+    assert len(default_engine.scan(text, max_per_rule=1)) == 1
+
+
+def test_long_single_line_is_bounded():
+    # 예전 ".*" 규칙은 줄바꿈 없는 긴 본문에서 역추적이 커졌습니다. 간격 제한으로 매칭 길이도 제한됩니다.
+    text = "충격적인 " + "가" * 5000 + " 사실"
+    assert not any(m.reason == "선정적/자극적 표현" for m in default_engine.scan(text))
+    assert all(m.end - m.start <= 200 for m in default_engine.scan("충격적인 " + "사실 " * 2000))
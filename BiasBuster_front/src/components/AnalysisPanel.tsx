@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react'
 import styled, {ThemeProvider} from 'styled-components'
-import { analyzeArticle, AnalysisResult, CategoryScore } from '../utils/fetchAnalysis'
+import { analyzeArticle, analyzeArticleStream, AnalysisResult, CategoryScore, PartialScores, Trust } from '../utils/fetchAnalysis'
 import {theme} from '../theme'
 import BiasBar from './BiasBar'
 import { getArticleText } from '../utils/extractArticleText'
@@ -51,30 +51,44 @@ type Props = { onClose: () => void }
 export default function AnalysisPanel({ onClose }: { onClose: () => void }) {
   const [loading, setLoading] = useState(true)
   const [data, setData]     = useState<AnalysisResult | null>(null)
+  // 스트리밍 중간 결과: 신뢰도 결과는 바로, 편향 점수는 문단별 누적 점수로 먼저 그립니다.
+  const [trust, setTrust]     = useState<Trust[] | null>(null)
+  const [partial, setPartial] = useState<PartialScores | null>(null)
 
   useEffect(() => {
+    const controller = new AbortController()
     ;(async () => {
+      const text = getArticleText();
       try {
-        const text = getArticleText();
-        const result = await analyzeArticle(text)
+        const result = await analyzeArticleStream(text, { onTrust: setTrust, onPartial: setPartial }, controller.signal)
         setData(result)
       } catch (e) {
+        if (controller.signal.aborted) return
         console.error(e);
+        try {
+          // 스트리밍을 지원하지 않는 서버면 기존 /analyze 로 다시 요청합니다.
+          setData(await analyzeArticle(text))
+        } catch (e) {
+          console.error(e);
+        }
       } finally {
         setLoading(false);
       }
     })()
+    return () => controller.abort()
   }, [])
 
+  const scores = data?.scores ?? partial?.aggregate
+  const trustIssues = data?.trust_issues ?? trust
+
   // scores 배열에서 left/center/right 점수 꺼내기
   const getScore = (cat: string) =>
-    data?.scores.find((s:CategoryScore) => s.category === cat)?.score ?? 0
+    scores?.find((s:CategoryScore) => s.category === cat)?.score ?? 0
 
   const leftScore   = getScore('좌파/진보')
   const centerScore = getScore('중도')
   const rightScore  = getScore('우파/보수')
   
-  console.log(data?.trust_issues)
 
   return (
     <ThemeProvider theme={theme}>
@@ -85,19 +99,22 @@ export default function AnalysisPanel({ onClose }: { onClose: () => void }) {
         </Header>
 
         <Content>
-          {loading || !data ? (
-            '데이터 불러오는 중…'
+          {!data && !trustIssues ? (
+            loading ? '데이터 불러오는 중…' : '분석 실패'
           ) : (
             <>
               <h1>B.B.</h1>
               <br/>
               {/* 주제 표현 */}
               <p style={{ marginBottom: theme.spacing.m }}>
-                <strong>{data.summary}</strong>
+                <strong>{data ? data.summary : '성향 분석 중…'}</strong>
               </p>
 
               {/* 진보·보수 비율 */}
               <h2>1. 성향 분석</h2>
+              {!data && partial && (
+                <p>문단 {partial.completed}/{partial.total} 분석 완료</p>
+              )}
               <BiasBar
                 segments={[
                 { ratio: rightScore   , color: '#CD1039' /* 진보 */ },
@@ -115,11 +132,11 @@ export default function AnalysisPanel({ onClose }: { onClose: () => void }) {
               <div>
                 <h2>2. 신뢰도 분석</h2>
                 <Suspicious>
-                  {data.trust_issues.length > 0 && (
+                  {trustIssues && trustIssues.length > 0 && (
                   <>
                     <h4 style={{ marginBottom: theme.spacing.s }}>의심요소</h4>
                     <ol style={{ marginLeft: theme.spacing.m, color: theme.colors.textDark }}>
-                      {data.trust_issues.map((item, idx) => (
+                      {trustIssues.map((item, idx) => (
                         <li key={idx} style={{ marginBottom: theme.spacing.s }}>
                           <strong>{item.reason}</strong><br />
                           <em>"{item.phrase}"</em><br />
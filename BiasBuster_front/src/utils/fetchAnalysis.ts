@@ -10,12 +10,32 @@ export interface Trust {
   reason: string;
   phrase: string;
   note: string;          // 0 ~ 1 사이
+  start?: number;        // 기사 본문 내 문구 시작 위치
+  end?: number;          // 기사 본문 내 문구 끝 위치
 }
 
 export interface AnalysisResult {
   summary: string;
   scores: CategoryScore[]; // 진보·중도·보수 점수 배열
   trust_issues: Trust[];
+  summary_job_id?: string | null; // 본문 요약 작업 ID (GET /summaries/{id})
+  model_version?: string | null;  // 점수를 낸 모델 버전
+}
+
+// /analyze/stream 의 partial 이벤트: 문단 하나의 점수가 나올 때마다 전송됩니다.
+export interface PartialScores {
+  index: number;              // 점수가 나온 문단 번호
+  start: number;              // 기사 본문 내 문단 시작 위치
+  end: number;                // 기사 본문 내 문단 끝 위치
+  completed: number;          // 지금까지 점수가 나온 문단 수
+  total: number;              // 전체 문단 수
+  scores: CategoryScore[];    // 이 문단의 점수
+  aggregate: CategoryScore[]; // 지금까지 나온 문단들의 누적 점수
+}
+
+export interface StreamHandlers {
+  onTrust?: (trustIssues: Trust[]) => void;
+  onPartial?: (partial: PartialScores) => void;
 }
 
 export async function analyzeArticle(text: string): Promise<AnalysisResult> {
@@ -31,3 +51,55 @@ export async function analyzeArticle(text: string): Promise<AnalysisResult> {
   // topic이 포함된 JSON을 그대로 파싱
   return await response.json();
 }
+
+function parseEvent(raw: string): { event: string; data: any } {
+  let event = 'message';
+  const data: string[] = [];
+  for (const line of raw.split('\n')) {
+    if (line.startsWith('event:')) event = line.slice(6).trim();
+    else if (line.startsWith('data:')) data.push(line.slice(5).trimStart());
+  }
+  return { event, data: data.length ? JSON.parse(data.join('\n')) : null };
+}
+
+// SSE(/analyze/stream)로 신뢰도 결과를 먼저 받고, 편향 점수는 문단별로 받아 handlers 로 넘긴 뒤 최종 결과를 돌려줍니다.
+// EventSource 는 GET 만 지원하므로 fetch 응답 본문을 직접 읽어 이벤트를 나눕니다.
+export async function analyzeArticleStream(
+  text: string,
+  handlers: StreamHandlers = {},
+  signal?: AbortSignal
+): Promise<AnalysisResult> {
+  const base = import.meta.env.VITE_API_URL
+  const response = await fetch(`${base}/analyze/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify({ text }),
+    signal
+  });
+  if (!response.ok || !response.body) throw new Error('분석 실패');
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  try {
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      // 이벤트는 빈 줄로 구분됩니다.
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary >= 0) {
+        const { event, data } = parseEvent(buffer.slice(0, boundary));
+        buffer = buffer.slice(boundary + 2);
+        if (event === 'trust') handlers.onTrust?.(data.trust_issues);
+        else if (event === 'partial') handlers.onPartial?.(data);
+        else if (event === 'result') return data as AnalysisResult;
+        else if (event === 'error') throw new Error(data?.detail ?? '분석 실패');
+        boundary = buffer.indexOf('\n\n');
+      }
+    }
+  } finally {
+    reader.cancel().catch(() => undefined);
+  }
+  throw new Error('분석 결과를 받지 못했습니다');
+}